@@ -3,6 +3,7 @@ from trempy.Endpoints.Factory.EndpointFactory import EndpointFactory
 from trempy.Loggings.Logging import ReplicationLogger
 from trempy.Shared.Utils import Utils
 from trempy.Tasks.Task import Task
+import os
 
 
 ReplicationLogger.configure_logging()
@@ -14,6 +15,8 @@ with MetadataConnectionManager() as metadata_manager:
     full_load_finished = metadata_manager.get_metadata_config("FULL_LOAD_FINISHED")
 
 
+partition = os.getenv("TREMPY_CONSUMER_PARTITION")
+
 task: Task = Utils.read_task_pickle()
 credentials = Utils.read_credentials()
 
@@ -23,7 +26,7 @@ task.add_endpoint(target_endpoint)
 if current_replication_type == "full_load" and not full_load_finished:
     task.execute_target_full_load()
 if current_replication_type == "cdc":
-    task.execute_target_cdc()
+    task.execute_target_cdc(partition=int(partition) if partition else None)
 
 task.clean_endpoints()  # TODO ver se vale a pena deixar sempre ligado
 
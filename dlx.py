@@ -7,6 +7,6 @@ ReplicationLogger.configure_logging()
 
 task: Task = Utils.read_task_pickle()
 
-consumer_dlx = MessageDlx(task_name=task.task_name)
+consumer_dlx = MessageDlx(task_name=task.task_name, transport=task.transport)
 
 consumer_dlx.start_consuming()
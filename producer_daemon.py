@@ -0,0 +1,87 @@
+from trempy.Replication.Scheduler.AdaptiveScheduler import AdaptiveScheduler
+from trempy.Endpoints.Factory.EndpointFactory import EndpointFactory
+from trempy.Shared.Types import SchedulingModeType
+from trempy.Loggings.Logging import ReplicationLogger
+from trempy.Shared.Utils import Utils
+from trempy.Tasks.Task import Task
+from time import time
+import os
+
+ReplicationLogger.configure_logging()
+logger = ReplicationLogger()
+
+TASK_PATH = os.path.join("task", "settings.pickle")
+CREDENTIALS_PATH = os.path.join("task", "credentials.json")
+
+
+def get_mtime(path: str) -> float:
+    """Retorna a data de modificação do arquivo (0 se não existir)."""
+    return os.path.getmtime(path) if os.path.exists(path) else 0
+
+
+def create_scheduler(task: Task) -> AdaptiveScheduler | None:
+    """Cria o escalonador adaptativo, se habilitado na tarefa."""
+    if task.scheduling_mode == SchedulingModeType.ADAPTIVE:
+        return AdaptiveScheduler(task.min_interval_seconds, task.max_interval_seconds)
+    return None
+
+
+def load_task(source_endpoint=None) -> Task:
+    """Carrega a tarefa do pickle e associa o endpoint de origem (novo, se não informado)."""
+    task: Task = Utils.read_task_pickle()
+
+    if source_endpoint is None:
+        credentials = Utils.read_credentials()
+        source_endpoint = EndpointFactory.create_endpoint(
+            **credentials.get("source_endpoint")
+        )
+
+    task.add_endpoint(source_endpoint)
+    return task
+
+
+# Producer de longa duração: mantém endpoint de origem, canal do RabbitMQ e a
+# tarefa em memória entre os ciclos, recarregando-os apenas quando o pickle da
+# tarefa ou as credenciais são alterados
+task = load_task()
+scheduler = create_scheduler(task)
+task_mtime = get_mtime(TASK_PATH)
+credentials_mtime = get_mtime(CREDENTIALS_PATH)
+
+logger.info(
+    f"PRODUCER - Daemon iniciado com intervalo de {task.interval_seconds}s"
+)
+
+while True:
+    cycle_start = time()
+
+    if get_mtime(CREDENTIALS_PATH) != credentials_mtime:
+        logger.info("PRODUCER - Credenciais alteradas, recriando endpoint de origem")
+        # O endpoint antigo é fechado antes: sua conexão de replicação manteria o
+        # slot ativo e impediria o novo endpoint de usá-lo
+        task.clean_endpoints(close_connections=True)
+        task = load_task()
+        scheduler = create_scheduler(task)
+        task_mtime = get_mtime(TASK_PATH)
+        credentials_mtime = get_mtime(CREDENTIALS_PATH)
+
+    elif get_mtime(TASK_PATH) != task_mtime:
+        logger.info("PRODUCER - Configuração da tarefa alterada, recarregando")
+        source_endpoint = task.source_endpoint
+        task.clean_endpoints()
+        task = load_task(source_endpoint)
+        scheduler = create_scheduler(task)
+        task_mtime = get_mtime(TASK_PATH)
+
+    task.execute_source_cdc()
+
+    # A espera passa pela conexão do producer, que continua respondendo heartbeats
+    if scheduler is not None:
+        task.sleep(
+            scheduler.next_interval(
+                task.last_replication_lag.get("lag_bytes", 0),
+                task.last_captured_changes,
+            )
+        )
+    else:
+        task.sleep(max(task.interval_seconds - (time() - cycle_start), 0))
@@ -9,6 +9,7 @@ from trempy.Endpoints.Databases.PostgreSQL.Subclasses import (
     TableCreator,
 )
 from trempy.Endpoints.Exceptions.Exception import *
+from trempy.Shared.Types import ApplyEngineType, CommitModeType
 from trempy.Tables.Table import Table
 from typing import Dict, List
 import polars as pl
@@ -89,16 +90,36 @@ class EndpointPostgreSQL(Endpoint):
     def capture_changes(self, **kargs) -> pl.DataFrame:
         return self.cdc_manager.capture_changes(**kargs)
 
+    def confirm_changes(self, **kargs) -> None:
+        return self.cdc_manager.confirm_changes(**kargs)
+
+    def keepalive(self) -> None:
+        return self.cdc_manager.keepalive()
+
+    def close(self) -> None:
+        self.cdc_manager.close()
+        self.connection_manager.close()
+
+    def get_current_wal_lsn(self) -> str:
+        return self.cdc_manager.get_current_wal_lsn()
+
+    def get_replication_lag(self, slot_name: str) -> dict:
+        return self.cdc_manager.get_replication_lag(slot_name)
+
     def insert_cdc_into_table(
         self,
         mode: str,
         table: Table,
         create_table_if_not_exists: bool = False,
+        apply_engine: ApplyEngineType = ApplyEngineType.ROW,
+        commit_mode: CommitModeType = CommitModeType.ROW,
     ):
         return self.cdc_operations_handler.insert_cdc_into_table(
             mode=mode,
             table=table,
             create_table_if_not_exists=create_table_if_not_exists,
+            apply_engine=apply_engine,
+            commit_mode=commit_mode,
         )
 
     def structure_capture_changes_to_json(
@@ -1,18 +1,36 @@
 from trempy.Endpoints.Databases.PostgreSQL.Subclasses.ConnectionManager import (
     ConnectionManager,
 )
+from trempy.Endpoints.Databases.PostgreSQL.Subclasses.CDCStreamReader import (
+    CDCStreamReader,
+)
+from trempy.Endpoints.Databases.PostgreSQL.Subclasses.PgOutputDecoder import (
+    PgOutputDecoder,
+)
+from trempy.Endpoints.Databases.PostgreSQL.Subclasses.TestDecodingParser import (
+    TestDecodingParser,
+)
 from trempy.Shared.Queries.QueryPostgreSQL import (
     ReplicationQueries as ReplicationQueriesPostgreSQL,
 )  #  TODO eu preciso saber qual é o tipo de endpoint correto
 from trempy.Loggings.Logging import ReplicationLogger
 from trempy.Endpoints.Exceptions.Exception import *
+from trempy.Shared.Types import (
+    CaptureEngineType,
+    DecoderPluginType,
+    MessageFormatType,
+)
 from trempy.Shared.DataTypes import Datatype
 from trempy.Shared.Utils import Utils
 from trempy.Tables.Table import Table
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any
 from datetime import datetime
+from psycopg2 import sql
 import polars as pl
-import re
+import numpy as np
+import hashlib
+import json
+import os
 
 logger = ReplicationLogger()
 
@@ -20,115 +38,121 @@ logger = ReplicationLogger()
 class CDCManager:
     """Responsabilidade: Gerenciar Change Data Capture (CDC)."""
 
+    FETCH_SIZE = 10000
+    # Estimativa do tamanho serializado (JSON) de uma operação e de cada coluna
+    OPERATION_OVERHEAD_BYTES = 72
+    COLUMN_OVERHEAD_BYTES = 36
+    # Folga na soma dos custos fracionários de batch_size_by_table (ex: 3 x 1/3)
+    BATCH_COST_TOLERANCE = 1e-9
+    # Primo de 64 bits do FNV-1a, base do hash polinomial de __stable_hash
+    HASH_PRIME = 0x100000001B3
+    OPERATIONS_SCHEMA = {
+        name: dtype
+        for name, dtype in TestDecodingParser.OPERATIONS_SCHEMA.items()
+        if name != "tx_seq"
+    }
+    CHANGES_SCHEMA = {"lsn": pl.Utf8, "xid": pl.Int64, "data": pl.Utf8}
+
     def __init__(self, connection_manager: ConnectionManager, batch_cdc_size: int):
         self.connection_manager = connection_manager
         self.batch_cdc_size = batch_cdc_size
-
-    def __process_transaction(self, group: pl.DataFrame) -> Dict[str, Any]:
+        self.stream_reader = CDCStreamReader(connection_manager)
+        self.pgoutput_decoder = PgOutputDecoder(type_resolver=self.__resolve_type_name)
+        self.compact_decode_plans: Dict[str, tuple] = {}
+        self.pending_advance_lsn: Optional[str] = None
+        self.capture_spill_paths: List[str] = []
+
+    @staticmethod
+    def get_publication_name(slot_name: str) -> str:
+        """Retorna o nome da publicação usada pelo pgoutput para o slot informado."""
+        return f"{slot_name}_pub"
+
+    @staticmethod
+    def get_table_ids(task_tables: List[Table]) -> Set[str]:
+        """Retorna o conjunto de identificadores (schema.tabela) das tabelas da tarefa."""
+        return {table.id for table in task_tables or []}
+
+    def __resolve_type_name(self, type_oid: int) -> str:
+        """Resolve o nome de um tipo do PostgreSQL a partir do seu OID."""
+        with self.connection_manager.cursor() as cursor:
+            cursor.execute(ReplicationQueriesPostgreSQL.GET_TYPE_NAME, (type_oid,))
+            return cursor.fetchone()[0]
+
+    def __process_pgoutput_changes(
+        self, df: pl.DataFrame, table_ids: Set[str]
+    ) -> pl.DataFrame:
         """
-        Processa um grupo de transações para extrair operações DML.
+        Decodifica as mensagens pgoutput capturadas em um DataFrame de operações DML.
 
-        Este método percorre as linhas de um DataFrame, interpretando cada linha como parte de uma transação
-        lógica, começando com uma operação "begin" e terminando com uma operação "commit". Durante o percurso,
-        operações DML válidas ("insert", "update", "delete") são coletadas em uma lista de operações.
+        As mensagens são processadas na ordem de captura, pois as mensagens Relation
+        (metadados da tabela, mantidos em cache por OID) precedem as alterações que
+        dependem delas. Tanto o polling quanto o streaming entregam apenas transações
+        completas, portanto as operações são emitidas sem aguardar o COMMIT; isso
+        permite decodificar uma captura gravada em disco parte a parte, mesmo que
+        uma transação atravesse duas partes.
 
         Args:
-            group (pl.DataFrame): DataFrame contendo as linhas de dados a serem processadas.
+            df (pl.DataFrame): DataFrame com a coluna binária data.
+            table_ids (Set[str]): Identificadores schema.tabela a manter.
 
         Returns:
-            Dict[str, Any]: Um dicionário contendo transações processadas, cada uma incluindo suas operações DML.
+            pl.DataFrame: Operações no formato de OPERATIONS_SCHEMA.
         """
 
-        transactions = []
-        current_transaction = None
-
-        for row in group.iter_rows(named=True):
-            data_info = self.__parse_data_line(row["data"])
+        operations = []
+        for data in df.get_column("data"):
+            data_info = self.pgoutput_decoder.decode(data)
 
-            if data_info is None:
+            if data_info is None or data_info["operation"] in ("begin", "commit"):
                 continue
 
-            if data_info["operation"] in ("begin", "commit"):
-                if data_info["operation"] == "begin":
-                    current_transaction = {"operations": []}
-                elif data_info["operation"] == "commit" and current_transaction:
-                    transactions.append(current_transaction)
-                    current_transaction = None
-            else:
-                if current_transaction is not None:
-                    # Filtra apenas operações DML válidas
-                    if data_info["operation"] in ("insert", "update", "delete"):
-                        current_transaction["operations"].append(data_info)
-
-        return transactions
-
-    def __parse_data_line(self, line: str) -> Dict[str, Any]:
-        """
-        Analisa uma linha do log de mudanças e extrai as informações sobre a operação DML
-
-        Args:
-            line (str): Linha do log de mudanças
-
-        Returns:
-            Dict[str, Any]: Dicionário com as informações sobre a operação DML
-        """
-
-        if line.startswith(("BEGIN", "COMMIT")):
-            return {"operation": line.split()[0].lower()}
-
-        # Extrai informações da operação DML
-        pattern = r"table\s+([^.]+)\.([^:]+):\s+(INSERT|UPDATE|DELETE):\s+(.+)"
-        match = re.match(pattern, line)
-        if not match:
-            return None
-
-        schema_name, table_name, operation, rest = match.groups()
-
-        result = {
-            "schema_name": schema_name,
-            "table_name": table_name,
-            "operation": operation.lower(),
-            "columns": [],
-        }
-
-        if operation.upper() == "DELETE" and rest.strip() == "(no-tuple-data)":
-            return result
-
-        # Parseia as colunas e valores
-        if operation.upper() in ("INSERT", "UPDATE", "DELETE"):
-            column_pattern = (
-                r"([^\s\[]+)\[([^\]]+)\]:([^'\s]*(?:'[^']*'[^'\s]*)*)(?=\s|$)"
-            )
-            columns = re.findall(column_pattern, rest)
-            for col_name, col_type, col_value in columns:
-                # Remove aspas extras do valor se existirem
-                if col_value.startswith("'") and col_value.endswith("'"):
-                    col_value = col_value[1:-1]
-                # Identificando valor nulo
-                if col_value == "null":
-                    col_value = None
-                result["columns"].append(
-                    {"name": col_name, "type": col_type, "value": col_value}
-                )
-
-        return result
-
-    def capture_changes(self, slot_name: str, database_type: str) -> pl.DataFrame:
+            if f"{data_info['schema_name']}.{data_info['table_name']}" in table_ids:
+                operations.append(data_info)
+
+        return pl.DataFrame(operations, schema=self.OPERATIONS_SCHEMA)
+
+    def __parse_changes(
+        self,
+        df_changes_captured: pl.DataFrame,
+        decoder_plugin: DecoderPluginType,
+        table_ids: Set[str],
+        decode_workers: int = 1,
+    ) -> pl.DataFrame:
+        """Converte as linhas capturadas do slot em operações DML das tabelas da tarefa."""
+
+        if decoder_plugin == DecoderPluginType.PGOUTPUT:
+            return self.__process_pgoutput_changes(df_changes_captured, table_ids)
+
+        return TestDecodingParser.parse_sharded(
+            TestDecodingParser.filter_tables(df_changes_captured, table_ids),
+            decode_workers,
+        ).drop("tx_seq")
+
+    def __spill_frames(self, frames: List[pl.DataFrame], spill_dir: str) -> None:
+        """Grava em parquet uma parte da captura e registra o arquivo em capture_spill_paths."""
+
+        os.makedirs(spill_dir, exist_ok=True)
+        spill_path = os.path.join(
+            spill_dir, f"capture_{len(self.capture_spill_paths):06d}.parquet"
+        )
+        pl.concat(frames, rechunk=True).write_parquet(spill_path)
+        self.capture_spill_paths.append(spill_path)
+
+    def __ensure_replication_slot(
+        self, slot_name: str, decoder_plugin: DecoderPluginType
+    ) -> None:
         """
-        Captura as alterações de dados de um slot de replicação lógico.
+        Garante a existência do slot de replicação informado.
 
-        Este método verifica se existe um slot de replicação com o nome fornecido nos argumentos.
-        Se o slot não existir, ele cria um novo slot de replicação. Em seguida, captura as
-        alterações de dados do slot de replicação e retorna como um DataFrame.
+        Remove slots antigos e inativos da mesma tarefa e cria o slot caso ele
+        ainda não exista, utilizando o plugin de decodificação configurado.
 
         Args:
-            - slot_name (str): Nome do slot de replicação.
-
-        Returns:
-            pl.DataFrame: DataFrame contendo as alterações capturadas do slot de replicação.
+            slot_name (str): Nome do slot de replicação.
+            decoder_plugin (DecoderPluginType): Plugin de decodificação do slot.
 
         Raises:
-            CaptureChangesError: Se ocorrer um erro ao criar ou ler o slot de replicação.
+            CaptureChangesError: Se ocorrer um erro ao criar o slot de replicação.
         """
 
         try:
@@ -147,6 +171,13 @@ class CDCManager:
                             ReplicationQueriesPostgreSQL.DROP_REPLICATION_SLOT,
                             (old_replication_slot,),
                         )
+                        cursor.execute(
+                            sql.SQL(ReplicationQueriesPostgreSQL.DROP_PUBLICATION).format(
+                                publication=sql.Identifier(
+                                    self.get_publication_name(old_replication_slot)
+                                )
+                            )
+                        )
 
                 cursor.execute(
                     ReplicationQueriesPostgreSQL.VERIFY_IF_EXISTS_A_REPLICATION_SLOT,
@@ -163,28 +194,856 @@ class CDCManager:
                     )
                     cursor.execute(
                         ReplicationQueriesPostgreSQL.CREATE_REPLICATION_SLOT,
+                        (slot_name, decoder_plugin.value),
+                    )
+                else:
+                    cursor.execute(
+                        ReplicationQueriesPostgreSQL.GET_REPLICATION_SLOT_PLUGIN,
                         (slot_name,),
                     )
+                    slot_plugin = cursor.fetchone()[0]
+                    if slot_plugin != decoder_plugin.value:
+                        raise ValueError(
+                            f"slot criado com o plugin {slot_plugin}, mas a tarefa utiliza {decoder_plugin.value}"
+                        )
+
+            self.connection_manager.commit()
         except Exception as e:
             e = CaptureChangesError(f"Erro ao criar slot de replicação: {e}", slot_name)
             logger.critical(e, required_types=["cdc"])
 
+    def __ensure_publication(self, slot_name: str, task_tables: List[Table]) -> None:
+        """
+        Garante a existência da publicação utilizada pelo pgoutput.
+
+        A publicação contém apenas as tabelas da tarefa, de modo que alterações de
+        outras tabelas não são decodificadas pelo servidor. Se a publicação já existir
+        com outro conjunto de tabelas, ela é sincronizada com as tabelas da tarefa.
+
+        Args:
+            slot_name (str): Nome do slot de replicação.
+            task_tables (List[Table]): Tabelas da tarefa.
+
+        Raises:
+            CaptureChangesError: Se ocorrer um erro ao criar a publicação.
+        """
+
+        publication_name = self.get_publication_name(slot_name)
+        tables = sql.SQL(", ").join(
+            sql.Identifier(table.schema_name, table.table_name) for table in task_tables
+        )
+
         try:
             with self.connection_manager.cursor() as cursor:
-                cursor.execute(ReplicationQueriesPostgreSQL.GET_CHANGES, (slot_name,))
+                cursor.execute(
+                    ReplicationQueriesPostgreSQL.VERIFY_IF_EXISTS_A_PUBLICATION,
+                    (publication_name,),
+                )
+                if cursor.fetchone()[0]:
+                    cursor.execute(
+                        ReplicationQueriesPostgreSQL.GET_PUBLICATION_TABLES,
+                        (publication_name,),
+                    )
+                    published_tables = {row[0] for row in cursor.fetchall()}
+                    if published_tables == self.get_table_ids(task_tables):
+                        return
+
+                    logger.info(
+                        f"ENDPOINT - Sincronizando tabelas da publicação {publication_name}",
+                        required_types=["cdc"],
+                    )
+                    query = ReplicationQueriesPostgreSQL.SET_PUBLICATION_TABLES
+                else:
+                    logger.info(
+                        f"ENDPOINT - Criando publicação {publication_name}",
+                        required_types=["cdc"],
+                    )
+                    query = ReplicationQueriesPostgreSQL.CREATE_PUBLICATION
+
+                cursor.execute(
+                    sql.SQL(query).format(
+                        publication=sql.Identifier(publication_name), tables=tables
+                    )
+                )
+
+            self.connection_manager.commit()
+        except Exception as e:
+            self.connection_manager.rollback()
+            e = CaptureChangesError(f"Erro ao criar publicação: {e}", slot_name)
+            logger.critical(e, required_types=["cdc"])
+
+    def __get_changes_polling(
+        self,
+        slot_name: str,
+        decoder_plugin: DecoderPluginType,
+        max_changes: int = None,
+        upto_lsn: str = None,
+        task_tables: List[Table] = None,
+        peek: bool = False,
+        spill_threshold: int = None,
+        spill_dir: str = None,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """
+        Lê as alterações do slot via pg_logical_slot_get_changes
+        (ou pg_logical_slot_get_binary_changes para o pgoutput).
+
+        Com peek, a leitura é feita pelas variantes pg_logical_slot_peek_*, que não
+        consomem o slot; o LSN do último COMMIT lido fica em pending_advance_lsn e o
+        slot só avança em confirm_changes.
+
+        A leitura é feita por um cursor do lado do servidor, em lotes de FETCH_SIZE
+        linhas. Com max_changes e/ou upto_lsn a leitura é limitada e o PostgreSQL
+        encerra sempre ao final de uma transação, portanto uma rodada nunca
+        devolve transações incompletas.
+
+        No test_decoding, as linhas DML de tabelas fora da tarefa são descartadas
+        na própria consulta, sem serem transferidas ao produtor; no pgoutput esse
+        filtro é feito pela publicação.
+
+        Com spill_threshold, sempre que spill_threshold linhas estão em memória elas são
+        gravadas em parquet (uma parte por vez, em capture_spill_paths) e a leitura
+        continua; nesse caso é retornado um LazyFrame sobre as partes, interpretadas
+        parte a parte por structure_capture_changes_to_json.
+
+        Args:
+            slot_name (str): Nome do slot de replicação.
+            decoder_plugin (DecoderPluginType): Plugin de decodificação do slot.
+            max_changes (int): Quantidade máxima de alterações por leitura (opcional).
+            upto_lsn (str): LSN limite da leitura (opcional).
+            task_tables (List[Table]): Tabelas da tarefa, usadas no filtro do test_decoding.
+            peek (bool): Se True, lê sem consumir o slot.
+            spill_threshold (int): Quantidade de linhas em memória a partir da qual a
+                captura é gravada em disco (opcional).
+            spill_dir (str): Diretório das partes gravadas em disco.
+
+        Returns:
+            pl.DataFrame | pl.LazyFrame: Alterações capturadas do slot de replicação
+                (LazyFrame quando a captura foi gravada em disco).
+
+        Raises:
+            CaptureChangesError: Se ocorrer um erro ao ler o slot de replicação.
+        """
+
+        try:
+            schema = dict(self.CHANGES_SCHEMA)
+
+            if decoder_plugin == DecoderPluginType.PGOUTPUT:
+                schema["data"] = pl.Binary
+                query = (
+                    ReplicationQueriesPostgreSQL.PEEK_BINARY_CHANGES
+                    if peek
+                    else ReplicationQueriesPostgreSQL.GET_BINARY_CHANGES
+                )
+                params = (
+                    slot_name,
+                    upto_lsn,
+                    max_changes,
+                    self.get_publication_name(slot_name),
+                )
+            else:
+                query = (
+                    ReplicationQueriesPostgreSQL.PEEK_CHANGES
+                    if peek
+                    else ReplicationQueriesPostgreSQL.GET_CHANGES
+                )
+                params = (
+                    slot_name,
+                    upto_lsn,
+                    max_changes,
+                    sorted(self.get_table_ids(task_tables)),
+                )
+
+            frames = []
+            buffered_rows = 0
+            last_lsn = None
+            self.capture_spill_paths = []
+            with self.connection_manager.cursor(name=f"{slot_name}_changes") as cursor:
+                cursor.itersize = self.FETCH_SIZE
+                cursor.execute(query, params)
+
+                while rows := cursor.fetchmany(self.FETCH_SIZE):
+                    if decoder_plugin == DecoderPluginType.PGOUTPUT:
+                        rows = [(lsn, xid, bytes(payload)) for lsn, xid, payload in rows]
+                    frames.append(
+                        pl.DataFrame(rows, schema=schema, orient="row")
+                    )
+                    buffered_rows += len(rows)
+                    last_lsn = rows[-1][0]
+
+                    if spill_threshold and buffered_rows >= spill_threshold:
+                        self.__spill_frames(frames, spill_dir)
+                        frames, buffered_rows = [], 0
+
+            self.connection_manager.commit()
 
-                data = cursor.fetchall()
+            # A leitura termina sempre em um COMMIT, cujo lsn é o fim da transação
+            if peek and last_lsn is not None:
+                self.pending_advance_lsn = last_lsn
 
-                df = pl.DataFrame(
-                    data, schema=[desc[0] for desc in cursor.description], orient="row"
+            if self.capture_spill_paths:
+                if frames:
+                    self.__spill_frames(frames, spill_dir)
+                logger.info(
+                    f"ENDPOINT - Captura gravada em {len(self.capture_spill_paths)} partes em {spill_dir}",
+                    required_types=["cdc"],
                 )
+                return pl.scan_parquet(self.capture_spill_paths)
 
-            return df
+            if not frames:
+                return pl.DataFrame(schema=schema)
+
+            return pl.concat(frames, rechunk=True)
 
         except Exception as e:
             e = CaptureChangesError(f"Erro ao ler slot de replicação: {e}", slot_name)
             logger.critical(e, required_types=["cdc"])
 
+    def get_current_wal_lsn(self) -> str:
+        """
+        Retorna a posição atual do WAL, usada como limite de uma rodada de captura.
+
+        Returns:
+            str: LSN atual no formato textual do PostgreSQL.
+        """
+
+        with self.connection_manager.cursor() as cursor:
+            cursor.execute(ReplicationQueriesPostgreSQL.GET_CURRENT_WAL_LSN)
+            current_wal_lsn = cursor.fetchone()[0]
+        self.connection_manager.commit()
+
+        return current_wal_lsn
+
+    def get_replication_lag(self, slot_name: str) -> Dict[str, int]:
+        """
+        Retorna o lag do slot de replicação em relação à posição atual do WAL.
+
+        Args:
+            slot_name (str): Nome do slot de replicação.
+
+        Returns:
+            Dict[str, int]: lag_bytes (WAL ainda não confirmado pelo slot),
+                retained_wal_bytes (WAL retido pelo restart_lsn do slot) e
+                confirmed_flush_bytes (posição confirmada do slot, em bytes). Vazio se
+                o slot ainda não existe.
+        """
+
+        with self.connection_manager.cursor() as cursor:
+            cursor.execute(ReplicationQueriesPostgreSQL.GET_REPLICATION_LAG, (slot_name,))
+            row = cursor.fetchone()
+        self.connection_manager.commit()
+
+        if row is None:
+            return {}
+
+        return {
+            "lag_bytes": row[0] or 0,
+            "retained_wal_bytes": row[1] or 0,
+            "confirmed_flush_bytes": row[2] or 0,
+        }
+
+    def capture_changes(
+        self,
+        slot_name: str,
+        database_type: str,
+        capture_engine: CaptureEngineType = CaptureEngineType.POLLING,
+        decoder_plugin: DecoderPluginType = DecoderPluginType.TEST_DECODING,
+        stream_max_wait_seconds: float = 1.0,
+        max_changes: int = None,
+        upto_lsn: str = None,
+        task_tables: List[Table] = None,
+        publisher_confirms: bool = False,
+        spill_threshold: int = None,
+        staging_area: str = "",
+        **kargs,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """
+        Captura as alterações de dados de um slot de replicação lógico.
+
+        Este método verifica se existe um slot de replicação com o nome fornecido nos argumentos.
+        Se o slot não existir, ele cria um novo slot de replicação. Em seguida, captura as
+        alterações de dados do slot de replicação e retorna como um DataFrame.
+
+        A captura pode ser feita por polling (pg_logical_slot_get_changes, que consome o slot
+        na leitura) ou por streaming (protocolo de replicação, com confirmação do LSN feita
+        em confirm_changes após a publicação). Com publisher_confirms, o polling lê sem
+        consumir o slot e o avanço também fica a cargo de confirm_changes.
+
+        Args:
+            - slot_name (str): Nome do slot de replicação.
+            - capture_engine (CaptureEngineType): Mecanismo de captura (polling ou streaming).
+            - decoder_plugin (DecoderPluginType): Plugin de decodificação (test_decoding ou pgoutput).
+            - stream_max_wait_seconds (float): Janela máxima de leitura no modo streaming.
+            - max_changes (int): Quantidade máxima de alterações por rodada (opcional).
+            - upto_lsn (str): LSN limite da rodada (opcional).
+            - task_tables (List[Table]): Tabelas da tarefa, usadas na publicação do pgoutput
+                e no filtro do test_decoding.
+            - publisher_confirms (bool): Se True, o slot só avança após a confirmação do broker.
+            - spill_threshold (int): No polling, quantidade de linhas em memória a partir
+                da qual a captura é gravada em disco (opcional). No streaming a memória é
+                limitada por max_changes e pela janela de leitura.
+            - staging_area (str): Diretório base das partes gravadas em disco.
+
+        Returns:
+            pl.DataFrame | pl.LazyFrame: Alterações capturadas do slot de replicação
+                (LazyFrame quando a captura foi gravada em disco).
+
+        Raises:
+            CaptureChangesError: Se ocorrer um erro ao criar ou ler o slot de replicação.
+        """
+
+        decoder_plugin = DecoderPluginType(decoder_plugin)
+
+        if self.stream_reader.cursor is None:
+            if decoder_plugin == DecoderPluginType.PGOUTPUT:
+                self.__ensure_publication(slot_name, task_tables or [])
+            self.__ensure_replication_slot(slot_name, decoder_plugin)
+
+        match CaptureEngineType(capture_engine):
+            case CaptureEngineType.STREAMING:
+                options = None
+                if decoder_plugin == DecoderPluginType.PGOUTPUT:
+                    options = {
+                        "proto_version": "1",
+                        "publication_names": self.get_publication_name(slot_name),
+                    }
+                return self.stream_reader.read_changes(
+                    slot_name,
+                    max_wait_seconds=stream_max_wait_seconds,
+                    max_changes=max_changes,
+                    upto_lsn=upto_lsn,
+                    options=options,
+                    binary=decoder_plugin == DecoderPluginType.PGOUTPUT,
+                )
+            case _:
+                return self.__get_changes_polling(
+                    slot_name,
+                    decoder_plugin,
+                    max_changes,
+                    upto_lsn,
+                    task_tables,
+                    peek=publisher_confirms,
+                    spill_threshold=spill_threshold,
+                    spill_dir=os.path.join(staging_area, f"cdc_spill_{slot_name}"),
+                )
+
+    def close(self) -> None:
+        """Encerra o stream de replicação, se houver (ver CDCStreamReader.close)."""
+        self.stream_reader.close()
+
+    def keepalive(self) -> None:
+        """Mantém ativo o stream de replicação entre as leituras (ver CDCStreamReader.keepalive)."""
+
+        try:
+            self.stream_reader.keepalive()
+        except Exception as e:
+            e = CaptureChangesError(
+                f"Erro ao enviar status ao servidor: {e}", self.stream_reader.slot_name
+            )
+            logger.critical(e, required_types=["cdc"])
+
+    def confirm_changes(
+        self,
+        slot_name: str,
+        capture_engine: CaptureEngineType = CaptureEngineType.POLLING,
+        **kargs,
+    ) -> None:
+        """
+        Confirma ao slot que as alterações capturadas foram publicadas.
+
+        No modo streaming envia o flush feedback do último COMMIT lido. No modo
+        polling avança o slot até pending_advance_lsn (leitura com peek); sem peek
+        não há o que confirmar, pois a leitura já consome o slot.
+
+        Args:
+            slot_name (str): Nome do slot de replicação.
+            capture_engine (CaptureEngineType): Mecanismo de captura utilizado.
+
+        Raises:
+            CaptureChangesError: Se ocorrer um erro ao confirmar o LSN.
+        """
+
+        try:
+            if CaptureEngineType(capture_engine) == CaptureEngineType.STREAMING:
+                self.stream_reader.confirm()
+                return
+
+            if self.pending_advance_lsn is None:
+                return
+
+            with self.connection_manager.cursor() as cursor:
+                cursor.execute(
+                    ReplicationQueriesPostgreSQL.ADVANCE_REPLICATION_SLOT,
+                    (slot_name, self.pending_advance_lsn),
+                )
+            self.connection_manager.commit()
+            self.pending_advance_lsn = None
+        except Exception as e:
+            self.connection_manager.rollback()
+            e = CaptureChangesError(f"Erro ao confirmar LSN do slot: {e}", slot_name)
+            logger.critical(e, required_types=["cdc"])
+
+    def __pivot_operations(
+        self, df_operations: pl.DataFrame
+    ) -> Dict[str, Tuple[pl.DataFrame, Dict[str, str]]]:
+        """
+        Agrupa um lote de operações por tabela, com uma coluna por coluna da tabela.
+
+        Args:
+            df_operations (pl.DataFrame): Operações com schema_name, table_name,
+                operation e columns (lista de structs name/type/value).
+
+        Returns:
+            Dict[str, Tuple[pl.DataFrame, Dict[str, str]]]: Por schema_name.table_name,
+                o DataFrame textual ($TREM_ROWNUM, $TREM_OPERATION e as colunas da
+                tabela) e o tipo de cada coluna.
+        """
+
+        df_operations = (
+            df_operations.with_row_index("$TREM_ROWNUM")
+            .with_columns(
+                pl.col("$TREM_ROWNUM").cast(pl.Int64),
+                pl.col("operation").str.to_uppercase().alias("$TREM_OPERATION"),
+            )
+            # Pular DELETE com colunas vazias
+            .filter(
+                (pl.col("$TREM_OPERATION") != "DELETE")
+                | (pl.col("columns").list.len() > 0)
+            )
+        )
+
+        result = dict()
+        for (schema_name, table_name), df_table in df_operations.partition_by(
+            ["schema_name", "table_name"], as_dict=True, maintain_order=True
+        ).items():
+            df_columns = (
+                df_table.select("$TREM_ROWNUM", "$TREM_OPERATION", "columns")
+                .explode("columns")
+                .unnest("columns")
+                .filter(pl.col("name").is_not_null())
+            )
+
+            column_types = dict(
+                df_columns.unique("name", keep="first", maintain_order=True)
+                .select("name", "type")
+                .iter_rows()
+            )
+
+            df = (
+                df_table.select("$TREM_ROWNUM", "$TREM_OPERATION")
+                .join(
+                    df_columns.pivot(
+                        on="name",
+                        index="$TREM_ROWNUM",
+                        values="value",
+                        aggregate_function="first",
+                    ),
+                    on="$TREM_ROWNUM",
+                    how="left",
+                )
+                .select(["$TREM_ROWNUM", "$TREM_OPERATION"] + list(column_types))
+            )
+
+            result[f"{schema_name}.{table_name}"] = (df, column_types)
+
+        return result
+
+    @staticmethod
+    def __convert_types(df: pl.DataFrame, column_types: Dict[str, str]) -> pl.DataFrame:
+        """Converte as colunas textuais de uma tabela para os tipos do Polars."""
+        return df.with_columns(
+            Datatype.DatatypePostgreSQL.convert_expression(name, col_type)
+            for name, col_type in column_types.items()
+        )
+
+    def structure_operations_to_tables(
+        self, df_operations: pl.DataFrame
+    ) -> Dict[str, pl.DataFrame]:
+        """
+        Converte um lote de operações em DataFrames tipados por tabela, no mesmo formato
+        de structure_capture_changes_to_dataframe, usando apenas expressões do Polars.
+
+        Args:
+            df_operations (pl.DataFrame): Operações com schema_name, table_name,
+                operation e columns (lista de structs name/type/value).
+
+        Returns:
+            Dict[str, pl.DataFrame]: DataFrames com as colunas $TREM_ROWNUM,
+                $TREM_OPERATION e as colunas da tabela, por schema_name.table_name.
+        """
+
+        return {
+            table_id: self.__convert_types(df, column_types)
+            for table_id, (df, column_types) in self.__pivot_operations(
+                df_operations
+            ).items()
+        }
+
+    def structure_operations_to_compact(
+        self, df_operations: pl.DataFrame, pk_by_table: Dict[str, List[str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Converte um lote de operações no enquadramento compacto: um cabeçalho por
+        tabela (colunas, tipos, PK e fingerprint) seguido das linhas posicionais
+        [$TREM_ROWNUM, $TREM_OPERATION, valor1, valor2, ...].
+
+        Args:
+            df_operations (pl.DataFrame): Operações do lote.
+            pk_by_table (Dict[str, List[str]]): Colunas da PK por schema_name.table_name.
+
+        Returns:
+            List[Dict[str, Any]]: Lista com header e rows de cada tabela.
+        """
+
+        tables = []
+        for table_id, (df, column_types) in self.__pivot_operations(
+            df_operations
+        ).items():
+            header = {
+                "table": table_id,
+                "columns": list(column_types),
+                "types": list(column_types.values()),
+                "pk": pk_by_table.get(table_id, []),
+            }
+            header["fingerprint"] = hashlib.sha1(
+                json.dumps(header, sort_keys=True).encode()
+            ).hexdigest()[:16]
+
+            tables.append({"header": header, "rows": df.rows()})
+
+        return tables
+
+    def __structure_compact_to_dataframe(
+        self, tables: List[Dict[str, Any]]
+    ) -> Dict[str, pl.DataFrame]:
+        """
+        Converte as tabelas do enquadramento compacto em DataFrames tipados.
+
+        O plano de decodificação (schema e conversões) é mantido em cache pelo
+        fingerprint do cabeçalho, sendo montado apenas uma vez por estrutura de tabela.
+        """
+
+        result = dict()
+        for table in tables:
+            header = table["header"]
+            plan = self.compact_decode_plans.get(header["fingerprint"])
+
+            if plan is None:
+                schema = {"$TREM_ROWNUM": pl.Int64, "$TREM_OPERATION": pl.Utf8}
+                schema.update({name: pl.Utf8 for name in header["columns"]})
+                conversions = [
+                    Datatype.DatatypePostgreSQL.convert_expression(name, col_type)
+                    for name, col_type in zip(header["columns"], header["types"])
+                ]
+                plan = (schema, conversions)
+                self.compact_decode_plans[header["fingerprint"]] = plan
+
+            schema, conversions = plan
+            result[header["table"]] = pl.DataFrame(
+                table["rows"], schema=schema, orient="row"
+            ).with_columns(conversions)
+
+        return result
+
+    @staticmethod
+    def __stable_hash(keys: pl.Series) -> np.ndarray:
+        """
+        Calcula um hash polinomial de 64 bits dos bytes UTF-8 de cada chave.
+
+        O cálculo é vetorizado com NumPy sobre os buffers Arrow da coluna (offsets e
+        bytes) e depende apenas dos bytes da chave, sendo portanto estável entre
+        versões do Polars e do Python (ao contrário de Expr.hash).
+
+        Args:
+            keys (pl.Series): Chaves (texto, sem nulos).
+
+        Returns:
+            np.ndarray: Hash de cada chave (uint64).
+        """
+
+        array = keys.rechunk().to_arrow(compat_level=pl.CompatLevel.oldest())
+        _, offsets_buffer, data_buffer = array.buffers()
+        offsets = np.frombuffer(offsets_buffer, dtype=np.int64)[
+            array.offset : array.offset + len(array) + 1
+        ]
+        data = (
+            np.frombuffer(data_buffer, dtype=np.uint8)[offsets[0] : offsets[-1]]
+            if data_buffer is not None
+            else np.empty(0, dtype=np.uint8)
+        )
+        starts = offsets[:-1] - offsets[0]
+        lengths = offsets[1:] - offsets[:-1]
+
+        # Potências de HASH_PRIME (mod 2^64) pela posição de cada byte na sua chave
+        powers = np.ones(max(int(lengths.max(initial=0)), 1), dtype=np.uint64)
+        powers[1:] = np.cumprod(
+            np.full(powers.size - 1, CDCManager.HASH_PRIME, dtype=np.uint64)
+        )
+        position = np.arange(data.size) - np.repeat(starts, lengths)
+        weighted = (data.astype(np.uint64) + np.uint64(1)) * powers[position]
+
+        prefix = np.concatenate(
+            (np.zeros(1, dtype=np.uint64), np.cumsum(weighted, dtype=np.uint64))
+        )
+        hashes = prefix[starts + lengths] - prefix[starts]
+
+        # Finalizador do MurmurHash3: espalha os bits antes do módulo
+        hashes ^= hashes >> np.uint64(33)
+        hashes *= np.uint64(0xFF51AFD7ED558CCD)
+        hashes ^= hashes >> np.uint64(33)
+        hashes *= np.uint64(0xC4CEB9FE1A85EC53)
+        hashes ^= hashes >> np.uint64(33)
+        return hashes
+
+    @staticmethod
+    def __assign_partitions(
+        df_operations: pl.DataFrame,
+        pk_by_table: Dict[str, List[str]],
+        partitions: int,
+    ) -> pl.DataFrame:
+        """
+        Atribui a cada operação uma partição pelo hash de (tabela, valores da PK).
+
+        Todas as operações de uma mesma linha caem na mesma partição, preservando a
+        sua ordem. Tabelas sem PK são atribuídas pela tabela apenas. O hash usado
+        (__stable_hash) é vetorizado e estável entre versões do Polars e do Python,
+        para que uma atualização não mude a partição de linhas com operações ainda
+        nas filas.
+
+        Args:
+            df_operations (pl.DataFrame): Operações estruturadas.
+            pk_by_table (Dict[str, List[str]]): Colunas da PK por tabela.
+            partitions (int): Quantidade de partições.
+
+        Returns:
+            pl.DataFrame: Operações com a coluna partition.
+        """
+
+        table_id = pl.concat_str("schema_name", pl.lit("."), "table_name")
+
+        pk_values = pl.lit("")
+        for current_table_id, pk_columns in pk_by_table.items():
+            if not pk_columns:
+                continue
+            pk_values = (
+                pl.when(table_id == current_table_id)
+                .then(
+                    pl.col("columns")
+                    .list.eval(
+                        pl.element()
+                        .filter(pl.element().struct.field("name").is_in(pk_columns))
+                        .struct.field("value")
+                    )
+                    .list.join("|")
+                )
+                .otherwise(pk_values)
+            )
+
+        keys = df_operations.select(
+            pl.concat_str(table_id, pl.lit("|"), pk_values).fill_null("")
+        ).to_series()
+
+        return df_operations.with_columns(
+            pl.Series(
+                "partition",
+                CDCManager.__stable_hash(keys) % np.uint64(partitions),
+            ).cast(pl.UInt32)
+        )
+
+    def __assign_batches(
+        self,
+        df_operations: pl.DataFrame,
+        batch_max_bytes: int = None,
+        batch_size_by_table: Dict[str, int] = None,
+    ) -> pl.DataFrame:
+        """
+        Atribui a cada operação o lote (coluna batch_id) em que será publicada.
+
+        Cada operação tem um custo em quantidade (1, ou batch_cdc_size dividido pelo
+        tamanho de lote da sua tabela) e um tamanho estimado em bytes. Os lotes são
+        formados de forma gulosa: um lote é fechado quando a próxima operação faria
+        o custo acumulado passar de batch_cdc_size ou o tamanho acumulado passar de
+        batch_max_bytes, e os dois acumuladores recomeçam no novo lote. Assim cada
+        lote respeita os dois limites (uma operação maior que o limite forma um lote
+        sozinha). Com partições, o acúmulo é feito por partição.
+
+        Args:
+            df_operations (pl.DataFrame): Operações estruturadas.
+            batch_max_bytes (int): Tamanho máximo estimado de um lote (opcional).
+            batch_size_by_table (Dict[str, int]): Tamanho de lote por tabela
+                (schema.tabela), em operações (opcional).
+
+        Returns:
+            pl.DataFrame: Operações com a coluna batch_id.
+        """
+
+        table_id = pl.concat_str("schema_name", pl.lit("."), "table_name")
+        over = ["partition"] if "partition" in df_operations.columns else None
+
+        cost = pl.lit(1.0)
+        for current_table_id, table_batch_size in (batch_size_by_table or {}).items():
+            cost = (
+                pl.when(table_id == current_table_id)
+                .then(pl.lit(self.batch_cdc_size / max(table_batch_size, 1)))
+                .otherwise(cost)
+            )
+
+        element = pl.element().struct
+        size = (
+            pl.col("columns")
+            .list.eval(
+                element.field("name").str.len_bytes()
+                + element.field("type").str.len_bytes()
+                + element.field("value").str.len_bytes().fill_null(4)
+                + self.COLUMN_OVERHEAD_BYTES
+            )
+            .list.sum()
+            + pl.col("schema_name").str.len_bytes()
+            + pl.col("table_name").str.len_bytes()
+            + self.OPERATION_OVERHEAD_BYTES
+        )
+
+        df_weights = df_operations.select(
+            (pl.col("partition") if over else pl.lit(0)).alias("partition"),
+            cost.cast(pl.Float64).alias("batch_cost"),
+            size.cast(pl.Float64).alias("batch_bytes"),
+        )
+
+        # O fechamento de um lote depende dos acumuladores do lote anterior, então
+        # o acúmulo é sequencial; por partição: [batch_id, custo, bytes]
+        max_cost = self.batch_cdc_size + self.BATCH_COST_TOLERANCE
+        max_bytes = batch_max_bytes or float("inf")
+        state: Dict[int, List[float]] = {}
+        batch_ids = []
+        for partition, batch_cost, batch_bytes in df_weights.iter_rows():
+            current = state.setdefault(partition, [0, 0.0, 0.0])
+            if (current[1] or current[2]) and (
+                current[1] + batch_cost > max_cost
+                or current[2] + batch_bytes > max_bytes
+            ):
+                current[0] += 1
+                current[1] = current[2] = 0.0
+            current[1] += batch_cost
+            current[2] += batch_bytes
+            batch_ids.append(current[0])
+
+        return df_operations.with_columns(
+            pl.Series("batch_id", batch_ids, dtype=pl.UInt32)
+        )
+
+    @staticmethod
+    def __partition_frames(
+        df_operations: pl.DataFrame, partitions: int
+    ) -> Dict[Optional[int], pl.DataFrame]:
+        """
+        Separa as operações por partição (coluna partition), na ordem de captura
+        dentro de cada uma. Sem partições, retorna as operações sob a chave None.
+        """
+
+        if partitions <= 1:
+            return {None: df_operations}
+
+        df_sorted = df_operations.sort("partition", maintain_order=True)
+        frames = {}
+        offset = 0
+        for partition, size in (
+            df_sorted.group_by("partition").len().sort("partition").rows()
+        ):
+            frames[partition] = df_sorted.slice(offset, size).drop("partition")
+            offset += size
+        return frames
+
+    def __iter_batches(
+        self,
+        sources: List[Tuple[Optional[int], Iterable[pl.DataFrame]]],
+        spill_paths: List[str] = None,
+        message_format: MessageFormatType = MessageFormatType.JSON,
+        pk_by_table: Dict[str, List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Gera os lotes de operações sob demanda, com até batch_cdc_size operações cada
+        ou, quando há a coluna batch_id (ver __assign_batches), um lote por batch_id.
+
+        Os lotes são gerados partição a partição, na ordem de captura dentro de
+        cada uma. Cada partição é uma sequência de partes: em memória, uma única
+        parte; quando a captura foi gravada em disco, os arquivos da partição, lidos
+        um por vez (os lotes não atravessam partes). Apenas um lote por vez é
+        convertido em dicionários, e os arquivos são removidos ao final da geração.
+
+        Args:
+            sources (List[Tuple[Optional[int], Iterable[pl.DataFrame]]]): Partição (ou
+                None, sem partições) e suas partes de operações, na ordem de publicação.
+            spill_paths (List[str]): Arquivos parquet a serem removidos ao final (opcional).
+            message_format (MessageFormatType): Formato da mensagem; no formato Arrow o
+                lote carrega DataFrames tipados por tabela em vez de operations; no
+                formato compacto, cabeçalhos por tabela e linhas posicionais.
+            pk_by_table (Dict[str, List[str]]): Colunas da PK por tabela (formato compacto).
+
+        Yields:
+            Dict[str, Any]: Lote com batch_page, batch_size e operations (ou tables,
+                ou compact_tables), e partition quando há mais de uma partição.
+        """
+
+        try:
+            batch_page = 0
+            for partition, frames in sources:
+                for df_source in frames:
+                    if "batch_id" in df_source.columns:
+                        # batch_id é crescente na ordem de captura da partição,
+                        # então cada lote é uma fatia contígua
+                        batch_sizes = (
+                            df_source.group_by("batch_id", maintain_order=True)
+                            .len()
+                            .get_column("len")
+                            .to_list()
+                        )
+                        df_source = df_source.drop("batch_id")
+                    else:
+                        batch_sizes = [self.batch_cdc_size] * -(
+                            -df_source.height // self.batch_cdc_size
+                        )
+
+                    batch_index_start = 0
+                    for batch_size in batch_sizes:
+                        df_batch = df_source.slice(batch_index_start, batch_size)
+                        yield self.__build_batch(
+                            df_batch,
+                            batch_page,
+                            partition,
+                            message_format,
+                            pk_by_table,
+                        )
+                        batch_index_start += batch_size
+                        batch_page += 1
+        finally:
+            for spill_path in spill_paths or []:
+                if os.path.exists(spill_path):
+                    os.remove(spill_path)
+
+    def __build_batch(
+        self,
+        df_batch: pl.DataFrame,
+        batch_page: int,
+        partition: int = None,
+        message_format: MessageFormatType = MessageFormatType.JSON,
+        pk_by_table: Dict[str, List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Converte um lote de operações no formato de mensagem configurado."""
+
+        batch = {"batch_page": batch_page, "batch_size": df_batch.height}
+        if partition is not None:
+            batch["partition"] = partition
+
+        if message_format == MessageFormatType.ARROW:
+            batch["tables"] = self.structure_operations_to_tables(df_batch)
+        elif message_format == MessageFormatType.COMPACT_JSON:
+            batch["compact_tables"] = self.structure_operations_to_compact(
+                df_batch, pk_by_table or {}
+            )
+        else:
+            batch["operations"] = df_batch.to_dicts()
+
+        return batch
+
     def structure_capture_changes_to_json(
         self, df_changes_captured: pl.DataFrame, task_tables: List[Table], **kargs
     ) -> Dict:
@@ -196,6 +1055,11 @@ class CDCManager:
             df_changes_captured (pl.DataFrame): DataFrame com as mudanças capturadas
             task_tables (List[Table]): Lista com as tabelas que devem ser processadas
 
+        Os lotes em "changes" são gerados sob demanda. Quando a captura foi gravada em
+        disco (spill_threshold, ver __get_changes_polling), cada parte é interpretada e
+        regravada como operações em parquet, uma por vez, e os lotes são lidos das
+        partes durante a publicação, mantendo a memória do producer limitada.
+
         Returns:
             Dict: Dicionário com as alterações de cada tabela
 
@@ -206,70 +1070,124 @@ class CDCManager:
         try:
             source_database_type = kargs.get("database_type")
 
-            df_changes_captured = df_changes_captured.sort("lsn")
-
             created_at = int(datetime.now().timestamp())
             id = Utils.hash_6_chars()
 
-            changes_structured = []
-            for xid, group in df_changes_captured.sort("xid").group_by("xid"):
-                transactions = self.__process_transaction(group)
-                changes_structured.extend(transactions)
-
-            filtered_changes_structured = []
-            if changes_structured:
-                for operations in changes_structured:
-                    for row in operations.get("operations"):
-                        schema_name = row.get("schema_name")
-                        table_name = row.get("table_name")
-                        idx = f"{schema_name}.{table_name}"
-
-                        table_ok = (
-                            True
-                            if idx in [table.id for table in task_tables]
-                            else False
-                        )
+            decoder_plugin = DecoderPluginType(
+                kargs.get("decoder_plugin", DecoderPluginType.TEST_DECODING)
+            )
+            table_ids = self.get_table_ids(task_tables)
+            message_format = MessageFormatType(
+                kargs.get("message_format", MessageFormatType.JSON)
+            )
+            pk_by_table = {
+                table.id: table.get_pk_columns_without_scd2_columns()
+                for table in task_tables
+            }
+            partitions = kargs.get("partitions") or 1
+            decode_workers = kargs.get("decode_workers") or 1
+
+            def prepare(df_operations: pl.DataFrame) -> pl.DataFrame:
+                if partitions > 1:
+                    df_operations = self.__assign_partitions(
+                        df_operations, pk_by_table, partitions
+                    )
+                if kargs.get("batch_max_bytes") or kargs.get("batch_size_by_table"):
+                    df_operations = self.__assign_batches(
+                        df_operations,
+                        kargs.get("batch_max_bytes"),
+                        kargs.get("batch_size_by_table"),
+                    )
+                return df_operations
+
+            spill_paths = []
+            if isinstance(df_changes_captured, pl.LazyFrame):
+                # Captura gravada em disco (ver __get_changes_polling): cada parte é
+                # interpretada e regravada como operações, uma por vez
+                qtd_changes = 0
+                batch_offset = 0
+                paths_by_partition: Dict[Optional[int], List[str]] = {}
+                for capture_path in self.capture_spill_paths:
+                    df_captured = pl.read_parquet(capture_path)
+                    if decoder_plugin == DecoderPluginType.TEST_DECODING:
+                        df_captured = TestDecodingParser.close_transactions(df_captured)
+                    df_operations = self.__parse_changes(
+                        df_captured, decoder_plugin, table_ids, decode_workers
+                    )
+                    del df_captured
+                    os.remove(capture_path)
 
-                        if table_ok:
-                            filtered_changes_structured.append(row)
-
-            if filtered_changes_structured:
-                qtd_changes = len(filtered_changes_structured)
-                json_changes_structured = {
-                    "source_database_type": source_database_type,
-                    "qtd_changes": qtd_changes,
-                    "transaction_id": id,
-                    "created_at": created_at,
-                    "changes": [],
-                }
+                    if df_operations.is_empty():
+                        continue
 
-                batch_page = 0
-                batch_index_start = 0
-                batch_index_end = 0
-
-                while True:
-                    batch_index_end = batch_index_start + self.batch_cdc_size
-                    batch_changes_structured = filtered_changes_structured[
-                        batch_index_start:batch_index_end
-                    ]
-
-                    if not batch_changes_structured:
-                        break
-
-                    json_changes_structured["changes"].append(
-                        {
-                            "batch_page": batch_page,
-                            "batch_size": len(batch_changes_structured),
-                            "operations": batch_changes_structured,
-                        }
+                    # batch_id é reiniciado em cada parte; o deslocamento o mantém único
+                    df_operations = prepare(df_operations)
+                    if "batch_id" in df_operations.columns:
+                        df_operations = df_operations.with_columns(
+                            pl.col("batch_id") + batch_offset
+                        )
+                        batch_offset = df_operations.get_column("batch_id").max() + 1
+
+                    # Uma parte por partição: cada partição é lida depois só dos
+                    # seus arquivos, sem varrer as partes das demais
+                    for partition, df_partition in self.__partition_frames(
+                        df_operations, partitions
+                    ).items():
+                        prefix = f"operations_{id}_"
+                        if partition is not None:
+                            prefix += f"p{partition:04d}_"
+                        spill_path = capture_path.replace("capture_", prefix)
+                        df_partition.write_parquet(spill_path)
+                        spill_paths.append(spill_path)
+                        paths_by_partition.setdefault(partition, []).append(spill_path)
+                    qtd_changes += df_operations.height
+
+                self.capture_spill_paths = []
+                del df_operations
+
+                if not spill_paths:
+                    return []
+
+                logger.info(
+                    f"ENDPOINT - {qtd_changes} alterações gravadas em {len(spill_paths)} partes",
+                    required_types=["cdc"],
+                )
+                sources = [
+                    (partition, (pl.read_parquet(path) for path in paths))
+                    for partition, paths in sorted(
+                        paths_by_partition.items(), key=lambda item: item[0] or 0
                     )
+                ]
 
-                    batch_page += 1
-                    batch_index_start = batch_index_end
-
-                return json_changes_structured
+            else:
+                df_operations = self.__parse_changes(
+                    df_changes_captured, decoder_plugin, table_ids, decode_workers
+                )
+                if df_operations.is_empty():
+                    return []
+
+                qtd_changes = df_operations.height
+                sources = [
+                    (partition, [df_partition])
+                    for partition, df_partition in self.__partition_frames(
+                        prepare(df_operations), partitions
+                    ).items()
+                ]
+
+            changes = self.__iter_batches(
+                sources,
+                spill_paths,
+                message_format=message_format,
+                pk_by_table=pk_by_table,
+            )
 
-            return []
+            return {
+                "source_database_type": source_database_type,
+                "qtd_changes": qtd_changes,
+                "transaction_id": id,
+                "created_at": created_at,
+                "changes": changes,
+            }
 
         except Exception as e:
             e = StructureCaptureChangesToJsonError(
@@ -293,6 +1211,15 @@ class CDCManager:
         """
 
         try:
+            # Mensagens Arrow já trazem os DataFrames tipados por tabela
+            if "tables" in changes_structured:
+                return changes_structured["tables"]
+
+            if "compact_tables" in changes_structured:
+                return self.__structure_compact_to_dataframe(
+                    changes_structured["compact_tables"]
+                )
+
             tables_data = {}
 
             for op_index, operation in enumerate(
@@ -9,12 +9,20 @@ from trempy.Shared.Queries.QueryPostgreSQL import (
     SCD2Queries as SCD2QueriesPostgreSQL,
     CDCQueries as CDCQueriesPostgreSQL,
 )  #  TODO eu preciso saber qual é o tipo de endpoint correto
-from trempy.Shared.Types import CdcModeType, SCD2ColumnType
+from trempy.Shared.Types import (
+    ApplyEngineType,
+    CdcModeType,
+    CommitModeType,
+    SCD2ColumnType,
+)
 from psycopg2 import sql, extensions
+from psycopg2.extras import execute_batch, execute_values
 from trempy.Loggings.Logging import ReplicationLogger
 from trempy.Endpoints.Exceptions.Exception import *
 from trempy.Tables.Table import Table
 from typing import Dict, List
+import polars as pl
+import io
 
 
 logger = ReplicationLogger()
@@ -29,6 +37,13 @@ class CDCOperationsHandler:
     STOP_IF_UPSERT_ERROR = 0
     STOP_IF_SCD2_ERROR = 0
 
+    GROUPED_PAGE_SIZE = 1000
+    MERGE_MIN_SERVER_VERSION = 150000
+    ROW_SAVEPOINT = "trem_row"
+    RUN_SAVEPOINT = "trem_run"
+
+    OPERATION_STATS_KEYS = {"INSERT": "inserts", "UPDATE": "updates", "DELETE": "deletes"}
+
     def __init__(
         self,
         connection_manager: ConnectionManager,
@@ -36,6 +51,7 @@ class CDCOperationsHandler:
     ):
         self.connection_manager = connection_manager
         self.table_manager = table_manager
+        self.commit_mode = CommitModeType.ROW
         self._load_error_configurations()
 
     from psycopg2 import InterfaceError, Error
@@ -85,10 +101,50 @@ class CDCOperationsHandler:
         )
         return error_info
 
+    def __execute_savepoint(self, query: str, savepoint: str) -> None:
+        """Executa um comando de savepoint (criação, liberação ou rollback)."""
+
+        with self.connection_manager.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(query).format(savepoint=sql.Identifier(savepoint))
+            )
+
+    def __begin_row(self) -> None:
+        """Inicia a unidade de uma linha: no commit por lote, cria um savepoint."""
+
+        if self.commit_mode == CommitModeType.BATCH:
+            self.__execute_savepoint(
+                CDCQueriesPostgreSQL.CDC_SAVEPOINT, self.ROW_SAVEPOINT
+            )
+
+    def __end_row(self, errors: int) -> None:
+        """
+        Finaliza a unidade de uma linha.
+
+        No commit por linha, confirma a transação (uma linha com erro já abortou a
+        transação e o commit a desfaz). No commit por lote, libera o savepoint ou,
+        se houve erro, desfaz somente a linha com ROLLBACK TO SAVEPOINT.
+
+        Args:
+            errors (int): Quantidade de erros da linha.
+        """
+
+        if self.commit_mode == CommitModeType.ROW:
+            self.connection_manager.commit()
+        elif errors:
+            self.__execute_savepoint(
+                CDCQueriesPostgreSQL.CDC_ROLLBACK_TO_SAVEPOINT, self.ROW_SAVEPOINT
+            )
+        else:
+            self.__execute_savepoint(
+                CDCQueriesPostgreSQL.CDC_RELEASE_SAVEPOINT, self.ROW_SAVEPOINT
+            )
+
     def __insert_cdc_data(
         self,
         table: Table,
         mode: CdcModeType,
+        apply_engine: ApplyEngineType = ApplyEngineType.ROW,
     ) -> dict:
         """
         Insere dados de altera es em uma tabela de destino.
@@ -107,13 +163,22 @@ class CDCOperationsHandler:
 
         try:
             match mode:
+                case CdcModeType.DEFAULT if apply_engine == ApplyEngineType.BULK:
+                    cdc_stats = self.__insert_cdc_data_bulk(table)
+                case CdcModeType.DEFAULT if apply_engine == ApplyEngineType.GROUPED:
+                    cdc_stats = self.__insert_cdc_data_grouped(table)
                 case CdcModeType.DEFAULT:
                     cdc_stats = self.__insert_cdc_data_default(table)
+                case CdcModeType.UPSERT if apply_engine == ApplyEngineType.BULK:
+                    cdc_stats = self.__insert_cdc_data_upsert_bulk(table)
                 case CdcModeType.UPSERT:
                     cdc_stats = self.__insert_cdc_data_upsert(table)
                 case CdcModeType.SCD2:
                     cdc_stats = self.__insert_cdc_data_scd2(table)
 
+            if self.commit_mode == CommitModeType.BATCH:
+                self.connection_manager.commit()
+
             return cdc_stats
         except Exception as e:
             e = CDCDataError(
@@ -146,8 +211,16 @@ class CDCOperationsHandler:
             "total": 0,
         }
 
-        for row in table.data.iter_rows(named=True):
+        self.__apply_rows(table, table.data, stats)
+        return stats
+
+    def __apply_rows(self, table: Table, data: pl.DataFrame, stats: dict) -> None:
+        """Aplica as linhas de data uma a uma, com commit por linha, acumulando em stats."""
+
+        for row in data.iter_rows(named=True):
+            self.__begin_row()
             operation = row["$TREM_OPERATION"]
+            operation_stats = {"errors": 0}
             if operation == "INSERT":
                 operation_stats = self.__operation_insert(table, row)
                 stats["inserts"] += 1
@@ -164,10 +237,513 @@ class CDCOperationsHandler:
                 stats["total"] += 1
                 stats["errors"] += operation_stats.get("errors", 0)
 
+            self.__end_row(operation_stats.get("errors", 0))
+
+    def __insert_cdc_data_grouped(self, table: Table) -> dict:
+        """Processa operações CDC no modo padrão agrupando sequências de mesma operação.
+
+        As linhas são divididas em sequências consecutivas de mesma operação (a ordem
+        de origem é mantida) e cada sequência é enviada em um único comando:
+        execute_values para INSERT e execute_batch para UPDATE e DELETE, com um commit
+        por sequência. Se uma sequência falhar, ela é desfeita e reaplicada linha a
+        linha, mantendo o tratamento de erros por operação do modo padrão. No commit
+        por lote, cada sequência usa um savepoint e uma sequência com falha é dividida
+        ao meio recursivamente até isolar as linhas com erro.
+
+        Args:
+            table (Table): Objeto contendo a estrutura da tabela e os dados a serem processados.
+
+        Returns:
+            dict: Estatísticas no mesmo formato do modo padrão.
+        """
+
+        stats = {
+            "schema_name": table.schema_name,
+            "table_name": table.table_name,
+            "inserts": 0,
+            "updates": 0,
+            "deletes": 0,
+            "errors": 0,
+            "total": 0,
+        }
+
+        operation = pl.col("$TREM_OPERATION")
+        runs = table.data.with_columns(
+            (operation != operation.shift())
+            .fill_null(True)
+            .cum_sum()
+            .alias("$TREM_RUN")
+        ).partition_by("$TREM_RUN", maintain_order=True, include_key=False)
+
+        for run in runs:
+            run_operation = run.get_column("$TREM_OPERATION")[0]
+            if run_operation not in self.OPERATION_STATS_KEYS:
+                continue
+
+            cursor = None
+            try:
+                with self.connection_manager.cursor() as cursor:
+                    if self.commit_mode == CommitModeType.BATCH:
+                        self.__execute_savepoint(
+                            CDCQueriesPostgreSQL.CDC_SAVEPOINT, self.RUN_SAVEPOINT
+                        )
+                    self.__grouped_execute(table, run_operation, run, cursor)
+
+                if self.commit_mode == CommitModeType.BATCH:
+                    self.__execute_savepoint(
+                        CDCQueriesPostgreSQL.CDC_RELEASE_SAVEPOINT, self.RUN_SAVEPOINT
+                    )
+                else:
+                    self.connection_manager.commit()
+
+                stats[self.OPERATION_STATS_KEYS[run_operation]] += run.height
+                stats["total"] += run.height
+
+            except Exception as e:
+                if self.commit_mode == CommitModeType.BATCH:
+                    self.__execute_savepoint(
+                        CDCQueriesPostgreSQL.CDC_ROLLBACK_TO_SAVEPOINT,
+                        self.RUN_SAVEPOINT,
+                    )
+                else:
+                    self.connection_manager.rollback()
+
+                error_info = self.__handle_database_exceptions(
+                    table.target_schema_name, table.target_table_name, cursor, e
+                )
+                logger.warning(
+                    f"ENDPOINT - Falha na aplicação agrupada de {run.height} {run_operation}, isolando as linhas com erro: {error_info['error_msg']}",
+                    required_types=["cdc"],
+                )
+
+                if self.commit_mode == CommitModeType.BATCH:
+                    self.__bisect_run(table, run_operation, run, stats)
+                else:
+                    self.__apply_rows(table, run, stats)
+
+        return stats
+
+    def __bisect_run(
+        self, table: Table, operation: str, data: pl.DataFrame, stats: dict
+    ) -> None:
+        """
+        Reaplica uma sequência com falha dividindo-a ao meio até isolar as linhas com erro.
+
+        Cada metade é enviada em um único comando sob um savepoint; uma metade com
+        falha é desfeita e dividida novamente. Linhas isoladas são aplicadas pelo
+        caminho linha a linha, que registra o erro em apply_exceptions.
+
+        Args:
+            table (Table): Tabela de destino.
+            operation (str): Operação da sequência (INSERT, UPDATE ou DELETE).
+            data (pl.DataFrame): Linhas da sequência.
+            stats (dict): Estatísticas acumuladas do lote.
+        """
+
+        if data.height <= 1:
+            self.__apply_rows(table, data, stats)
+            return
+
+        half = data.height // 2
+        for part in (data.slice(0, half), data.slice(half)):
+            if part.height == 1:
+                self.__apply_rows(table, part, stats)
+                continue
+
+            self.__execute_savepoint(
+                CDCQueriesPostgreSQL.CDC_SAVEPOINT, self.RUN_SAVEPOINT
+            )
+            try:
+                with self.connection_manager.cursor() as cursor:
+                    self.__grouped_execute(table, operation, part, cursor)
+            except Exception:
+                self.__execute_savepoint(
+                    CDCQueriesPostgreSQL.CDC_ROLLBACK_TO_SAVEPOINT, self.RUN_SAVEPOINT
+                )
+                self.__bisect_run(table, operation, part, stats)
+                continue
+
+            self.__execute_savepoint(
+                CDCQueriesPostgreSQL.CDC_RELEASE_SAVEPOINT, self.RUN_SAVEPOINT
+            )
+            stats[self.OPERATION_STATS_KEYS[operation]] += part.height
+            stats["total"] += part.height
+
+    def __grouped_execute(
+        self,
+        table: Table,
+        operation: str,
+        data: pl.DataFrame,
+        cursor: extensions.cursor,
+    ) -> None:
+        """Envia uma sequência de linhas de mesma operação em um único comando."""
+
+        match operation:
+            case "INSERT":
+                self.__grouped_insert(table, data, cursor)
+            case "UPDATE":
+                self.__grouped_update(table, data, cursor)
+            case "DELETE":
+                self.__grouped_delete(table, data, cursor)
+
+    def __grouped_insert(
+        self, table: Table, data: pl.DataFrame, cursor: extensions.cursor
+    ) -> None:
+        """Insere uma sequência de linhas com execute_values (mesmas regras de __operation_insert)."""
+
+        scd2_start_date = table.get_scd2_columns().get(SCD2ColumnType.START_DATE)
+        data_columns = [col for col in data.columns if not col.startswith("$TREM_")]
+        value_columns = [col for col in data_columns if col != scd2_start_date]
+
+        template = "({})".format(
+            ", ".join("NOW()" if col == scd2_start_date else "%s" for col in data_columns)
+        )
+        query = sql.SQL(CDCQueriesPostgreSQL.CDC_INSERT_VALUES_DATA).format(
+            schema=sql.Identifier(table.target_schema_name),
+            table=sql.Identifier(table.target_table_name),
+            columns=sql.SQL(", ").join(map(sql.Identifier, data_columns)),
+        )
+
+        execute_values(
+            cursor,
+            query,
+            data.select(value_columns).rows(),
+            template=template,
+            page_size=self.GROUPED_PAGE_SIZE,
+        )
+
+    def __grouped_update(
+        self, table: Table, data: pl.DataFrame, cursor: extensions.cursor
+    ) -> None:
+        """Atualiza uma sequência de linhas com execute_batch (mesmas regras de __operation_update)."""
+
+        pk_columns = table.get_pk_columns()
+        data_columns = [col for col in data.columns if not col.startswith("$TREM_")]
+        set_columns = [col for col in data_columns if col not in pk_columns]
+        where_columns = [col for col in data_columns if col in pk_columns]
+
+        query = sql.SQL(CDCQueriesPostgreSQL.CDC_UPDATE_DATA).format(
+            schema=sql.Identifier(table.target_schema_name),
+            table=sql.Identifier(table.target_table_name),
+            set_clause=sql.SQL(", ").join(
+                sql.SQL("{col} = %s").format(col=sql.Identifier(col))
+                for col in set_columns
+            ),
+            where_clause=sql.SQL(" AND ").join(
+                sql.SQL("{col} = %s").format(col=sql.Identifier(col))
+                for col in where_columns
+            ),
+        )
+
+        execute_batch(
+            cursor,
+            query,
+            data.select(set_columns + where_columns).rows(),
+            page_size=self.GROUPED_PAGE_SIZE,
+        )
+
+    def __grouped_delete(
+        self, table: Table, data: pl.DataFrame, cursor: extensions.cursor
+    ) -> None:
+        """Remove uma sequência de linhas com execute_batch (mesmas regras de __operation_delete)."""
+
+        pk_columns = table.get_pk_columns()
+
+        query = sql.SQL(CDCQueriesPostgreSQL.CDC_DELETE_DATA).format(
+            schema=sql.Identifier(table.target_schema_name),
+            table=sql.Identifier(table.target_table_name),
+            where_clause=sql.SQL(" AND ").join(
+                sql.SQL("{col} = %s").format(col=sql.Identifier(col))
+                for col in pk_columns
+            ),
+        )
+
+        execute_batch(
+            cursor,
+            query,
+            data.select(pk_columns).rows(),
+            page_size=self.GROUPED_PAGE_SIZE,
+        )
+
+    def __insert_cdc_data_bulk(self, table: Table) -> dict:
+        """Processa operações CDC no modo padrão de forma set-based.
+
+        O lote é reduzido ao efeito final por PK (Table.compact_changes), copiado via
+        COPY para uma tabela temporária e aplicado com três comandos (DELETE ... USING,
+        UPDATE ... FROM e INSERT ... SELECT) em uma única transação. O INSERT é
+        simples, como no modo padrão: os INSERTs cuja PK já existe no destino não
+        são sobrescritos, e sim reaplicados linha a linha após o commit, registrando
+        o erro de chave duplicada em apply_exceptions. Em caso de erro, a transação é
+        desfeita e o lote é reaplicado pelo modo padrão linha a linha, que registra
+        os erros reais de cada linha. Tabelas sem PK usam diretamente o modo padrão.
+
+        Args:
+            table (Table): Objeto contendo a estrutura da tabela e os dados a serem processados.
+
+        Returns:
+            dict: Estatísticas no mesmo formato do modo padrão.
+        """
+
+        pk_columns = [col.name for col in table.columns.values() if col.is_primary_key]
+        if not pk_columns:
+            return self.__insert_cdc_data_default(table)
+
+        stats = self.__bulk_stats(table)
+
+        try:
+            df_net = self.__compact_to_staging_rows(table)
+            data_columns = df_net.columns[:-2]
+            non_pk_columns = [col for col in data_columns if col not in pk_columns]
+
+            identifiers = self.__bulk_identifiers(table, pk_columns)
+            columns = sql.SQL(", ").join(map(sql.Identifier, data_columns))
+
+            with self.connection_manager.cursor() as cursor:
+                self.__copy_to_staging(df_net, identifiers, cursor)
+                cursor.execute(
+                    sql.SQL(CDCQueriesPostgreSQL.CDC_BULK_DELETE_DATA).format(
+                        **identifiers
+                    )
+                )
+                if non_pk_columns:
+                    cursor.execute(
+                        sql.SQL(CDCQueriesPostgreSQL.CDC_BULK_UPDATE_DATA).format(
+                            set_clause=sql.SQL(", ").join(
+                                sql.SQL("{col} = s.{col}").format(
+                                    col=sql.Identifier(col)
+                                )
+                                for col in non_pk_columns
+                            ),
+                            **identifiers,
+                        )
+                    )
+                cursor.execute(
+                    sql.SQL(CDCQueriesPostgreSQL.CDC_BULK_INSERT_CONFLICTS).format(
+                        **identifiers
+                    )
+                )
+                conflict_rownums = [row[0] for row in cursor.fetchall()]
+                cursor.execute(
+                    sql.SQL(CDCQueriesPostgreSQL.CDC_BULK_INSERT_DATA).format(
+                        columns=columns, **identifiers
+                    )
+                )
+
             self.connection_manager.commit()
 
+        except Exception as e:
+            # O caminho linha a linha registra os erros reais em apply_exceptions
+            self.connection_manager.rollback()
+            logger.warning(
+                f"ENDPOINT - Falha na aplicação em lote de {table.target_schema_name}.{table.target_table_name}, reaplicando linha a linha: {e}",
+                required_types=["cdc"],
+            )
+            return self.__insert_cdc_data_default(table)
+
+        if conflict_rownums:
+            conflict_stats = {
+                "inserts": 0,
+                "updates": 0,
+                "deletes": 0,
+                "errors": 0,
+                "total": 0,
+            }
+            self.__apply_rows(
+                table,
+                table.data.filter(
+                    (pl.col("$TREM_OPERATION") == "INSERT")
+                    & pl.col("$TREM_ROWNUM").is_in(conflict_rownums)
+                ),
+                conflict_stats,
+            )
+            stats["errors"] += conflict_stats["errors"]
+
         return stats
 
+    @staticmethod
+    def __compact_to_staging_rows(table: Table) -> pl.DataFrame:
+        """
+        Compacta as alterações da tabela (Table.compact_changes) e retorna as colunas
+        de dados seguidas de $TREM_ROWNUM e $TREM_OPERATION, no formato da tabela de
+        staging.
+        """
+
+        table.compact_changes()
+        data_columns = [
+            col for col in table.data.columns if not col.startswith("$TREM_")
+        ]
+        return table.data.select(data_columns + ["$TREM_ROWNUM", "$TREM_OPERATION"])
+
+    @staticmethod
+    def __bulk_stats(table: Table) -> dict:
+        """Estatísticas de um lote aplicado de forma set-based, pelas operações de origem."""
+
+        operations = table.data.get_column("$TREM_OPERATION")
+        return {
+            "schema_name": table.schema_name,
+            "table_name": table.table_name,
+            "inserts": int((operations == "INSERT").sum()),
+            "updates": int((operations == "UPDATE").sum()),
+            "deletes": int((operations == "DELETE").sum()),
+            "errors": 0,
+            "total": table.data.height,
+        }
+
+    @staticmethod
+    def __bulk_identifiers(
+        table: Table, pk_columns: List[str]
+    ) -> Dict[str, sql.Composable]:
+        """Identificadores comuns às queries set-based (destino, staging e junção por PK)."""
+
+        return {
+            "schema": sql.Identifier(table.target_schema_name),
+            "table": sql.Identifier(table.target_table_name),
+            "stage": sql.Identifier(f"trem_stage_{table.target_table_name}"),
+            "operation": sql.Identifier("$TREM_OPERATION"),
+            "rownum": sql.Identifier("$TREM_ROWNUM"),
+            "pk_join": sql.SQL(" AND ").join(
+                sql.SQL("t.{col} = s.{col}").format(col=sql.Identifier(col))
+                for col in pk_columns
+            ),
+        }
+
+    @staticmethod
+    def __copy_to_staging(
+        df_net: pl.DataFrame,
+        identifiers: Dict[str, sql.Composable],
+        cursor: extensions.cursor,
+    ) -> None:
+        """
+        Cria a tabela temporária de staging (com os tipos da tabela de destino) e
+        copia as operações líquidas via COPY.
+        """
+
+        buffer = io.StringIO()
+        df_net.write_csv(buffer, include_header=False)
+        buffer.seek(0)
+
+        cursor.execute(
+            sql.SQL(CDCQueriesPostgreSQL.CDC_CREATE_STAGING_TABLE).format(
+                columns=sql.SQL(", ").join(map(sql.Identifier, df_net.columns[:-2])),
+                **identifiers,
+            )
+        )
+        cursor.copy_expert(
+            sql.SQL(CDCQueriesPostgreSQL.CDC_COPY_STAGING_TABLE)
+            .format(
+                columns=sql.SQL(", ").join(map(sql.Identifier, df_net.columns)),
+                **identifiers,
+            )
+            .as_string(cursor),
+            buffer,
+        )
+
+    def __insert_cdc_data_upsert_bulk(self, table: Table) -> dict:
+        """Processa operações CDC no modo UPSERT de forma set-based.
+
+        O lote é reduzido ao efeito final por PK (Table.compact_changes), mantendo só
+        a última linha de cada PK (no upsert, DELETE seguido de INSERT equivale ao
+        INSERT), e copiado para uma tabela temporária. Tabelas sem PK usam
+        diretamente o modo UPSERT linha a linha. No PostgreSQL 15+ é aplicado com um único MERGE (DELETE
+        para PKs removidas, UPDATE/INSERT para as demais); em versões anteriores,
+        com um DELETE ... USING e um INSERT ... ON CONFLICT de várias linhas. Em caso
+        de erro, a transação é desfeita e o lote é reaplicado linha a linha.
+
+        Args:
+            table (Table): Objeto contendo a estrutura da tabela e os dados a serem processados.
+
+        Returns:
+            dict: Estatísticas no mesmo formato do modo UPSERT.
+        """
+
+        pk_columns = [col.name for col in table.columns.values() if col.is_primary_key]
+        if not pk_columns:
+            return self.__insert_cdc_data_upsert(table)
+
+        stats = self.__bulk_stats(table)
+
+        try:
+            df_net = self.__compact_to_staging_rows(table).unique(
+                subset=pk_columns, keep="last", maintain_order=True
+            )
+            data_columns = df_net.columns[:-2]
+            non_pk_columns = [col for col in data_columns if col not in pk_columns]
+
+            identifiers = self.__bulk_identifiers(table, pk_columns)
+            columns = sql.SQL(", ").join(map(sql.Identifier, data_columns))
+
+            with self.connection_manager.cursor() as cursor:
+                self.__copy_to_staging(df_net, identifiers, cursor)
+
+                if (
+                    self.connection_manager.connection.server_version
+                    >= self.MERGE_MIN_SERVER_VERSION
+                ):
+                    matched_update = sql.SQL("")
+                    if non_pk_columns:
+                        matched_update = sql.SQL(
+                            "WHEN MATCHED THEN UPDATE SET {set_clause}"
+                        ).format(
+                            set_clause=sql.SQL(", ").join(
+                                sql.SQL("{col} = s.{col}").format(
+                                    col=sql.Identifier(col)
+                                )
+                                for col in non_pk_columns
+                            )
+                        )
+
+                    cursor.execute(
+                        sql.SQL(CDCQueriesPostgreSQL.CDC_BULK_MERGE_DATA).format(
+                            columns=columns,
+                            source_columns=sql.SQL(", ").join(
+                                sql.SQL("s.{col}").format(col=sql.Identifier(col))
+                                for col in data_columns
+                            ),
+                            matched_update=matched_update,
+                            **identifiers,
+                        )
+                    )
+
+                else:
+                    conflict_action = sql.SQL("DO NOTHING")
+                    if non_pk_columns:
+                        conflict_action = sql.SQL("DO UPDATE SET {set_clause}").format(
+                            set_clause=sql.SQL(", ").join(
+                                sql.SQL("{col} = EXCLUDED.{col}").format(
+                                    col=sql.Identifier(col)
+                                )
+                                for col in non_pk_columns
+                            )
+                        )
+
+                    cursor.execute(
+                        sql.SQL(CDCQueriesPostgreSQL.CDC_BULK_DELETE_DATA).format(
+                            **identifiers
+                        )
+                    )
+                    cursor.execute(
+                        sql.SQL(CDCQueriesPostgreSQL.CDC_BULK_UPSERT_DATA).format(
+                            columns=columns,
+                            pk_columns=sql.SQL(", ").join(
+                                map(sql.Identifier, pk_columns)
+                            ),
+                            conflict_action=conflict_action,
+                            **identifiers,
+                        )
+                    )
+
+            self.connection_manager.commit()
+            return stats
+
+        except Exception as e:
+            # O caminho linha a linha registra os erros reais em apply_exceptions
+            self.connection_manager.rollback()
+            logger.warning(
+                f"ENDPOINT - Falha no upsert em lote de {table.target_schema_name}.{table.target_table_name}, reaplicando linha a linha: {e}",
+                required_types=["cdc"],
+            )
+            return self.__insert_cdc_data_upsert(table)
+
     def __insert_cdc_data_upsert(self, table: Table) -> None:
         """Processa operações CDC no modo UPSERT (INSERT + UPDATE combinados).
 
@@ -192,6 +768,7 @@ class CDCOperationsHandler:
         }
 
         for row in table.data.iter_rows(named=True):
+            self.__begin_row()
             operation = row["$TREM_OPERATION"]
             if operation == "INSERT":
                 operation_stats = self.__operation_upsert(table, row)
@@ -209,7 +786,7 @@ class CDCOperationsHandler:
                 stats["total"] += 1
                 stats["errors"] += operation_stats.get("errors", 0)
 
-            self.connection_manager.commit()
+            self.__end_row(operation_stats.get("errors", 0))
 
         return stats
 
@@ -239,6 +816,8 @@ class CDCOperationsHandler:
         }
 
         for row in table.data.iter_rows(named=True):
+            self.__begin_row()
+            row_errors = stats["errors"]
             operation = row["$TREM_OPERATION"]
             if operation == "INSERT":
                 row_exists = self.__scd2_verify_if_row_exists(table, row)
@@ -272,7 +851,7 @@ class CDCOperationsHandler:
                 stats["total"] += 1
                 stats["errors"] += disable_stats.get("errors", 0)
 
-            self.connection_manager.commit()
+            self.__end_row(stats["errors"] - row_errors)
 
         return stats
 
@@ -753,6 +1332,8 @@ class CDCOperationsHandler:
         mode: str,
         table: Table,
         create_table_if_not_exists: bool = False,
+        apply_engine: ApplyEngineType = ApplyEngineType.ROW,
+        commit_mode: CommitModeType = CommitModeType.ROW,
     ) -> dict:
         """
         Insere dados de alterações em uma tabela de destino.
@@ -760,6 +1341,11 @@ class CDCOperationsHandler:
         Args:
             table (Table): Objeto representando a estrutura da tabela.
             create_table_if_not_exists (bool): Se True, cria a tabela caso ela não exista.
+            apply_engine (ApplyEngineType): Mecanismo de aplicação; grouped agrupa
+                sequências de mesma operação (modo padrão) e bulk aplica de forma
+                set-based (COPY + tabela temporária; MERGE no modo UPSERT em PG15+).
+            commit_mode (CommitModeType): row confirma cada linha; batch confirma uma vez
+                por lote e isola as linhas com erro por savepoints.
 
         Returns:
             dict: Dicionário contendo o log de execução do método.
@@ -770,8 +1356,11 @@ class CDCOperationsHandler:
 
         try:
             self.table_manager.manage_target_table(table, create_table_if_not_exists)
+            self.commit_mode = CommitModeType(commit_mode)
 
-            cdc_stats = self.__insert_cdc_data(table, mode)
+            cdc_stats = self.__insert_cdc_data(
+                table, mode, ApplyEngineType(apply_engine)
+            )
 
             return cdc_stats
 
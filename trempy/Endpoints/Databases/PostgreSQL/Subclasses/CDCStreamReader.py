@@ -0,0 +1,271 @@
+from trempy.Endpoints.Databases.PostgreSQL.Subclasses.ConnectionManager import (
+    ConnectionManager,
+)
+from trempy.Loggings.Logging import ReplicationLogger
+from trempy.Endpoints.Exceptions.Exception import *
+from psycopg2.extras import ReplicationCursor
+from typing import List, Optional
+from select import select
+from time import time
+import polars as pl
+import psycopg2
+
+logger = ReplicationLogger()
+
+
+class CDCStreamReader:
+    """Responsabilidade: Ler alterações de um slot via protocolo de replicação lógica (streaming)."""
+
+    IDLE_TIMEOUT_SECONDS = 0.1
+    STATUS_INTERVAL_SECONDS = 10
+
+    def __init__(self, connection_manager: ConnectionManager):
+        self.connection_manager = connection_manager
+
+        self.cursor: Optional[ReplicationCursor] = None
+        self.slot_name: Optional[str] = None
+
+        self.binary = False
+        self.pending_rows: List[tuple] = []
+        self.current_xid: Optional[int] = None
+        self.last_commit_lsn: Optional[int] = None
+        self.flushed_lsn: Optional[int] = None
+
+    @staticmethod
+    def format_lsn(lsn: int) -> str:
+        """Converte um LSN inteiro para o formato textual do PostgreSQL (ex: 0/16B3748)."""
+        return f"{lsn >> 32:X}/{lsn & 0xFFFFFFFF:X}"
+
+    @staticmethod
+    def parse_lsn(lsn: str) -> int:
+        """Converte um LSN textual do PostgreSQL (ex: 0/16B3748) para inteiro."""
+        high, low = lsn.split("/")
+        return (int(high, 16) << 32) + int(low, 16)
+
+    def __is_begin(self, payload) -> bool:
+        return payload[0:1] == b"B" if self.binary else payload.startswith("BEGIN")
+
+    def __is_commit(self, payload) -> bool:
+        return payload[0:1] == b"C" if self.binary else payload.startswith("COMMIT")
+
+    def __get_xid(self, payload) -> Optional[int]:
+        """Extrai o xid de uma mensagem BEGIN (texto do test_decoding ou binária do pgoutput)."""
+        if self.binary:
+            return int.from_bytes(payload[17:21], "big")
+        parts = payload.split()
+        return int(parts[1]) if len(parts) > 1 else None
+
+    def __start_stream(self, slot_name: str, options: dict = None) -> None:
+        """
+        Inicia o streaming do slot de replicação, caso ainda não tenha sido iniciado.
+
+        O streaming começa a partir do último LSN confirmado (ou do
+        confirmed_flush_lsn do slot), portanto alterações não confirmadas via
+        send_feedback são reenviadas pelo servidor.
+
+        Args:
+            slot_name (str): Nome do slot de replicação.
+            options (dict): Opções repassadas ao plugin de decodificação.
+        """
+
+        if self.cursor is not None and self.slot_name == slot_name:
+            return
+
+        connection = self.connection_manager.get_replication_connection()
+        self.cursor = connection.cursor()
+        self.cursor.start_replication(
+            slot_name=slot_name,
+            start_lsn=self.flushed_lsn or 0,
+            decode=not self.binary,
+            options=options,
+            status_interval=self.STATUS_INTERVAL_SECONDS,
+        )
+        self.slot_name = slot_name
+
+        logger.info(
+            f"ENDPOINT - Streaming iniciado no slot {slot_name}",
+            required_types=["cdc"],
+        )
+
+    def __is_connection_lost(self) -> bool:
+        """Indica se a conexão de replicação foi encerrada (ex: wal_sender_timeout)."""
+        return self.cursor is not None and bool(self.cursor.connection.closed)
+
+    def __reset_stream(self, error: Exception) -> None:
+        """
+        Descarta o stream após a queda da conexão de replicação.
+
+        As linhas lidas e não confirmadas são descartadas: na próxima leitura o
+        streaming é reiniciado a partir do último LSN confirmado e o servidor as
+        reenvia.
+        """
+
+        logger.warning(
+            f"ENDPOINT - Conexão de replicação encerrada no slot {self.slot_name}, reiniciando a partir do último LSN confirmado: {error}",
+            required_types=["cdc"],
+        )
+
+        self.connection_manager.close_replication_connection()
+        self.cursor = None
+        self.pending_rows = []
+        self.current_xid = None
+        self.last_commit_lsn = self.flushed_lsn
+
+    def keepalive(self) -> None:
+        """
+        Envia o status do standby ao servidor enquanto o stream está ocioso.
+
+        Entre as leituras (ex: durante a espera do daemon) nenhuma mensagem é
+        enviada ao servidor, e sem feedback periódico o walsender encerra a conexão
+        após wal_sender_timeout. Se a conexão já caiu, o stream é descartado e
+        reiniciado na próxima leitura.
+        """
+
+        if self.cursor is None:
+            return
+
+        try:
+            self.cursor.send_feedback(force=True)
+        except psycopg2.Error as e:
+            if not self.__is_connection_lost():
+                raise
+            self.__reset_stream(e)
+
+    def read_changes(
+        self,
+        slot_name: str,
+        max_wait_seconds: float,
+        max_changes: int = None,
+        upto_lsn: str = None,
+        options: dict = None,
+        binary: bool = False,
+    ) -> pl.DataFrame:
+        """
+        Lê as alterações disponíveis no stream até o fim da janela de espera.
+
+        Apenas transações completas (BEGIN ... COMMIT) são retornadas; linhas de uma
+        transação ainda aberta ficam pendentes para a próxima leitura. A leitura é
+        encerrada antes do fim da janela quando o stream fica ocioso após ao menos
+        um COMMIT, ou quando max_changes ou upto_lsn é atingido em uma fronteira de
+        transação. Se a conexão de replicação cair, a leitura retorna vazia e o
+        stream é reiniciado na próxima chamada (ver __reset_stream).
+
+        Args:
+            slot_name (str): Nome do slot de replicação.
+            max_wait_seconds (float): Tempo máximo de leitura em segundos.
+            max_changes (int): Quantidade máxima de linhas por leitura (opcional).
+            upto_lsn (str): LSN limite; a leitura termina no primeiro COMMIT que o atinge (opcional).
+            options (dict): Opções repassadas ao plugin de decodificação.
+            binary (bool): Se True, as mensagens são lidas como bytes (pgoutput).
+
+        Returns:
+            pl.DataFrame: DataFrame com as colunas lsn, xid e data, no mesmo formato
+                de pg_logical_slot_get_changes (ou get_binary_changes).
+
+        Raises:
+            CaptureChangesError: Se ocorrer um erro durante a leitura do stream.
+        """
+
+        try:
+            self.binary = binary
+            self.__start_stream(slot_name, options)
+
+            committed_rows = []
+            target_lsn = self.parse_lsn(upto_lsn) if upto_lsn else None
+            deadline = time() + max_wait_seconds
+
+            if (
+                target_lsn is not None
+                and self.last_commit_lsn is not None
+                and self.last_commit_lsn >= target_lsn
+            ):
+                deadline = time()
+
+            while time() < deadline:
+                message = self.cursor.read_message()
+
+                if message is None:
+                    if committed_rows:
+                        break
+                    select(
+                        [self.cursor],
+                        [],
+                        [],
+                        min(self.IDLE_TIMEOUT_SECONDS, max(deadline - time(), 0)),
+                    )
+                    continue
+
+                payload = message.payload
+                lsn = self.format_lsn(message.data_start)
+
+                if self.__is_begin(payload):
+                    self.current_xid = self.__get_xid(payload)
+                    self.pending_rows = []
+
+                self.pending_rows.append((lsn, self.current_xid, payload))
+
+                if self.__is_commit(payload):
+                    committed_rows.extend(self.pending_rows)
+                    self.pending_rows = []
+                    self.current_xid = None
+                    self.last_commit_lsn = message.data_start
+
+                    if max_changes and len(committed_rows) >= max_changes:
+                        break
+                    if target_lsn is not None and message.data_start >= target_lsn:
+                        break
+
+        except psycopg2.Error as e:
+            if not self.__is_connection_lost():
+                e = CaptureChangesError(
+                    f"Erro ao ler stream de replicação: {e}", slot_name
+                )
+                logger.critical(e, required_types=["cdc"])
+
+            self.__reset_stream(e)
+            committed_rows = []
+
+        except Exception as e:
+            e = CaptureChangesError(f"Erro ao ler stream de replicação: {e}", slot_name)
+            logger.critical(e, required_types=["cdc"])
+
+        return pl.DataFrame(
+            committed_rows,
+            schema={
+                "lsn": pl.Utf8,
+                "xid": pl.Int64,
+                "data": pl.Binary if self.binary else pl.Utf8,
+            },
+            orient="row",
+        )
+
+    def close(self) -> None:
+        """Encerra o stream e fecha a conexão de replicação, liberando o slot."""
+
+        self.connection_manager.close_replication_connection()
+        self.cursor = None
+        self.slot_name = None
+        self.pending_rows = []
+        self.current_xid = None
+
+    def confirm(self) -> None:
+        """
+        Confirma ao servidor o LSN do último COMMIT lido (flush feedback).
+
+        Deve ser chamado somente após a publicação das alterações, permitindo que o
+        slot libere o WAL correspondente.
+        """
+
+        if self.cursor is None or self.last_commit_lsn is None:
+            return
+
+        try:
+            self.cursor.send_feedback(flush_lsn=self.last_commit_lsn, reply=True)
+        except psycopg2.Error as e:
+            # As alterações já publicadas serão reenviadas a partir de flushed_lsn
+            if not self.__is_connection_lost():
+                raise
+            self.__reset_stream(e)
+            return
+
+        self.flushed_lsn = self.last_commit_lsn
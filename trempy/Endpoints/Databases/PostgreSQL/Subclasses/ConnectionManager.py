@@ -1,5 +1,6 @@
 from trempy.Loggings.Logging import ReplicationLogger
 from trempy.Endpoints.Exceptions.Exception import *
+from psycopg2.extras import LogicalReplicationConnection
 import psycopg2
 
 logger = ReplicationLogger()
@@ -15,6 +16,9 @@ class ConnectionManager:
         finally:
             del temp_credentials
 
+        self.__credentials = credentials.copy()
+        self.replication_connection = None
+
         logger.debug(self.connection.get_dsn_parameters(), required_types=["full_load"])
 
     def __connect(self, credentials: dict) -> psycopg2.extensions.connection:
@@ -37,20 +41,60 @@ class ConnectionManager:
             e = EndpointError(f"Erro ao conectar ao banco de dados: {e}")
             logger.critical(e)
 
-    def cursor(self) -> psycopg2.extensions.cursor:
+    def cursor(self, name: str = None) -> psycopg2.extensions.cursor:
         """
         Retorna um cursor para a conexão atual do banco de dados.
 
+        Args:
+            name (str): Nome do cursor. Quando informado, cria um cursor do lado do
+                servidor, que traz os resultados em lotes (opcional).
+
         Returns:
             psycopg2.extensions.cursor: Cursor para a conexão atual do banco de dados.
         """
 
-        return self.connection.cursor()
+        return self.connection.cursor(name=name)
+
+    def get_replication_connection(self) -> LogicalReplicationConnection:
+        """
+        Retorna uma conexão de replicação lógica (protocolo de streaming).
+
+        A conexão é criada sob demanda e reaproveitada nas chamadas seguintes.
+
+        Returns:
+            LogicalReplicationConnection: Conexão de replicação lógica.
+
+        Raises:
+            EndpointError: Se houver um erro ao conectar ao banco de dados.
+        """
+
+        if self.replication_connection is None or self.replication_connection.closed:
+            try:
+                self.replication_connection = psycopg2.connect(
+                    connection_factory=LogicalReplicationConnection,
+                    **self.__credentials,
+                )
+            except Exception as e:
+                e = EndpointError(f"Erro ao abrir conexão de replicação: {e}")
+                logger.critical(e)
+
+        return self.replication_connection
+
+    def close_replication_connection(self) -> None:
+        """Fecha a conexão de replicação lógica, se existir."""
+
+        if self.replication_connection is not None:
+            if not self.replication_connection.closed:
+                self.replication_connection.close()
+            self.replication_connection = None
 
     def close(self) -> None:
         """Fecha a conexão com o banco de dados."""
 
-        self.connection.close()
+        self.close_replication_connection()
+
+        if not self.connection.closed:
+            self.connection.close()
 
     def commit(self) -> None:
         """Faz commit na transa o atual."""
@@ -0,0 +1,194 @@
+from trempy.Loggings.Logging import ReplicationLogger
+from trempy.Endpoints.Exceptions.Exception import *
+from typing import Callable, Dict, List, Optional, Any
+import struct
+
+logger = ReplicationLogger()
+
+
+class PgOutputDecoder:
+    """Responsabilidade: Decodificar mensagens binárias do plugin pgoutput (protocolo versão 1)."""
+
+    # Nomes no mesmo formato do test_decoding (format_type sem typmod)
+    TYPE_NAMES_BY_OID = {
+        16: "boolean",
+        20: "bigint",
+        21: "smallint",
+        23: "integer",
+        25: "text",
+        700: "real",
+        701: "double precision",
+        1042: "character",
+        1043: "character varying",
+        1082: "date",
+        1083: "time without time zone",
+        1114: "timestamp without time zone",
+        1184: "timestamp with time zone",
+        1700: "numeric",
+        2950: "uuid",
+        3802: "jsonb",
+    }
+
+    BOOLEAN_VALUES = {"t": "true", "f": "false"}
+
+    def __init__(self, type_resolver: Optional[Callable[[int], str]] = None):
+        """
+        Inicializa o decodificador.
+
+        Args:
+            type_resolver (Callable[[int], str]): Função que resolve o nome de um tipo a
+                partir do seu OID, usada para tipos fora de TYPE_NAMES_BY_OID (opcional).
+        """
+        self.type_resolver = type_resolver
+        self.type_names: Dict[int, str] = dict(self.TYPE_NAMES_BY_OID)
+        self.relations: Dict[int, Dict[str, Any]] = {}
+
+    def __type_name(self, type_oid: int) -> str:
+        """Retorna o nome do tipo, resolvendo e armazenando em cache tipos desconhecidos."""
+        type_name = self.type_names.get(type_oid)
+        if type_name is None:
+            type_name = (
+                self.type_resolver(type_oid) if self.type_resolver else str(type_oid)
+            )
+            self.type_names[type_oid] = type_name
+        return type_name
+
+    @staticmethod
+    def __read_string(data: bytes, offset: int) -> tuple:
+        """Lê uma string terminada em nulo e retorna (valor, novo offset)."""
+        end = data.index(b"\x00", offset)
+        return data[offset:end].decode("utf-8"), end + 1
+
+    def __read_tuple(self, data: bytes, offset: int) -> tuple:
+        """
+        Lê um TupleData e retorna (lista de valores, novo offset).
+
+        Valores nulos retornam None e valores TOAST não alterados retornam Ellipsis,
+        para que possam ser descartados por quem chama.
+        """
+        (ncols,) = struct.unpack_from("!h", data, offset)
+        offset += 2
+
+        values = []
+        for _ in range(ncols):
+            kind = data[offset : offset + 1]
+            offset += 1
+            if kind == b"n":
+                values.append(None)
+            elif kind == b"u":
+                values.append(Ellipsis)
+            else:
+                (length,) = struct.unpack_from("!i", data, offset)
+                offset += 4
+                values.append(data[offset : offset + length].decode("utf-8"))
+                offset += length
+
+        return values, offset
+
+    def __build_columns(
+        self, relation: Dict[str, Any], values: List[Any], only_key: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Associa os valores de um TupleData às colunas da relação."""
+        columns = []
+        for column, value in zip(relation["columns"], values):
+            if value is Ellipsis or (only_key and not column["is_key"]):
+                continue
+            if value is not None and column["type"] == "boolean":
+                value = self.BOOLEAN_VALUES.get(value, value)
+            columns.append({"name": column["name"], "type": column["type"], "value": value})
+        return columns
+
+    def __decode_relation(self, data: bytes) -> None:
+        """Decodifica uma mensagem Relation e atualiza o cache por OID."""
+        (oid,) = struct.unpack_from("!I", data, 1)
+        namespace, offset = self.__read_string(data, 5)
+        relation_name, offset = self.__read_string(data, offset)
+        offset += 1  # replica identity
+        (ncols,) = struct.unpack_from("!h", data, offset)
+        offset += 2
+
+        columns = []
+        for _ in range(ncols):
+            flags = data[offset]
+            column_name, offset = self.__read_string(data, offset + 1)
+            type_oid, _typmod = struct.unpack_from("!Ii", data, offset)
+            offset += 8
+            columns.append(
+                {
+                    "name": column_name,
+                    "type": self.__type_name(type_oid),
+                    "is_key": bool(flags & 1),
+                }
+            )
+
+        self.relations[oid] = {
+            "schema_name": namespace or "pg_catalog",
+            "table_name": relation_name,
+            "columns": columns,
+        }
+
+    def __relation(self, oid: int) -> Dict[str, Any]:
+        relation = self.relations.get(oid)
+        if relation is None:
+            raise KeyError(f"Relation OID {oid} não recebida antes da alteração")
+        return relation
+
+    def decode(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Decodifica uma mensagem pgoutput.
+
+        Mensagens Relation apenas atualizam o cache e retornam None, assim como
+        mensagens sem efeito na replicação (Origin, Type, Truncate, Message).
+
+        Args:
+            data (bytes): Mensagem binária recebida do slot.
+
+        Returns:
+            Dict[str, Any]: Dicionário no mesmo formato produzido para o test_decoding:
+                {"operation": "begin"|"commit"} ou
+                {"schema_name", "table_name", "operation", "columns"}.
+        """
+        data = bytes(data)
+        message_type = data[0:1]
+
+        if message_type == b"B":
+            (xid,) = struct.unpack_from("!I", data, 17)
+            return {"operation": "begin", "xid": xid}
+
+        if message_type == b"C":
+            return {"operation": "commit"}
+
+        if message_type == b"R":
+            self.__decode_relation(data)
+            return None
+
+        if message_type not in (b"I", b"U", b"D"):
+            return None
+
+        (oid,) = struct.unpack_from("!I", data, 1)
+        relation = self.__relation(oid)
+        result = {
+            "schema_name": relation["schema_name"],
+            "table_name": relation["table_name"],
+        }
+
+        offset = 5
+        if message_type == b"I":
+            values, _ = self.__read_tuple(data, offset + 1)
+            result["operation"] = "insert"
+            result["columns"] = self.__build_columns(relation, values)
+
+        elif message_type == b"U":
+            if data[offset : offset + 1] in (b"K", b"O"):
+                _, offset = self.__read_tuple(data, offset + 1)
+            values, _ = self.__read_tuple(data, offset + 1)
+            result["operation"] = "update"
+            result["columns"] = self.__build_columns(relation, values)
+
+        else:
+            only_key = data[offset : offset + 1] == b"K"
+            values, _ = self.__read_tuple(data, offset + 1)
+            result["operation"] = "delete"
+            result["columns"] = self.__build_columns(relation, values, only_key)
+
+        return result
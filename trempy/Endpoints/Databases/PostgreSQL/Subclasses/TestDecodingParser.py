@@ -0,0 +1,245 @@
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left
+from typing import Iterable, List
+import polars as pl
+
+
+class TestDecodingParser:
+    """Responsabilidade: Interpretar, de forma vetorizada, as linhas textuais do plugin test_decoding."""
+
+    DML_PATTERN = r"(?s)^table\s+([^.]+)\.([^:]+):\s+(INSERT|UPDATE|DELETE):\s+(.+)$"
+    TABLE_ID_PATTERN = r"^table\s+([^:]+):"
+    COLUMN_PATTERN = r"([^\s\[]+)\[([^\]]+)\]:([^'\s]*(?:'[^']*'[^'\s]*)*)"
+
+    MIN_ROWS_PER_SHARD = 50000
+
+    OPERATIONS_SCHEMA = {
+        "tx_seq": pl.UInt32,
+        "schema_name": pl.Utf8,
+        "table_name": pl.Utf8,
+        "operation": pl.Utf8,
+        "columns": pl.List(
+            pl.Struct({"name": pl.Utf8, "type": pl.Utf8, "value": pl.Utf8})
+        ),
+    }
+
+    @classmethod
+    def parse(cls, df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Converte as linhas capturadas do slot em um DataFrame de operações DML.
+
+        Todo o processamento é feito com expressões do Polars sobre a coluna data:
+        as fronteiras de transação são marcadas pela contagem acumulada de BEGIN/COMMIT,
+        e somente operações de transações completas são mantidas. A ordem de captura
+        (ordem de commit) é preservada.
+
+        Args:
+            df (pl.DataFrame): DataFrame retornado por pg_logical_slot_get_changes (coluna data).
+
+        Returns:
+            pl.DataFrame: DataFrame com as colunas tx_seq, schema_name, table_name,
+                operation e columns (lista de structs name/type/value).
+        """
+
+        if df.is_empty():
+            return pl.DataFrame(schema=cls.OPERATIONS_SCHEMA)
+
+        data = pl.col("data")
+        is_begin = data.str.starts_with("BEGIN")
+        is_commit = data.str.starts_with("COMMIT")
+
+        operations = (
+            df.lazy()
+            .select(
+                data,
+                is_begin.cum_sum().cast(pl.UInt32).alias("tx_seq"),
+                (is_begin.cum_sum() - is_commit.cum_sum()).alias("open_transactions"),
+                is_commit.alias("is_commit"),
+            )
+            .filter(
+                (pl.col("tx_seq") > 0)
+                & (pl.col("open_transactions") == 1)
+                & pl.col("is_commit").any().over("tx_seq")
+            )
+            .select(
+                "tx_seq",
+                data.str.extract_groups(cls.DML_PATTERN).alias("dml"),
+            )
+            .unnest("dml")
+            .rename(
+                {"1": "schema_name", "2": "table_name", "3": "operation", "4": "rest"}
+            )
+            .filter(pl.col("operation").is_not_null())
+            .with_columns(pl.col("operation").str.to_lowercase())
+            .with_row_index("op_index")
+            .collect()
+        )
+
+        value = pl.col("raw_value")
+        columns = (
+            operations.lazy()
+            .select(
+                "op_index",
+                pl.col("rest").str.extract_all(cls.COLUMN_PATTERN).alias("raw_column"),
+            )
+            .explode("raw_column")
+            .filter(pl.col("raw_column").is_not_null())
+            .select(
+                "op_index",
+                pl.col("raw_column").str.extract_groups(cls.COLUMN_PATTERN).alias("col"),
+            )
+            .unnest("col")
+            .rename({"1": "name", "2": "type", "3": "raw_value"})
+            .with_columns(
+                pl.when(
+                    value.str.starts_with("'")
+                    & value.str.ends_with("'")
+                    & (value.str.len_chars() >= 2)
+                )
+                .then(value.str.strip_prefix("'").str.strip_suffix("'"))
+                .otherwise(value)
+                .alias("raw_value")
+            )
+            .with_columns(
+                pl.when(value == "null").then(None).otherwise(value).alias("value")
+            )
+            .group_by("op_index", maintain_order=True)
+            .agg(pl.struct("name", "type", "value").alias("columns"))
+            .collect()
+        )
+
+        return (
+            operations.join(columns, on="op_index", how="left")
+            .sort("op_index")
+            .with_columns(
+                pl.col("columns").fill_null(
+                    pl.lit([], dtype=cls.OPERATIONS_SCHEMA["columns"])
+                )
+            )
+            .select(list(cls.OPERATIONS_SCHEMA.keys()))
+            .cast(cls.OPERATIONS_SCHEMA)
+        )
+
+    @classmethod
+    def close_transactions(cls, df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Delimita uma parte da captura com BEGIN/COMMIT sintéticos quando ela começa ou
+        termina no meio de uma transação.
+
+        A captura completa contém apenas transações completas; ao ser gravada em disco
+        em partes, uma transação pode atravessar duas partes. Com as fronteiras
+        sintéticas, cada parte pode ser interpretada por parse de forma independente.
+
+        Args:
+            df (pl.DataFrame): Parte da captura (coluna data).
+
+        Returns:
+            pl.DataFrame: DataFrame com a coluna data, delimitado por BEGIN/COMMIT.
+        """
+
+        data = df.select("data")
+        if data.is_empty():
+            return data
+
+        frames = [data]
+        if not data.item(0, "data").startswith("BEGIN"):
+            frames.insert(0, pl.DataFrame({"data": ["BEGIN"]}))
+        if not data.item(-1, "data").startswith("COMMIT"):
+            frames.append(pl.DataFrame({"data": ["COMMIT"]}))
+
+        return pl.concat(frames)
+
+    @classmethod
+    def filter_tables(cls, df: pl.DataFrame, table_ids: Iterable[str]) -> pl.DataFrame:
+        """
+        Descarta as linhas DML de tabelas fora de table_ids antes da interpretação.
+
+        As linhas BEGIN/COMMIT são mantidas, de modo que as fronteiras de transação
+        continuam válidas para parse.
+
+        Args:
+            df (pl.DataFrame): DataFrame retornado por pg_logical_slot_get_changes (coluna data).
+            table_ids (Iterable[str]): Identificadores schema.tabela a manter.
+
+        Returns:
+            pl.DataFrame: DataFrame com as mesmas colunas, filtrado.
+        """
+
+        data = pl.col("data")
+        return df.filter(
+            ~data.str.starts_with("table ")
+            | data.str.extract(cls.TABLE_ID_PATTERN).is_in(list(table_ids))
+        )
+
+    @classmethod
+    def split_shards(cls, df: pl.DataFrame, shards: int) -> List[pl.DataFrame]:
+        """
+        Divide as linhas capturadas em fatias contíguas de tamanho semelhante, cortando
+        somente no início de uma transação (linha BEGIN, logo após o COMMIT anterior).
+
+        Args:
+            df (pl.DataFrame): DataFrame retornado por pg_logical_slot_get_changes (coluna data).
+            shards (int): Quantidade desejada de fatias.
+
+        Returns:
+            List[pl.DataFrame]: Fatias na ordem de captura.
+        """
+
+        begin_indexes = (
+            df.select(pl.arg_where(pl.col("data").str.starts_with("BEGIN")))
+            .to_series()
+            .to_list()
+        )
+
+        if shards <= 1 or not begin_indexes:
+            return [df]
+
+        cuts = set()
+        for shard in range(1, shards):
+            position = bisect_left(begin_indexes, df.height * shard // shards)
+            if position < len(begin_indexes) and begin_indexes[position] > 0:
+                cuts.add(begin_indexes[position])
+
+        bounds = [0, *sorted(cuts), df.height]
+        return [
+            df.slice(start, end - start)
+            for start, end in zip(bounds[:-1], bounds[1:])
+            if end > start
+        ]
+
+    @classmethod
+    def parse_sharded(cls, df: pl.DataFrame, workers: int) -> pl.DataFrame:
+        """
+        Interpreta as linhas capturadas em paralelo, uma fatia por thread.
+
+        As fatias são geradas por split_shards (sempre em fronteira de transação) e os
+        resultados são concatenados na ordem das fatias, preservando a ordem de LSN.
+        O Polars libera o GIL durante a execução das consultas, então as fatias usam
+        núcleos distintos sem exigir processos separados. Backlogs pequenos (menos de
+        MIN_ROWS_PER_SHARD linhas por fatia) são interpretados de uma só vez.
+
+        Args:
+            df (pl.DataFrame): DataFrame retornado por pg_logical_slot_get_changes (coluna data).
+            workers (int): Quantidade máxima de threads.
+
+        Returns:
+            pl.DataFrame: Mesmo formato retornado por parse.
+        """
+
+        shards = min(workers or 1, df.height // cls.MIN_ROWS_PER_SHARD)
+        if shards <= 1:
+            return cls.parse(df)
+
+        frames = cls.split_shards(df, shards)
+
+        with ThreadPoolExecutor(max_workers=len(frames)) as executor:
+            results = list(executor.map(cls.parse, frames))
+
+        # tx_seq é reiniciado em cada fatia; o deslocamento mantém a sequência global
+        offset = 0
+        for index, result in enumerate(results):
+            results[index] = result.with_columns(pl.col("tx_seq") + offset)
+            if not result.is_empty():
+                offset += result.get_column("tx_seq").max()
+
+        return pl.concat(results)
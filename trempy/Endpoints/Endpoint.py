@@ -116,6 +116,30 @@ class Endpoint(ABC):
     def capture_changes(self, **kargs) -> pl.DataFrame:
         pass
 
+    @abstractmethod
+    @source_method
+    def confirm_changes(self, **kargs) -> None:
+        pass
+
+    @abstractmethod
+    @source_method
+    def keepalive(self) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+    @abstractmethod
+    @source_method
+    def get_current_wal_lsn(self) -> str:
+        pass
+
+    @abstractmethod
+    @source_method
+    def get_replication_lag(self, slot_name: str) -> dict:
+        pass
+
     @abstractmethod
     @target_method
     def insert_cdc_into_table(self) -> dict:
@@ -22,4 +22,10 @@ class MessageProducerException(MessageError):
     """Exceção lançada quando ocorre um erro no produtor de mensagens."""
 
     def __init__(self, message: str):
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+class MessageCodecException(MessageError):
+    """Exceção lançada quando ocorre um erro ao serializar ou desserializar mensagens."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
@@ -0,0 +1,283 @@
+from pika.spec import Basic, BasicProperties
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterator, Optional, Tuple
+from time import sleep, time, time_ns
+import shutil
+import struct
+import json
+import os
+
+
+class LocalConnection:
+    """Responsabilidade: Representar a conexão do transporte local (sem broker)."""
+
+    def __init__(self):
+        self.is_open = True
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+class LocalChannel:
+    """
+    Responsabilidade: Transportar mensagens entre processos do mesmo host sem broker.
+
+    Implementa o subconjunto de BlockingChannel (pika) usado pelas classes de
+    mensagem, sobre um diretório de spool: cada fila é um diretório e cada
+    mensagem um arquivo, gravado de forma atômica (arquivo temporário + rename)
+    e entregue em ordem de publicação. As exchanges seguem a semântica direct:
+    a mensagem é gravada em todas as filas vinculadas à routing key.
+
+    Mensagens entregues e não confirmadas permanecem no spool e são reentregues
+    quando o consumidor reinicia, como no RabbitMQ.
+    """
+
+    ROOT_PATH = "task/queues/"
+    POLL_INTERVAL_SECONDS = 0.05
+    MESSAGE_SUFFIX = ".msg"
+
+    def __init__(self, root_path: Optional[str] = None):
+        self.root_path = root_path or self.ROOT_PATH
+        self.connection = LocalConnection()
+
+        self.prefetch_count = 0
+        self.consumers: Dict[str, Tuple[Callable, bool]] = {}
+
+        self.sequence = 0
+        self.delivery_tag = 0
+        self.unacked: Dict[int, Tuple[str, str]] = {}
+        self.delivered_paths = set()
+
+    def __queue_path(self, queue: str) -> str:
+        return os.path.join(self.root_path, queue)
+
+    def __binding_path(self, exchange: str, routing_key: str = "") -> str:
+        return os.path.join(self.root_path, "bindings", exchange, routing_key)
+
+    def __read_arguments(self, queue: str) -> dict:
+        try:
+            with open(os.path.join(self.__queue_path(queue), "arguments.json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def __count_ready_messages(self, queue: str) -> int:
+        """Conta apenas as mensagens prontas, como o message_count do RabbitMQ."""
+
+        queue_path = self.__queue_path(queue)
+        return sum(
+            1
+            for name in self.__list_messages(queue)
+            if os.path.join(queue_path, name) not in self.delivered_paths
+        )
+
+    def __list_messages(self, queue: str) -> list:
+        try:
+            return sorted(
+                name
+                for name in os.listdir(self.__queue_path(queue))
+                if name.endswith(self.MESSAGE_SUFFIX)
+            )
+        except FileNotFoundError:
+            return []
+
+    def __write_message(
+        self, queue: str, routing_key: str, body: bytes, properties: BasicProperties
+    ) -> None:
+        """Grava a mensagem na fila: cabeçalho JSON (tamanho !I) seguido do corpo."""
+
+        header = json.dumps(
+            {
+                "routing_key": routing_key,
+                "content_type": properties.content_type,
+                "content_encoding": properties.content_encoding,
+                "headers": properties.headers,
+                "message_id": properties.message_id,
+                "delivery_mode": properties.delivery_mode,
+            }
+        ).encode()
+
+        self.sequence += 1
+        name = f"{time_ns():020d}_{os.getpid()}_{self.sequence:010d}"
+        queue_path = self.__queue_path(queue)
+        temp_path = os.path.join(queue_path, f"{name}.tmp")
+
+        with open(temp_path, "wb") as f:
+            f.write(struct.pack("!I", len(header)))
+            f.write(header)
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(temp_path, os.path.join(queue_path, f"{name}{self.MESSAGE_SUFFIX}"))
+
+    @staticmethod
+    def __read_message(path: str) -> Tuple[dict, bytes]:
+        with open(path, "rb") as f:
+            data = f.read()
+        (header_length,) = struct.unpack_from("!I", data, 0)
+        header = json.loads(data[4 : 4 + header_length])
+        return header, data[4 + header_length :]
+
+    def exchange_declare(self, exchange: str, **kwargs) -> None:
+        os.makedirs(self.__binding_path(exchange), exist_ok=True)
+
+    def exchange_delete(self, exchange: str, **kwargs) -> None:
+        shutil.rmtree(self.__binding_path(exchange), ignore_errors=True)
+
+    def queue_declare(
+        self,
+        queue: str,
+        durable: bool = True,
+        arguments: Optional[dict] = None,
+        passive: bool = False,
+        **kwargs,
+    ) -> SimpleNamespace:
+        queue_path = self.__queue_path(queue)
+        if not passive:
+            os.makedirs(queue_path, exist_ok=True)
+            with open(os.path.join(queue_path, "arguments.json"), "w") as f:
+                json.dump(arguments or {}, f)
+
+        return SimpleNamespace(
+            method=SimpleNamespace(
+                queue=queue,
+                message_count=self.__count_ready_messages(queue),
+                consumer_count=0,
+            )
+        )
+
+    def queue_bind(self, exchange: str, queue: str, routing_key: str = "") -> None:
+        binding_path = self.__binding_path(exchange, routing_key)
+        os.makedirs(binding_path, exist_ok=True)
+        open(os.path.join(binding_path, queue), "a").close()
+
+    def queue_delete(self, queue: str, **kwargs) -> None:
+        shutil.rmtree(self.__queue_path(queue), ignore_errors=True)
+
+    def basic_qos(self, prefetch_count: int = 0, **kwargs) -> None:
+        self.prefetch_count = prefetch_count
+
+    def basic_publish(
+        self,
+        exchange: str,
+        routing_key: str,
+        body: bytes,
+        properties: Optional[BasicProperties] = None,
+        **kwargs,
+    ) -> None:
+        """Grava a mensagem em cada fila vinculada; sem filas vinculadas ela é descartada."""
+
+        properties = properties or BasicProperties()
+        binding_path = self.__binding_path(exchange, routing_key)
+        queues = os.listdir(binding_path) if os.path.isdir(binding_path) else []
+
+        for queue in queues:
+            if os.path.isdir(self.__queue_path(queue)):
+                self.__write_message(queue, routing_key, body, properties)
+
+    def consume(
+        self,
+        queue: str,
+        auto_ack: bool = False,
+        inactivity_timeout: Optional[float] = None,
+    ) -> Iterator[Tuple[Basic.Deliver, BasicProperties, bytes]]:
+        """
+        Entrega as mensagens da fila em ordem de publicação.
+
+        Respeita prefetch_count (mensagens entregues sem confirmação) e, com
+        inactivity_timeout, entrega (None, None, None) quando a fila fica ociosa.
+        """
+
+        idle_since = time()
+        while self.connection.is_open:
+            delivered = False
+
+            for name in self.__list_messages(queue):
+                path = os.path.join(self.__queue_path(queue), name)
+                if path in self.delivered_paths:
+                    continue
+                if not auto_ack and self.prefetch_count and (
+                    len(self.unacked) >= self.prefetch_count
+                ):
+                    break
+
+                try:
+                    header, body = self.__read_message(path)
+                except FileNotFoundError:
+                    continue
+
+                self.delivery_tag += 1
+                if auto_ack:
+                    os.remove(path)
+                else:
+                    self.unacked[self.delivery_tag] = (queue, path)
+                    self.delivered_paths.add(path)
+
+                delivered = True
+                idle_since = time()
+                yield (
+                    Basic.Deliver(
+                        delivery_tag=self.delivery_tag,
+                        routing_key=header.pop("routing_key"),
+                    ),
+                    BasicProperties(**header),
+                    body,
+                )
+
+            if delivered:
+                continue
+
+            if inactivity_timeout is not None and (
+                time() - idle_since >= inactivity_timeout
+            ):
+                idle_since = time()
+                yield None, None, None
+                continue
+
+            sleep(self.POLL_INTERVAL_SECONDS)
+
+    def basic_consume(
+        self, queue: str, on_message_callback: Callable, auto_ack: bool = False
+    ) -> None:
+        self.consumers[queue] = (on_message_callback, auto_ack)
+
+    def start_consuming(self) -> None:
+        for queue, (on_message_callback, auto_ack) in self.consumers.items():
+            for method, properties, body in self.consume(queue, auto_ack=auto_ack):
+                on_message_callback(self, method, properties, body)
+
+    def __delivery_tags(self, delivery_tag: int, multiple: bool) -> list:
+        if multiple:
+            return sorted(tag for tag in self.unacked if tag <= delivery_tag)
+        return [delivery_tag] if delivery_tag in self.unacked else []
+
+    def basic_ack(self, delivery_tag: int = 0, multiple: bool = False) -> None:
+        for tag in self.__delivery_tags(delivery_tag, multiple):
+            _, path = self.unacked.pop(tag)
+            self.delivered_paths.discard(path)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def basic_nack(
+        self, delivery_tag: int = 0, multiple: bool = False, requeue: bool = True
+    ) -> None:
+        """Devolve as mensagens à fila ou, sem requeue, as encaminha à DLX da fila."""
+
+        for tag in self.__delivery_tags(delivery_tag, multiple):
+            queue, path = self.unacked.pop(tag)
+            self.delivered_paths.discard(path)
+            if requeue or not os.path.exists(path):
+                continue
+
+            arguments = self.__read_arguments(queue)
+            if arguments.get("x-dead-letter-exchange"):
+                header, body = self.__read_message(path)
+                header.pop("routing_key")
+                self.basic_publish(
+                    exchange=arguments["x-dead-letter-exchange"],
+                    routing_key=arguments.get("x-dead-letter-routing-key", ""),
+                    body=body,
+                    properties=BasicProperties(**header),
+                )
+            os.remove(path)
@@ -1,7 +1,10 @@
 from pika.adapters.blocking_connection import BlockingChannel
+from trempy.Messages.LocalTransport import LocalChannel
+from trempy.Shared.Types import TransportType
 import pika
+import time
 import os
-from typing import Optional
+from typing import List, Optional
 
 
 class Message:
@@ -17,8 +20,10 @@ class Message:
         host: Optional[str] = None,
         exchange_type: str = "direct",
         durable: bool = True,
+        transport: TransportType = TransportType.RABBITMQ,
     ):
         self.task_name = task_name
+        self.transport = TransportType(transport)
 
         self.dlx_exchange_name = self.DLX_EXCHANGE_NAME_PATTERN.format(
             task_name=task_name
@@ -39,6 +44,10 @@ class Message:
         self.__declare_exchange()
 
     def __create_connection(self) -> BlockingChannel:
+        # O transporte local expõe a mesma interface de canal, sem broker
+        if self.transport == TransportType.LOCAL:
+            return LocalChannel()
+
         connection_parameters = pika.ConnectionParameters(
             host=self.host, connection_attempts=5, retry_delay=3
         )
@@ -60,6 +69,84 @@ class Message:
             durable=self.durable,
         )
 
+    def get_routing_key(self, partition: Optional[int] = None) -> str:
+        """Retorna a routing key da partição informada (ou a routing key única da tarefa)."""
+        if partition is None:
+            return self.routing_key
+        return f"{self.routing_key}.{partition}"
+
+    def get_queue_depth(self, queue_names: List[str]) -> int:
+        """
+        Retorna a quantidade de mensagens prontas nas filas informadas.
+
+        Usa queue_declare passivo em um canal à parte, pois o broker fecha o canal
+        quando a fila ainda não existe; filas inexistentes contam como vazias.
+
+        Args:
+            queue_names (List[str]): Nomes das filas.
+
+        Returns:
+            int: Soma das mensagens nas filas.
+        """
+
+        self.reconnect()
+
+        queue_depth = 0
+        for queue_name in queue_names:
+            if self.transport == TransportType.LOCAL:
+                channel = self.channel
+            else:
+                channel = self.channel.connection.channel()
+
+            try:
+                queue_depth += channel.queue_declare(
+                    queue=queue_name, passive=True
+                ).method.message_count
+            except pika.exceptions.ChannelClosedByBroker:
+                continue
+            finally:
+                if channel is not self.channel and channel.is_open:
+                    channel.close()
+
+        return queue_depth
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Aguarda mantendo a conexão com o broker ativa (heartbeats).
+
+        Se a conexão cair durante a espera, o restante é aguardado sem broker e a
+        reconexão fica para o próximo uso (ver reconnect).
+        """
+        if self.transport == TransportType.LOCAL:
+            time.sleep(seconds)
+            return
+
+        deadline = time.time() + seconds
+        try:
+            self.channel.connection.sleep(seconds)
+        except pika.exceptions.AMQPError:
+            time.sleep(max(deadline - time.time(), 0))
+
+    def reconnect(self) -> bool:
+        """
+        Recria a conexão e o canal com o broker, se tiverem sido encerrados, e
+        redeclara as exchanges.
+
+        Returns:
+            bool: True se a conexão foi recriada.
+        """
+        if self.transport == TransportType.LOCAL or self.channel.is_open:
+            return False
+
+        self.channel = self.__create_connection()
+        self.__declare_dlx_exchange()
+        self.__declare_exchange()
+        return True
+
+    def close(self) -> None:
+        if self.channel.connection.is_open:
+            self.channel.connection.close()
+
     def delete_exchange(self) -> None:
         self.channel.exchange_delete(self.exchange_name, if_unused=False)
 
@@ -0,0 +1,123 @@
+from trempy.Messages.Exceptions.Exception import *
+from trempy.Messages.MessageCodec import MessageCodec
+from typing import Dict, Optional, Tuple
+import hashlib
+import json
+import mmap
+import os
+
+
+class MessageClaimCheck:
+    """
+    Responsabilidade: Armazenar lotes grandes fora do broker (claim-check).
+
+    O corpo do lote é gravado em um arquivo na área de staging e apenas um
+    ponteiro (caminho, checksum, tamanho e quantidade de linhas) é publicado. O
+    consumer lê o arquivo via memory map e o remove após a confirmação da
+    mensagem. Producer e consumer precisam compartilhar o sistema de arquivos.
+    """
+
+    CONTENT_TYPE = "application/vnd.trempy.claim-check+json"
+    FILE_NAME_PATTERN = "claim_{transaction_id}_{message_id}.bin"
+
+    @classmethod
+    def store(
+        cls,
+        body: bytes,
+        content_type: str,
+        content_encoding: Optional[str],
+        directory: str,
+        transaction_id: str,
+        message_id: str,
+        rows: int,
+    ) -> bytes:
+        """
+        Grava o corpo do lote em disco e retorna o ponteiro a ser publicado.
+
+        O arquivo é gravado de forma atômica (arquivo temporário + rename), para que
+        o consumer nunca leia um lote incompleto.
+
+        Args:
+            body (bytes): Corpo serializado (e possivelmente comprimido) do lote.
+            content_type (str): content_type do corpo.
+            content_encoding (str): Compressão aplicada ao corpo (opcional).
+            directory (str): Área de staging.
+            transaction_id (str): Identificador da transação.
+            message_id (str): Identificador da mensagem.
+            rows (int): Quantidade de operações do lote.
+
+        Returns:
+            bytes: Ponteiro serializado em JSON.
+        """
+
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(
+            directory,
+            cls.FILE_NAME_PATTERN.format(
+                transaction_id=transaction_id, message_id=message_id
+            ),
+        )
+
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f"{path}.tmp", path)
+
+        return json.dumps(
+            {
+                "path": path,
+                "sha256": hashlib.sha256(body).hexdigest(),
+                "size": len(body),
+                "rows": rows,
+                "content_type": content_type,
+                "content_encoding": content_encoding,
+            }
+        ).encode()
+
+    @staticmethod
+    def load(pointer_body: bytes, headers: Dict) -> Tuple[Dict, str]:
+        """
+        Lê o lote referenciado pelo ponteiro, via memory map.
+
+        Args:
+            pointer_body (bytes): Ponteiro publicado pelo producer.
+            headers (Dict): Headers da mensagem.
+
+        Returns:
+            Tuple[Dict, str]: Lote desserializado e o caminho do arquivo.
+
+        Raises:
+            MessageCodecException: Se o arquivo não existir ou o checksum não conferir.
+        """
+
+        pointer = json.loads(pointer_body)
+        path = pointer["path"]
+
+        try:
+            with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                if hashlib.sha256(mapped).hexdigest() != pointer["sha256"]:
+                    raise MessageCodecException(f"Checksum inválido no arquivo {path}")
+
+                if pointer.get("content_encoding"):
+                    body = MessageCodec.decompress(
+                        mapped[:], pointer["content_encoding"]
+                    )
+                    message = MessageCodec.decode(body, pointer["content_type"], headers)
+                else:
+                    with memoryview(mapped) as view:
+                        message = MessageCodec.decode(
+                            view, pointer["content_type"], headers
+                        )
+        except FileNotFoundError:
+            raise MessageCodecException(f"Arquivo do lote não encontrado: {path}")
+
+        return message, path
+
+    @staticmethod
+    def release(path: Optional[str]) -> None:
+        """Remove o arquivo de um lote já confirmado."""
+        if path and os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,240 @@
+from trempy.Messages.Exceptions.Exception import *
+from trempy.Shared.Types import CompressionType, MessageFormatType
+from typing import Dict, Optional, Tuple
+import importlib.util
+import polars as pl
+import struct
+import gzip
+import json
+import io
+
+
+class MessageCodec:
+    """Responsabilidade: Serializar e desserializar os lotes de CDC publicados no broker."""
+
+    CONTENT_TYPES = {
+        MessageFormatType.JSON: "application/json",
+        MessageFormatType.COMPACT_JSON: "application/vnd.trempy.compact+json",
+        MessageFormatType.ARROW: "application/vnd.apache.arrow.stream",
+    }
+
+    VERSIONS = {
+        MessageFormatType.JSON: "1.1.0",
+        MessageFormatType.COMPACT_JSON: "1.2.0",
+        MessageFormatType.ARROW: "2.0.0",
+    }
+
+    COMPRESSION_PACKAGES = {
+        CompressionType.ZSTD: "zstandard",
+        CompressionType.LZ4: "lz4",
+    }
+
+    @classmethod
+    def get_missing_compression_package(
+        cls, compression: CompressionType
+    ) -> Optional[str]:
+        """
+        Retorna o pacote opcional exigido pela compressão que não está instalado.
+
+        Args:
+            compression (CompressionType): Algoritmo de compressão.
+
+        Returns:
+            Optional[str]: Nome do pacote ausente, ou None se a compressão está disponível.
+        """
+
+        package = cls.COMPRESSION_PACKAGES.get(CompressionType(compression))
+        if package is None or importlib.util.find_spec(package) is not None:
+            return None
+        return package
+
+    @staticmethod
+    def compress(
+        body: bytes,
+        compression: CompressionType,
+        level: Optional[int] = None,
+        min_size_bytes: int = 0,
+    ) -> Tuple[bytes, Optional[str]]:
+        """
+        Comprime o corpo da mensagem, caso seja maior que min_size_bytes.
+
+        zstd e lz4 são dependências opcionais (pacotes zstandard e lz4), importadas
+        apenas quando utilizadas.
+
+        Args:
+            body (bytes): Corpo serializado da mensagem.
+            compression (CompressionType): Algoritmo de compressão.
+            level (int): Nível de compressão (opcional, padrão de cada algoritmo).
+            min_size_bytes (int): Tamanho mínimo para aplicar a compressão.
+
+        Returns:
+            Tuple[bytes, Optional[str]]: Corpo (comprimido ou não) e o content_encoding.
+        """
+
+        compression = CompressionType(compression)
+
+        if compression == CompressionType.NONE or len(body) < (min_size_bytes or 0):
+            return body, None
+
+        try:
+            match compression:
+                case CompressionType.GZIP:
+                    body = gzip.compress(body, compresslevel=level or 6)
+                case CompressionType.ZSTD:
+                    import zstandard
+
+                    body = zstandard.ZstdCompressor(level=level or 3).compress(body)
+                case CompressionType.LZ4:
+                    import lz4.frame
+
+                    body = lz4.frame.compress(body, compression_level=level or 0)
+        except ImportError as e:
+            raise MessageCodecException(
+                f"Compressão {compression.value} requer o pacote {e.name}"
+            )
+
+        return body, compression.value
+
+    @staticmethod
+    def decompress(body: bytes, content_encoding: Optional[str]) -> bytes:
+        """
+        Descomprime o corpo da mensagem de acordo com o content_encoding.
+
+        Args:
+            body (bytes): Corpo recebido do broker.
+            content_encoding (str): Algoritmo informado pelo producer (ausente = sem compressão).
+
+        Returns:
+            bytes: Corpo descomprimido.
+        """
+
+        if not content_encoding:
+            return body
+
+        try:
+            match CompressionType(content_encoding):
+                case CompressionType.GZIP:
+                    return gzip.decompress(body)
+                case CompressionType.ZSTD:
+                    import zstandard
+
+                    return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+                case CompressionType.LZ4:
+                    import lz4.frame
+
+                    return lz4.frame.decompress(body)
+                case _:
+                    return body
+        except ValueError:
+            raise MessageCodecException(
+                f"content_encoding não suportado: {content_encoding}"
+            )
+        except ImportError as e:
+            raise MessageCodecException(
+                f"Descompressão {content_encoding} requer o pacote {e.name}"
+            )
+
+    @classmethod
+    def get_format(cls, content_type: str) -> MessageFormatType:
+        """Retorna o formato correspondente ao content_type da mensagem."""
+        for message_format, format_content_type in cls.CONTENT_TYPES.items():
+            if format_content_type == content_type:
+                return message_format
+
+        raise MessageCodecException(f"content_type não suportado: {content_type}")
+
+    @classmethod
+    def encode(cls, batch: Dict, message_format: MessageFormatType) -> Tuple[bytes, Dict]:
+        """
+        Serializa um lote de alterações.
+
+        Nos formatos JSON e JSON compacto o lote é serializado integralmente. No formato Arrow, o lote
+        deve conter "tables" (DataFrames tipados por tabela, com as colunas
+        $TREM_ROWNUM e $TREM_OPERATION); cada tabela é gravada como um stream Arrow
+        IPC precedido do seu identificador, e batch_page/batch_size seguem nos headers.
+
+        Args:
+            batch (Dict): Lote gerado por structure_capture_changes_to_json.
+            message_format (MessageFormatType): Formato da mensagem.
+
+        Returns:
+            Tuple[bytes, Dict]: Corpo da mensagem e propriedades (content_type e headers).
+        """
+
+        properties = {
+            "content_type": cls.CONTENT_TYPES[message_format],
+            "headers": {
+                "version": cls.VERSIONS[message_format],
+                "batch_page": batch.get("batch_page"),
+                "batch_size": batch.get("batch_size"),
+            },
+        }
+
+        if message_format == MessageFormatType.ARROW:
+            return cls.__encode_arrow(batch["tables"]), properties
+
+        return json.dumps(batch).encode(), properties
+
+    @classmethod
+    def decode(cls, body: bytes, content_type: str, headers: Dict) -> Dict:
+        """
+        Desserializa um lote de alterações de acordo com o content_type.
+
+        Args:
+            body (bytes): Corpo da mensagem.
+            content_type (str): content_type da mensagem (ausente equivale a JSON).
+            headers (Dict): Headers da mensagem.
+
+        Returns:
+            Dict: Lote com batch_page, batch_size e "operations" (JSON),
+                "compact_tables" (JSON compacto) ou "tables" (Arrow).
+        """
+
+        message_format = cls.get_format(
+            content_type or cls.CONTENT_TYPES[MessageFormatType.JSON]
+        )
+
+        if message_format == MessageFormatType.ARROW:
+            return {
+                "batch_page": headers.get("batch_page"),
+                "batch_size": headers.get("batch_size"),
+                "tables": cls.__decode_arrow(body),
+            }
+
+        return json.loads(bytes(body))
+
+    @staticmethod
+    def __encode_arrow(tables: Dict[str, pl.DataFrame]) -> bytes:
+        buffer = io.BytesIO()
+        for table_id, df in tables.items():
+            table_ipc = io.BytesIO()
+            df.write_ipc_stream(table_ipc)
+            table_id = table_id.encode()
+
+            buffer.write(struct.pack("!I", len(table_id)))
+            buffer.write(table_id)
+            buffer.write(struct.pack("!Q", table_ipc.getbuffer().nbytes))
+            buffer.write(table_ipc.getbuffer())
+
+        return buffer.getvalue()
+
+    @staticmethod
+    def __decode_arrow(body: bytes) -> Dict[str, pl.DataFrame]:
+        view = memoryview(body)
+        tables = {}
+        offset = 0
+
+        while offset < len(view):
+            (id_size,) = struct.unpack_from("!I", view, offset)
+            offset += 4
+            table_id = bytes(view[offset : offset + id_size]).decode()
+            offset += id_size
+
+            (ipc_size,) = struct.unpack_from("!Q", view, offset)
+            offset += 8
+            tables[table_id] = pl.read_ipc_stream(
+                io.BytesIO(view[offset : offset + ipc_size])
+            )
+            offset += ipc_size
+
+        return tables
@@ -3,15 +3,33 @@ from pika.adapters.blocking_connection import BlockingChannel
 from trempy.Loggings.Logging import ReplicationLogger
 from trempy.Messages.Exceptions.Exception import *
 from pika.spec import Basic, BasicProperties
+from trempy.Messages.MessageClaimCheck import MessageClaimCheck
+from trempy.Messages.MessageCodec import MessageCodec
 from trempy.Messages.Message import Message
-from typing import Callable
-import json
+from trempy.Shared.Types import TransportType
+from typing import Callable, Dict, List, Optional
+from time import time
 
 logger = ReplicationLogger()
 
 
 class MessageConsumer(Message):
     QUEUE_NAME_PATTERN = "trempy_queue_{task_name}"
+    PARTITION_QUEUE_NAME_PATTERN = "trempy_queue_{task_name}_{partition}"
+
+    IDLE_TIMEOUT_SECONDS = 0.1
+
+    @classmethod
+    def get_queue_names(cls, task_name: str, partitions: int = 1) -> List[str]:
+        """Retorna os nomes das filas consumidas pela tarefa (uma por partição)."""
+        if partitions <= 1:
+            return [cls.QUEUE_NAME_PATTERN.format(task_name=task_name)]
+        return [
+            cls.PARTITION_QUEUE_NAME_PATTERN.format(
+                task_name=task_name, partition=partition
+            )
+            for partition in range(partitions)
+        ]
 
     def __init__(
         self,
@@ -19,12 +37,50 @@ class MessageConsumer(Message):
         external_callback: Callable,
         prefetch_count: int = 1,
         auto_ack: bool = False,
+        batch_max_messages: int = 1,
+        batch_max_bytes: Optional[int] = None,
+        batch_max_wait_seconds: float = 1.0,
+        partition: Optional[int] = None,
+        transport: TransportType = TransportType.RABBITMQ,
     ):
-        super().__init__(task_name=task_name)
+        """
+        Inicializa o consumidor.
+
+        Com batch_max_messages maior que 1, o consumidor opera em micro-lotes:
+        external_callback recebe uma lista de mensagens (na ordem de entrega) e é
+        responsável por confirmá-las com basic_ack(multiple=True). O lote é entregue
+        ao atingir batch_max_messages mensagens, batch_max_bytes bytes ou
+        batch_max_wait_seconds desde a primeira mensagem do lote.
+
+        Args:
+            task_name (str): Nome da tarefa.
+            external_callback (Callable): Função chamada com (mensagem, canal) ou,
+                em micro-lotes, com (lista de mensagens, canal).
+            prefetch_count (int): Quantidade de mensagens entregues sem confirmação;
+                em micro-lotes é no mínimo batch_max_messages.
+            auto_ack (bool): Se True, o broker considera a mensagem confirmada na entrega.
+            batch_max_messages (int): Quantidade máxima de mensagens por lote.
+            batch_max_bytes (int): Tamanho máximo do lote em bytes (opcional).
+            batch_max_wait_seconds (float): Tempo máximo de espera de um lote incompleto.
+            partition (int): Partição consumida; cada partição tem a sua fila,
+                vinculada à routing key da partição (opcional).
+            transport (TransportType): Transporte das mensagens (RabbitMQ ou local).
+        """
+        super().__init__(task_name=task_name, transport=transport)
+
+        self.partition = partition
+        if partition is None:
+            self.queue_name = self.QUEUE_NAME_PATTERN.format(task_name=task_name)
+        else:
+            self.queue_name = self.PARTITION_QUEUE_NAME_PATTERN.format(
+                task_name=task_name, partition=partition
+            )
 
-        self.queue_name = self.QUEUE_NAME_PATTERN.format(task_name=task_name)
+        self.batch_max_messages = max(batch_max_messages or 1, 1)
+        self.batch_max_bytes = batch_max_bytes
+        self.batch_max_wait_seconds = batch_max_wait_seconds
 
-        self.prefetch_count = prefetch_count
+        self.prefetch_count = max(prefetch_count, self.batch_max_messages)
         self.auto_ack = auto_ack
         self.external_callback = external_callback
 
@@ -49,19 +105,20 @@ class MessageConsumer(Message):
             self.channel.queue_bind(
                 exchange=self.exchange_name,
                 queue=self.queue_name,
-                routing_key=self.routing_key,
+                routing_key=self.get_routing_key(self.partition),
             )
 
             # Configura qualidade de serviço (QoS):
             # prefetch_count=1 -> Processa 1 mensagem por vez
             self.channel.basic_qos(prefetch_count=self.prefetch_count)
 
-            # Inicia o consumo da fila
-            self.channel.basic_consume(
-                queue=self.queue_name,
-                auto_ack=self.auto_ack,
-                on_message_callback=self.__callback,
-            )
+            # Em micro-lotes o consumo é feito por __consume_batches
+            if self.batch_max_messages == 1:
+                self.channel.basic_consume(
+                    queue=self.queue_name,
+                    auto_ack=self.auto_ack,
+                    on_message_callback=self.__callback,
+                )
 
         except Exception as e:
             e = MessageConsumerException(
@@ -74,6 +131,44 @@ class MessageConsumer(Message):
             queue=self.queue_name, if_unused=False, if_empty=False
         )
 
+    def __decode_message(
+        self, method: Basic.Deliver, properties: BasicProperties, body: bytes
+    ) -> Dict:
+        """
+        Decodifica a mensagem recebida e registra a estatística de recebimento.
+
+        Para ponteiros claim-check, o lote é lido do arquivo referenciado e o caminho
+        fica em claim_check_path, para remoção após a confirmação.
+        """
+
+        with MetadataConnectionManager() as metadata_manager:
+            if properties.content_type == MessageClaimCheck.CONTENT_TYPE:
+                message, claim_check_path = MessageClaimCheck.load(
+                    body, properties.headers or {}
+                )
+                message["claim_check_path"] = claim_check_path
+            else:
+                message: dict = MessageCodec.decode(
+                    MessageCodec.decompress(body, properties.content_encoding),
+                    properties.content_type,
+                    properties.headers or {},
+                )
+            metadata_manager.update_stats_message(
+                {
+                    "transaction_id": properties.headers.get("transaction_id"),
+                    "column": "received",
+                    "value": message.get("batch_size"),
+                }
+            )
+            # logger.info(
+            #     f"MESSAGE - Recebido: ({method.delivery_tag}): {properties.headers.get('transaction_id')}/{properties.message_id}"
+            # )
+
+        message["delivery_tag"] = method.delivery_tag
+        message["transaction_id"] = properties.headers.get("transaction_id")
+
+        return message
+
     def __callback(
         self,
         ch: BlockingChannel,
@@ -83,29 +178,71 @@ class MessageConsumer(Message):
     ) -> None:
 
         try:
-            with MetadataConnectionManager() as metadata_manager:
-                message: dict = json.loads(body.decode())
-                metadata_manager.update_stats_message(
-                    {
-                        "transaction_id": properties.headers.get("transaction_id"),
-                        "column": "received",
-                        "value": message.get("batch_size"),
-                    }
-                )
-                # logger.info(
-                #     f"MESSAGE - Recebido: ({method.delivery_tag}): {properties.headers.get('transaction_id')}/{properties.message_id}"
-                # )
+            message = self.__decode_message(method, properties, body)
 
-                message["delivery_tag"] = method.delivery_tag
-                message["transaction_id"] = properties.headers.get("transaction_id")
-
-                if self.external_callback:
-                    self.external_callback(message, ch)
+            if self.external_callback:
+                self.external_callback(message, ch)
 
         except Exception as e:
             e = MessageConsumerException(f"Erro ao processar mensagem: {str(e)}")
             logger.error(e)
 
+    def __consume_batches(self) -> None:
+        """
+        Consome a fila em micro-lotes.
+
+        As mensagens são acumuladas até um dos limites do lote ser atingido; a
+        checagem de tempo também ocorre com a fila ociosa (a cada
+        IDLE_TIMEOUT_SECONDS), limitando a latência de um lote incompleto.
+        Mensagens que não puderem ser decodificadas são rejeitadas
+        individualmente (DLX), para não serem confirmadas junto com o lote.
+        """
+
+        batch: List[Dict] = []
+        batch_bytes = 0
+        batch_started_at = 0.0
+
+        for method, properties, body in self.channel.consume(
+            queue=self.queue_name,
+            auto_ack=self.auto_ack,
+            inactivity_timeout=min(
+                self.batch_max_wait_seconds, self.IDLE_TIMEOUT_SECONDS
+            ),
+        ):
+            if method is not None:
+                try:
+                    message = self.__decode_message(method, properties, body)
+                    if not batch:
+                        batch_started_at = time()
+                    batch.append(message)
+                    batch_bytes += len(body)
+                except Exception as e:
+                    e = MessageConsumerException(
+                        f"Erro ao processar mensagem: {str(e)}"
+                    )
+                    logger.error(e)
+                    if not self.auto_ack:
+                        self.channel.basic_nack(
+                            delivery_tag=method.delivery_tag, requeue=False
+                        )
+
+            if not batch:
+                continue
+
+            if (
+                len(batch) >= self.batch_max_messages
+                or (self.batch_max_bytes and batch_bytes >= self.batch_max_bytes)
+                or time() - batch_started_at >= self.batch_max_wait_seconds
+            ):
+                if self.external_callback:
+                    self.external_callback(batch, self.channel)
+                batch = []
+                batch_bytes = 0
+
     def start_consuming(self):
         logger.info(f"MESSAGE - Consumer Esperando por mensagens")
-        self.channel.start_consuming()
+
+        if self.batch_max_messages > 1:
+            self.__consume_batches()
+        else:
+            self.channel.start_consuming()
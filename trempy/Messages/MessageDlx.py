@@ -3,7 +3,10 @@ from pika.adapters.blocking_connection import BlockingChannel
 from trempy.Loggings.Logging import ReplicationLogger
 from trempy.Messages.Exceptions.Exception import *
 from pika.spec import Basic, BasicProperties
+from trempy.Messages.MessageClaimCheck import MessageClaimCheck
 from trempy.Messages.Message import Message
+from trempy.Shared.Types import TransportType
+import base64
 import time
 import json
 import os
@@ -18,8 +21,9 @@ class MessageDlx(Message):
         self,
         task_name: str,
         prefetch_count: int = 1,
+        transport: TransportType = TransportType.RABBITMQ,
     ):
-        super().__init__(task_name=task_name)
+        super().__init__(task_name=task_name, transport=transport)
         self.prefetch_count = prefetch_count
         self.dlx_queue_name = self.DLX_QUEUE_NAME_PATTERN.format(task_name=task_name)
         self.__setup()
@@ -63,7 +67,16 @@ class MessageDlx(Message):
     ) -> None:
 
         logger.info(f"MESSAGE DLX - Processando mensagem falha ({method.delivery_tag})")
-        message = body.decode()
+        # Corpos binários (ex: Arrow ou comprimidos) são armazenados em base64; o
+        # ponteiro claim-check é JSON e o arquivo do lote é mantido para reprocessamento
+        if (
+            properties.content_type
+            in (None, "application/json", MessageClaimCheck.CONTENT_TYPE)
+            and not properties.content_encoding
+        ):
+            message = body.decode()
+        else:
+            message = f"base64:{base64.b64encode(body).decode()}"
 
         try:
             with MetadataConnectionManager() as metadata_manager:
@@ -1,22 +1,195 @@
 from trempy.Metadata.MetadataConnectionManager import MetadataConnectionManager
 from trempy.Loggings.Logging import ReplicationLogger
 from trempy.Messages.Exceptions.Exception import *
+from trempy.Messages.MessageClaimCheck import MessageClaimCheck
+from trempy.Messages.MessageCodec import MessageCodec
+from trempy.Shared.Types import CompressionType, MessageFormatType, TransportType
 from trempy.Messages.Message import Message
 from trempy.Shared.Utils import Utils
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+from pika.spec import Basic
 import time
-import json
 import pika
 
 logger = ReplicationLogger()
 
 
 class MessageProducer(Message):
-    def __init__(self, task_name: str):
-        super().__init__(task_name=task_name)
+    def __init__(
+        self,
+        task_name: str,
+        message_format: MessageFormatType = MessageFormatType.JSON,
+        compression: CompressionType = CompressionType.NONE,
+        compression_level: Optional[int] = None,
+        compression_min_bytes: int = 0,
+        publisher_confirms: bool = False,
+        publish_window: int = 256,
+        transport: TransportType = TransportType.RABBITMQ,
+        claim_check_threshold_bytes: Optional[int] = None,
+        claim_check_path: Optional[str] = None,
+    ):
+        super().__init__(task_name=task_name, transport=transport)
+        self.message_format = MessageFormatType(message_format)
+        self.compression = CompressionType(compression)
+        self.compression_level = compression_level
+        self.compression_min_bytes = compression_min_bytes
+        self.publisher_confirms = publisher_confirms
+        self.publish_window = max(publish_window, 1)
+        self.claim_check_threshold_bytes = claim_check_threshold_bytes
+        self.claim_check_path = claim_check_path
+
+        self.outstanding_confirms: Dict[int, int] = {}
+        self.confirmed_batch_sizes: List[int] = []
+        self.nacked_delivery_tags: List[int] = []
+        self.delivery_tag = 0
+
+        # No transporte local a publicação já é síncrona e durável (fsync)
+        if self.publisher_confirms and self.transport == TransportType.RABBITMQ:
+            self.__enable_confirms()
+
+    def reconnect(self) -> bool:
+        """Recria a conexão encerrada pelo broker, reativando as confirmações no novo canal."""
+        reconnected = super().reconnect()
+        if reconnected:
+            logger.warning("MESSAGE - Conexão com o broker encerrada, reconectado")
+            if self.publisher_confirms:
+                self.__enable_confirms()
+        return reconnected
+
+    def __enable_confirms(self) -> None:
+        """
+        Ativa o modo de confirmação (Confirm.Select) no canal atual, com as
+        confirmações tratadas de forma assíncrona.
+
+        O confirm_delivery do BlockingChannel aguardaria o ack de cada publicação
+        antes da próxima; por isso o modo é ativado no canal assíncrono subjacente e
+        os acks/nacks chegam por __on_delivery_confirmation enquanto a conexão
+        processa eventos. As delivery tags recomeçam em 1 a cada canal.
+        """
+        self.outstanding_confirms = {}
+        self.confirmed_batch_sizes = []
+        self.nacked_delivery_tags = []
+        self.delivery_tag = 0
+
+        select_ok = []
+        self.channel._impl.confirm_delivery(
+            ack_nack_callback=self.__on_delivery_confirmation,
+            callback=select_ok.append,
+        )
+        while not select_ok:
+            self.channel.connection.process_data_events(time_limit=1)
+
+    def __on_delivery_confirmation(self, frame: pika.frame.Method) -> None:
+        """Registra um ack/nack do broker (com multiple=True, todas as tags até a informada)."""
+        method = frame.method
+
+        if method.multiple:
+            delivery_tags = [
+                tag for tag in self.outstanding_confirms if tag <= method.delivery_tag
+            ]
+        else:
+            delivery_tags = [method.delivery_tag]
+
+        for tag in delivery_tags:
+            if tag not in self.outstanding_confirms:
+                continue
+            batch_size = self.outstanding_confirms.pop(tag)
+            if isinstance(method, Basic.Nack):
+                self.nacked_delivery_tags.append(tag)
+            else:
+                self.confirmed_batch_sizes.append(batch_size)
+
+    def __wait_for_confirms(
+        self,
+        max_outstanding: int,
+        transaction_id: str,
+        metadata_manager: MetadataConnectionManager,
+    ) -> None:
+        """
+        Processa eventos da conexão até restarem no máximo max_outstanding
+        publicações sem confirmação, registrando os lotes confirmados.
+
+        Raises:
+            MessageProducerException: Se algum lote for rejeitado (nack) pelo broker.
+        """
+        while (
+            len(self.outstanding_confirms) > max_outstanding
+            and not self.nacked_delivery_tags
+        ):
+            self.channel.connection.process_data_events(time_limit=1)
+
+        if self.nacked_delivery_tags:
+            raise MessageProducerException(
+                f"{len(self.nacked_delivery_tags)} lotes rejeitados pelo broker (nack)"
+            )
+
+        for batch_size in self.confirmed_batch_sizes:
+            metadata_manager.update_stats_message(
+                {
+                    "transaction_id": transaction_id,
+                    "column": "published",
+                    "value": batch_size,
+                }
+            )
+        self.confirmed_batch_sizes = []
+
+    def __build_message(
+        self, message: Dict, transaction_id: str
+    ) -> Tuple[bytes, pika.BasicProperties]:
+        body, properties = MessageCodec.encode(message, self.message_format)
+        body, content_encoding = MessageCodec.compress(
+            body,
+            self.compression,
+            self.compression_level,
+            self.compression_min_bytes,
+        )
+        content_type = properties["content_type"]
+        message_id = Utils.hash_6_chars()
+
+        # Lotes grandes vão para a área de staging; o broker recebe só o ponteiro
+        if (
+            self.claim_check_threshold_bytes
+            and len(body) >= self.claim_check_threshold_bytes
+        ):
+            body = MessageClaimCheck.store(
+                body,
+                content_type,
+                content_encoding,
+                self.claim_check_path,
+                transaction_id,
+                message_id,
+                message.get("batch_size"),
+            )
+            content_type = MessageClaimCheck.CONTENT_TYPE
+            content_encoding = None
+
+        return body, pika.BasicProperties(
+            delivery_mode=2,  # Persistente (sobrevive a reinicializações)
+            content_type=content_type,
+            content_encoding=content_encoding,
+            headers={
+                **properties["headers"],
+                "transaction_id": transaction_id,
+                "timestamp": int(time.time()),
+            },
+            message_id=message_id,
+        )
 
     def publish_message(self, messages: Dict) -> None:
+        """
+        Publica os lotes de uma captura.
+
+        Com publisher_confirms, mantém até publish_window publicações pendentes de
+        confirmação e só retorna quando todos os lotes forem confirmados pelo broker;
+        o slot é avançado (confirm_changes) somente depois disso.
+        """
         try:
+            self.reconnect()
+            confirms = (
+                self.publisher_confirms and self.transport == TransportType.RABBITMQ
+            )
+            transaction_id = messages.get("transaction_id")
+
             with MetadataConnectionManager() as metadata_manager:
                 metadata_manager.insert_stats_message(
                     {
@@ -27,36 +200,41 @@ class MessageProducer(Message):
                 )
 
                 for message in messages["changes"]:
-                    message_id = Utils.hash_6_chars()
-                    message_dumps = json.dumps(message)
+                    body, properties = self.__build_message(message, transaction_id)
+
+                    if confirms:
+                        self.__wait_for_confirms(
+                            self.publish_window - 1, transaction_id, metadata_manager
+                        )
 
                     self.channel.basic_publish(
                         exchange=self.exchange_name,
-                        routing_key=self.routing_key,
-                        body=message_dumps,
-                        properties=pika.BasicProperties(
-                            delivery_mode=2,  # Persistente (sobrevive a reinicializações)
-                            content_type="application/json",
-                            headers={
-                                "version": "1.1.0",
-                                "transaction_id": messages.get("transaction_id"),
-                                "timestamp": int(time.time()),
-                            },
-                            message_id=message_id,
-                        ),
+                        routing_key=self.get_routing_key(message.get("partition")),
+                        body=body,
+                        properties=properties,
                     )
 
+                    if confirms:
+                        self.delivery_tag += 1
+                        self.outstanding_confirms[self.delivery_tag] = message.get(
+                            "batch_size"
+                        )
+                        continue
+
                     metadata_manager.update_stats_message(
                         {
-                            "transaction_id": messages.get("transaction_id"),
+                            "transaction_id": transaction_id,
                             "column": "published",
                             "value": message.get("batch_size"),
                         }
                     )
                     # logger.info(
-                    #     f"MESSAGE - Publicado: {messages.get('transaction_id')}/{message_id}"
+                    #     f"MESSAGE - Publicado: {properties.headers.get('transaction_id')}/{properties.message_id}"
                     # )
 
+                if confirms:
+                    self.__wait_for_confirms(0, transaction_id, metadata_manager)
+
         except Exception as e:
             e = MessageProducerException(f"Erro ao publicar mensagem: {str(e)}")
             logger.critical(e)
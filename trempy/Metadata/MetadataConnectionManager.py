@@ -81,6 +81,28 @@ class MetadataConnectionManager:
             ],
             "verify_schema": True,
         },
+        "stats_replication_lag": {
+            "schema": [
+                "task_name",
+                "slot_name",
+                "lag_bytes",
+                "lag_seconds",
+                "retained_wal_bytes",
+                "captured_changes",
+                "capture_duration",
+            ],
+            "verify_schema": True,
+        },
+        "stats_backpressure": {
+            "schema": [
+                "task_name",
+                "queue_messages",
+                "threshold",
+                "action",
+                "wait_seconds",
+            ],
+            "verify_schema": True,
+        },
         "metadata_table": {
             "schema": [],
             "verify_schema": False,
@@ -109,6 +131,8 @@ class MetadataConnectionManager:
             cursor.execute(Query.SQL_CREATE_STATS_MESSAGE)
             cursor.execute(Query.SQL_CREATE_DLX_MESSAGE)
             cursor.execute(Query.SQL_CREATE_APPLY_EXCEPTIONS)
+            cursor.execute(Query.SQL_CREATE_STATS_REPLICATION_LAG)
+            cursor.execute(Query.SQL_CREATE_STATS_BACKPRESSURE)
 
             self.connection.commit()
         except Exception as e:
@@ -192,6 +216,20 @@ class MetadataConnectionManager:
         except InsertMetadataError as e:
             logger.critical(e)
 
+    def insert_stats_replication_lag(self, data: Dict, **kwargs) -> None:
+        """Insere dados na tabela stats_replication_lag."""
+        try:
+            self.__insert_data("stats_replication_lag", {**data, **kwargs})
+        except InsertMetadataError as e:
+            logger.critical(e)
+
+    def insert_stats_backpressure(self, data: Dict, **kwargs) -> None:
+        """Insere dados na tabela stats_backpressure."""
+        try:
+            self.__insert_data("stats_backpressure", {**data, **kwargs})
+        except InsertMetadataError as e:
+            logger.critical(e)
+
     def update_stats_message(self, data: Dict, **kwargs) -> None:
         """Atualiza dados na tabela stats_message."""
         try:
@@ -199,17 +237,11 @@ class MetadataConnectionManager:
             column_set = data.get("column")
             value_set = data.get("value")
 
+            # Incremento atômico: vários consumers podem atualizar a mesma transação
             cursor = self.connection.cursor()
-            current_value = cursor.execute(
-                Query.SQL_GET_STATS_MESSAGE.format(column=column_set),
-                (data["transaction_id"],),
-            ).fetchone()[0]
-
             cursor.execute(
-                Query.SQL_UPDATE_STATS_MESSSAGE.format(
-                    column_set=column_set, value_set=current_value + value_set
-                ),
-                (data["transaction_id"],),
+                Query.SQL_UPDATE_STATS_MESSSAGE.format(column_set=column_set),
+                (value_set, data["transaction_id"]),
             )
             self.connection.commit()
         except InsertMetadataError as e:
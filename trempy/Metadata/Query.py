@@ -80,6 +80,30 @@ class Query:
         )
     """
 
+    SQL_CREATE_STATS_REPLICATION_LAG = """
+        CREATE TABLE IF NOT EXISTS stats_replication_lag (
+            task_name          TEXT,
+            slot_name          TEXT,
+            lag_bytes          INTEGER,
+            lag_seconds        REAL,
+            retained_wal_bytes INTEGER,
+            captured_changes   INTEGER,
+            capture_duration   REAL,
+            created_at         TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """
+
+    SQL_CREATE_STATS_BACKPRESSURE = """
+        CREATE TABLE IF NOT EXISTS stats_backpressure (
+            task_name      TEXT,
+            queue_messages INTEGER,
+            threshold      INTEGER,
+            action         TEXT,
+            wait_seconds   REAL,
+            created_at     TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """
+
     SQL_INSERT_STATS_CDC = """
         INSERT INTO stats_cdc 
         (task_name, schema_name, table_name, inserts, updates, deletes, errors, total)
@@ -115,9 +139,20 @@ class Query:
         (schema_name, table_name, message, type, code, query)
         VALUES (?, ?, ?, ?, ?, ?)
         """
+
+    SQL_INSERT_STATS_REPLICATION_LAG = """
+        INSERT INTO stats_replication_lag
+        (task_name, slot_name, lag_bytes, lag_seconds, retained_wal_bytes, captured_changes, capture_duration)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """
+    SQL_INSERT_STATS_BACKPRESSURE = """
+        INSERT INTO stats_backpressure
+        (task_name, queue_messages, threshold, action, wait_seconds)
+        VALUES (?, ?, ?, ?, ?)
+        """
     SQL_UPDATE_STATS_MESSSAGE = """
         UPDATE stats_message
-           SET {column_set} = {value_set}
+           SET {column_set} = COALESCE({column_set}, 0) + ?
          WHERE transaction_id = ?
     """
 
@@ -126,12 +161,6 @@ class Query:
         VALUES (?, ?);
         """
 
-    SQL_GET_STATS_MESSAGE = """
-        SELECT COALESCE({column}, 0)
-        FROM stats_message
-        WHERE transaction_id = ?
-    """
-
     SQL_GET_METADATA_CONFIG = """
         SELECT MAX(value)
         FROM metadata_table
@@ -63,7 +63,12 @@ class ReplicationManager:
             with MetadataConnectionManager() as metadata_manager:
                 metadata_manager.create_tables()
             if start_mode == "reload":
-                strategy.reload_task(task_name)
+                cdc_settings = task_settings["task"].get("cdc_settings", {})
+                strategy.reload_task(
+                    task_name,
+                    cdc_settings.get("consumer_partitions", 1),
+                    cdc_settings.get("transport", "rabbitmq"),
+                )
 
             strategy.execute(task_settings)
         except Exception as e:
@@ -0,0 +1,54 @@
+from trempy.Loggings.Logging import ReplicationLogger
+
+logger = ReplicationLogger()
+
+
+class AdaptiveScheduler:
+    """
+    Calcula o intervalo até a próxima captura com base no lag do slot de replicação.
+
+    Enquanto houver backlog (lag acima de backlog_threshold_bytes ou operações DML
+    capturadas no último ciclo) o intervalo é min_interval_seconds, permitindo
+    capturas consecutivas. Com o slot ocioso, o intervalo cresce exponencialmente
+    até max_interval_seconds.
+    """
+
+    BACKOFF_FACTOR = 2.0
+    BACKOFF_START_SECONDS = 1.0
+    BACKLOG_THRESHOLD_BYTES = 64 * 1024
+
+    def __init__(self, min_interval_seconds: float, max_interval_seconds: float):
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max(max_interval_seconds, min_interval_seconds)
+        self.current_interval_seconds = min_interval_seconds
+
+    def next_interval(self, lag_bytes: int, captured_changes: int = 0) -> float:
+        """
+        Retorna o intervalo, em segundos, até a próxima captura.
+
+        Args:
+            lag_bytes (int): Diferença entre pg_current_wal_lsn() e o confirmed_flush_lsn do slot.
+            captured_changes (int): Quantidade de operações DML das tabelas da tarefa
+                capturadas no último ciclo (sem BEGIN/COMMIT e tabelas filtradas).
+
+        Returns:
+            float: Intervalo em segundos, entre min_interval_seconds e max_interval_seconds.
+        """
+
+        if captured_changes or (lag_bytes or 0) >= self.BACKLOG_THRESHOLD_BYTES:
+            self.current_interval_seconds = self.min_interval_seconds
+        else:
+            self.current_interval_seconds = min(
+                max(
+                    self.current_interval_seconds * self.BACKOFF_FACTOR,
+                    self.min_interval_seconds,
+                    self.BACKOFF_START_SECONDS,
+                ),
+                self.max_interval_seconds,
+            )
+
+        logger.debug(
+            f"SCHEDULER - Lag {lag_bytes} bytes, próxima captura em {self.current_interval_seconds}s"
+        )
+
+        return self.current_interval_seconds
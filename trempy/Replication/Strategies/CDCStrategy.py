@@ -2,6 +2,8 @@ from trempy.Replication.Strategies.ReplicationStrategy import ReplicationStrateg
 from trempy.Metadata.MetadataConnectionManager import MetadataConnectionManager
 from trempy.Replication.Exceptions.Exception import *
 from trempy.Loggings.Logging import ReplicationLogger
+from trempy.Replication.Scheduler.AdaptiveScheduler import AdaptiveScheduler
+from trempy.Shared.Types import ProducerModeType, SchedulingModeType
 from trempy.Shared.Utils import Utils
 from time import sleep
 import subprocess
@@ -15,11 +17,17 @@ class CDCStrategy(ReplicationStrategy):
     """
     Estratégia de replicação para CDC (Change Data Capture) com:
     - Consumer rodando continuamente
-    - Producer executando em intervalos regulares
+    - Producer executando em intervalos regulares (um subprocesso por ciclo ou,
+      no modo daemon, um processo contínuo que mantém as conexões abertas)
     """
 
     def __init__(self, interval_seconds: int):
         self.interval_seconds = interval_seconds
+        self.producer_mode = ProducerModeType.SUBPROCESS
+        self.producer_process = None
+        self.consumer_partitions = 1
+        self.consumer_processes = []
+        self.scheduler = None
 
     def __setup_environment(self, task_settings: dict):
         """Configura o ambiente para execução."""
@@ -47,17 +55,51 @@ class CDCStrategy(ReplicationStrategy):
                     "STOP_IF_DELETE_ERROR": str(int(task.stop_if_delete_error)),
                     "STOP_IF_UPSERT_ERROR": str(int(task.stop_if_upsert_error)),
                     "STOP_IF_SCD2_ERROR": str(int(task.stop_if_scd2_error)),
+                    "REPLICATION_LAG_BYTES": "0",
+                    "LAST_CAPTURED_CHANGES": "0",
                 }
             )
 
+        if task.scheduling_mode == SchedulingModeType.ADAPTIVE:
+            self.scheduler = AdaptiveScheduler(
+                task.min_interval_seconds, task.max_interval_seconds
+            )
+
         logger.info(
             f"CDC STRATEGY - Iniciando CDC com intervalo de {self.interval_seconds}s"
         )
 
-    def __start_consumer(self) -> None:
-        """Inicia o processo do consumer em segundo plano."""
-        self.consumer_process = subprocess.Popen(
-            [sys.executable, "consumer.py"],
+    def __start_consumers(self) -> None:
+        """
+        Inicia os processos do consumer em segundo plano.
+
+        Com consumer_partitions > 1 é iniciado um consumer por partição, indicada
+        pela variável de ambiente TREMPY_CONSUMER_PARTITION.
+        """
+        if self.consumer_partitions <= 1:
+            partitions = [None]
+        else:
+            partitions = range(self.consumer_partitions)
+
+        for partition in partitions:
+            env = os.environ.copy()
+            if partition is not None:
+                env["TREMPY_CONSUMER_PARTITION"] = str(partition)
+
+            self.consumer_processes.append(
+                subprocess.Popen(
+                    [sys.executable, "consumer.py"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    env=env,
+                )
+            )
+
+    def __start_producer_daemon(self) -> None:
+        """Inicia o processo do producer contínuo em segundo plano."""
+        self.producer_process = subprocess.Popen(
+            [sys.executable, "producer_daemon.py"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
@@ -75,41 +117,77 @@ class CDCStrategy(ReplicationStrategy):
     def __run_cdc_loop(self) -> None:
         """Executa o loop principal do CDC."""
         while True:
-            if not self.__run_producer():
+            if self.producer_mode == ProducerModeType.DAEMON:
+                self.__check_producer_status()
+            elif not self.__run_producer():
                 e = ReplicationRuntimeError("Erro ao executar o producer")
                 logger.critical(e)
                 logger.critical(e)
 
-            self.__check_consumer_status()
+            self.__check_consumers_status()
             self.__wait_next_cycle()
 
     def __run_producer(self) -> bool:
         """Executa o producer e retorna o status."""
         return self.run_process("producer.py")
 
-    def __check_consumer_status(self) -> None:
-        """Verifica se o consumer está rodando corretamente."""
-        if self.consumer_process.poll() is not None:
-            exit_code = self.consumer_process.returncode
+    def __check_producer_status(self) -> None:
+        """Verifica se o producer contínuo está rodando corretamente."""
+        if self.producer_process.poll() is not None:
+            exit_code = self.producer_process.returncode
             e = ReplicationRuntimeError(
-                f"Consumer encerrado inesperadamente (código: {exit_code})"
+                f"Producer encerrado inesperadamente (código: {exit_code})"
             )
             logger.critical(e)
 
+    def __check_consumers_status(self) -> None:
+        """Verifica se os consumers estão rodando corretamente."""
+        for consumer_process in self.consumer_processes:
+            if consumer_process.poll() is not None:
+                exit_code = consumer_process.returncode
+                e = ReplicationRuntimeError(
+                    f"Consumer encerrado inesperadamente (código: {exit_code})"
+                )
+                logger.critical(e)
+
     def __wait_next_cycle(self) -> None:
-        """Aguarda o próximo ciclo de execução."""
-        sleep(self.interval_seconds)
+        """
+        Aguarda o próximo ciclo de execução.
+
+        No modo adaptativo o intervalo é calculado a partir do lag registrado pelo
+        producer no último ciclo. No modo daemon o próprio producer controla o seu
+        intervalo, e este loop apenas monitora os processos.
+        """
+        if self.scheduler is None or self.producer_mode == ProducerModeType.DAEMON:
+            sleep(self.interval_seconds)
+            return
+
+        with MetadataConnectionManager() as metadata_manager:
+            lag_bytes = int(metadata_manager.get_metadata_config("REPLICATION_LAG_BYTES"))
+            captured_changes = int(
+                metadata_manager.get_metadata_config("LAST_CAPTURED_CHANGES")
+            )
+
+        sleep(self.scheduler.next_interval(lag_bytes, captured_changes))
 
     def __graceful_shutdown(self) -> None:
         """Encerra os processos de forma controlada."""
         logger.info("CDC STRATEGY - Interrompendo processo CDC")
-        self.consumer_process.terminate()
-        self.consumer_process.wait()
+        if self.producer_process is not None:
+            self.producer_process.terminate()
+            self.producer_process.wait()
+        for consumer_process in self.consumer_processes:
+            consumer_process.terminate()
+        for consumer_process in self.consumer_processes:
+            consumer_process.wait()
         logger.info("CDC STRATEGY - CDC encerrado")
 
     def __emergency_shutdown(self) -> None:
         """Encerra os processos em caso de erro."""
-        self.consumer_process.kill()
+        if self.producer_process is not None:
+            self.producer_process.kill()
+        for consumer_process in self.consumer_processes:
+            consumer_process.kill()
         sys.exit(1)
 
     def execute(self, task_settings: dict) -> None:
@@ -128,8 +206,17 @@ class CDCStrategy(ReplicationStrategy):
 
         self.__setup_environment(task_settings)
 
+        cdc_settings = task_settings["task"].get("cdc_settings", {})
+        self.producer_mode = ProducerModeType(
+            cdc_settings.get("producer_mode", "subprocess")
+        )
+        self.consumer_partitions = cdc_settings.get("consumer_partitions", 1)
+
         self.__start_dlx()
-        self.__start_consumer()
+        self.__start_consumers()
+
+        if self.producer_mode == ProducerModeType.DAEMON:
+            self.__start_producer_daemon()
 
         try:
             self.__run_cdc_loop()
@@ -1,6 +1,6 @@
 from trempy.Metadata.MetadataConnectionManager import MetadataConnectionManager
 from trempy.Endpoints.Factory.EndpointFactory import EndpointFactory
-from trempy.Shared.Types import PriorityType, TaskType, CdcModeType
+from trempy.Shared.Types import PriorityType, TaskType, CdcModeType, TransportType
 from trempy.Transformations.Transformation import Transformation
 from trempy.Messages import Message, MessageDlx, MessageConsumer
 from trempy.Loggings.Logging import ReplicationLogger
@@ -245,7 +245,12 @@ class ReplicationStrategy(ABC):
         task.clean_endpoints()
         return task
 
-    def reload_task(self, task_name: str):
+    def reload_task(
+        self,
+        task_name: str,
+        consumer_partitions: int = 1,
+        transport: TransportType = TransportType.RABBITMQ,
+    ):
 
         logger.info("REPLICATION - Recarregando tarefa")
 
@@ -257,10 +262,10 @@ class ReplicationStrategy(ABC):
             metadata_manager.create_tables()
             metadata_manager.truncate_tables()
             
-        message = Message.Message(task_name)
-        message_dlx = MessageDlx.MessageDlx(task_name)
+        message = Message.Message(task_name, transport=transport)
+        message_dlx = MessageDlx.MessageDlx(task_name, transport=transport)
         message_consumer = MessageConsumer.MessageConsumer(
-            task_name, external_callback=None
+            task_name, external_callback=None, transport=transport
         )
 
         message.delete_exchange()
@@ -268,6 +273,16 @@ class ReplicationStrategy(ABC):
 
         message_dlx.delete_queue()
         message_consumer.delete_queue()
+
+        # Filas das partições (consumer_partitions > 1)
+        if consumer_partitions > 1:
+            for partition in range(consumer_partitions):
+                MessageConsumer.MessageConsumer(
+                    task_name,
+                    external_callback=None,
+                    partition=partition,
+                    transport=transport,
+                ).delete_queue()
         
     def run_process(self, script_name: str) -> bool:
         """
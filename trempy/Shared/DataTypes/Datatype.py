@@ -21,6 +21,14 @@ class Datatype:
         pl.Decimal: lambda x: pl.Series([x]).cast(pl.Decimal)[0],
     }
 
+    TYPE_EXPRESSION_CONVERSION_METHODS = {
+        pl.Date: lambda x: x.str.strptime(pl.Date, "%Y-%m-%d"),
+        pl.Datetime: lambda x: x.str.strptime(pl.Datetime, "%Y-%m-%d %H:%M:%S"),
+        pl.Boolean: lambda x: pl.when(x.is_null())
+        .then(None)
+        .otherwise(x.str.to_lowercase().is_in(["true", "t"])),
+    }
+
     @classmethod
     def convert_value(cls, col_value, col_type):
         """Converte um valor para o tipo correspondente no Polars."""
@@ -34,6 +42,29 @@ class Datatype:
 
         return col_value
 
+    @classmethod
+    def convert_expression(cls, col_name: str, col_type: str) -> pl.Expr:
+        """
+        Retorna a expressão que converte uma coluna textual para o tipo correspondente
+        no Polars (versão vetorizada de convert_value).
+        """
+        column = pl.col(col_name)
+
+        if col_type not in cls.TYPE_DATABASE_TO_POLARS:
+            return column
+
+        polars_type = cls.TYPE_DATABASE_TO_POLARS[col_type]
+
+        if polars_type in cls.TYPE_EXPRESSION_CONVERSION_METHODS:
+            return cls.TYPE_EXPRESSION_CONVERSION_METHODS[polars_type](column).alias(
+                col_name
+            )
+
+        if polars_type in cls.TYPE_CONVERSION_METHODS:
+            return column.cast(polars_type)
+
+        return column
+
 
 class DatatypePostgreSQL(Datatype):
     TYPE_POLARS_TO_DATABASE = {
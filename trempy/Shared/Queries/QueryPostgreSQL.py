@@ -91,6 +91,11 @@ class CDCQueries:
     CDC_INSERT_DATA = """
   INSERT INTO {schema}.{table} ({columns})
   VALUES ({values})
+  """
+
+    CDC_INSERT_VALUES_DATA = """
+  INSERT INTO {schema}.{table} ({columns})
+  VALUES %s
   """
 
     CDC_UPDATE_DATA = """
@@ -104,6 +109,60 @@ class CDCQueries:
    WHERE {where_clause}
   """
 
+    CDC_SAVEPOINT = """
+  SAVEPOINT {savepoint}
+  """
+
+    CDC_RELEASE_SAVEPOINT = """
+  RELEASE SAVEPOINT {savepoint}
+  """
+
+    CDC_ROLLBACK_TO_SAVEPOINT = """
+  ROLLBACK TO SAVEPOINT {savepoint}
+  """
+
+    CDC_CREATE_STAGING_TABLE = """
+  CREATE TEMPORARY TABLE {stage} ON COMMIT DROP AS
+  SELECT {columns}, NULL::bigint AS {rownum}, NULL::text AS {operation}
+    FROM {schema}.{table}
+    WITH NO DATA
+  """
+
+    CDC_COPY_STAGING_TABLE = """
+  COPY {stage} ({columns}) FROM STDIN WITH (FORMAT csv)
+  """
+
+    CDC_BULK_DELETE_DATA = """
+  DELETE FROM {schema}.{table} AS t
+   USING {stage} AS s
+   WHERE {pk_join}
+     AND s.{operation} = 'DELETE'
+  """
+
+    CDC_BULK_UPDATE_DATA = """
+  UPDATE {schema}.{table} AS t
+     SET {set_clause}
+    FROM {stage} AS s
+   WHERE {pk_join}
+     AND s.{operation} = 'UPDATE'
+  """
+
+    CDC_BULK_INSERT_CONFLICTS = """
+  SELECT s.{rownum}
+    FROM {stage} AS s
+    JOIN {schema}.{table} AS t
+      ON {pk_join}
+   WHERE s.{operation} = 'INSERT'
+  """
+
+    CDC_BULK_INSERT_DATA = """
+  INSERT INTO {schema}.{table} ({columns})
+  SELECT {columns}
+    FROM {stage} AS s
+   WHERE s.{operation} = 'INSERT'
+     AND NOT EXISTS (SELECT 1 FROM {schema}.{table} AS t WHERE {pk_join})
+  """
+
     CDC_UPSERT_DATA = """
     INSERT INTO {schema}.{table} ({columns})
     VALUES ({values})
@@ -111,10 +170,34 @@ class CDCQueries:
         DO UPDATE SET {set_clause}
   """
 
+    CDC_BULK_UPSERT_DATA = """
+  INSERT INTO {schema}.{table} ({columns})
+  SELECT {columns}
+    FROM {stage}
+   WHERE {operation} <> 'DELETE'
+      ON CONFLICT ({pk_columns})
+      {conflict_action}
+  """
+
+    CDC_BULK_MERGE_DATA = """
+  MERGE INTO {schema}.{table} AS t
+  USING {stage} AS s
+     ON {pk_join}
+   WHEN MATCHED AND s.{operation} = 'DELETE' THEN
+        DELETE
+   {matched_update}
+   WHEN NOT MATCHED AND s.{operation} <> 'DELETE' THEN
+        INSERT ({columns}) VALUES ({source_columns})
+  """
+
 
 class ReplicationQueries:
     CREATE_REPLICATION_SLOT = """
-  SELECT pg_create_logical_replication_slot(%s, 'test_decoding')
+  SELECT pg_create_logical_replication_slot(%s, %s)
+  """
+
+    GET_REPLICATION_SLOT_PLUGIN = """
+  SELECT plugin FROM pg_replication_slots WHERE slot_name = %s
   """
 
     VERIFY_IF_EXISTS_A_REPLICATION_SLOT = """
@@ -130,8 +213,77 @@ class ReplicationQueries:
   """
 
     GET_CHANGES = """
+  SELECT lsn, xid, data
+    FROM pg_logical_slot_get_changes(%s, %s, %s, 'skip-empty-xacts', '1')
+   WHERE data NOT LIKE 'table %%'
+      OR substring(data FROM '^table ([^:]+):') = ANY(%s);
+  """
+
+    PEEK_CHANGES = """
+  SELECT lsn, xid, data
+    FROM pg_logical_slot_peek_changes(%s, %s, %s, 'skip-empty-xacts', '1')
+   WHERE data NOT LIKE 'table %%'
+      OR substring(data FROM '^table ([^:]+):') = ANY(%s);
+  """
+
+    ADVANCE_REPLICATION_SLOT = """
+  SELECT pg_replication_slot_advance(%s, %s::pg_lsn)
+  """
+
+    GET_CURRENT_WAL_LSN = """
+  SELECT pg_current_wal_lsn()::text;
+  """
+
+    GET_REPLICATION_LAG = """
+  SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), confirmed_flush_lsn)::bigint AS lag_bytes,
+         pg_wal_lsn_diff(pg_current_wal_lsn(), restart_lsn)::bigint AS retained_wal_bytes,
+         pg_wal_lsn_diff(confirmed_flush_lsn, '0/0')::bigint AS confirmed_flush_bytes
+    FROM pg_replication_slots
+   WHERE slot_name = %s
+  """
+
+    GET_BINARY_CHANGES = """
+  SELECT *
+    FROM pg_logical_slot_get_binary_changes(
+           %s, %s, %s,
+           'proto_version', '1',
+           'publication_names', %s
+         );
+  """
+
+    PEEK_BINARY_CHANGES = """
   SELECT *
-    FROM pg_logical_slot_get_changes(%s, NULL, NULL);
+    FROM pg_logical_slot_peek_binary_changes(
+           %s, %s, %s,
+           'proto_version', '1',
+           'publication_names', %s
+         );
+  """
+
+    VERIFY_IF_EXISTS_A_PUBLICATION = """
+  SELECT COUNT(*) FROM pg_publication WHERE pubname = %s
+  """
+
+    CREATE_PUBLICATION = """
+  CREATE PUBLICATION {publication} FOR TABLE {tables}
+  """
+
+    GET_PUBLICATION_TABLES = """
+  SELECT schemaname || '.' || tablename
+    FROM pg_publication_tables
+   WHERE pubname = %s
+  """
+
+    SET_PUBLICATION_TABLES = """
+  ALTER PUBLICATION {publication} SET TABLE {tables}
+  """
+
+    DROP_PUBLICATION = """
+  DROP PUBLICATION IF EXISTS {publication}
+  """
+
+    GET_TYPE_NAME = """
+  SELECT format_type(%s, NULL)
   """
 
 
@@ -27,6 +27,55 @@ class CdcModeType(Enum):
     SCD2 = "scd2"
 
 
+class ApplyEngineType(Enum):
+    ROW = "row"
+    GROUPED = "grouped"
+    BULK = "bulk"
+
+
+class CommitModeType(Enum):
+    ROW = "row"
+    BATCH = "batch"
+
+
+class CaptureEngineType(Enum):
+    POLLING = "polling"
+    STREAMING = "streaming"
+
+
+class CompressionType(Enum):
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+    LZ4 = "lz4"
+
+
+class MessageFormatType(Enum):
+    JSON = "json"
+    COMPACT_JSON = "compact_json"
+    ARROW = "arrow"
+
+
+class SchedulingModeType(Enum):
+    FIXED = "fixed"
+    ADAPTIVE = "adaptive"
+
+
+class ProducerModeType(Enum):
+    SUBPROCESS = "subprocess"
+    DAEMON = "daemon"
+
+
+class TransportType(Enum):
+    RABBITMQ = "rabbitmq"
+    LOCAL = "local"
+
+
+class DecoderPluginType(Enum):
+    TEST_DECODING = "test_decoding"
+    PGOUTPUT = "pgoutput"
+
+
 class SCD2ColumnType(Enum):
     START_DATE = "start_date"
     END_DATE = "end_date"
@@ -251,3 +251,83 @@ class Table:
 
         for filter in self.filters:
             filter.execute(self)
+
+    def compact_changes(self) -> None:
+        """
+        Reduz as alterações da tabela ao efeito líquido por chave primária.
+
+        As operações são ordenadas por $TREM_ROWNUM e, para cada PK, somente a última
+        versão da linha é mantida, com a operação resultante:
+        - INSERT seguido de DELETE: a linha é descartada;
+        - DELETE como última operação: DELETE;
+        - INSERT como primeira operação: INSERT com os valores finais;
+        - DELETE seguido de novo INSERT: DELETE e INSERT com os valores finais;
+        - somente UPDATEs: UPDATE com os valores finais.
+
+        Tabelas sem PK não são compactadas.
+
+        Returns:
+            None: Este método não retorna valores, apenas modifica os dados da tabela.
+        """
+
+        if self.data is None or self.data.is_empty():
+            return
+
+        pk_columns = [col.name for col in self.columns.values() if col.is_primary_key]
+        if not pk_columns:
+            return
+        operation = pl.col("$TREM_OPERATION")
+        first_operation = pl.col("$TREM_FIRST_OPERATION")
+        last_operation = pl.col("$TREM_LAST_OPERATION")
+        is_reinserted = pl.col("$TREM_REINSERTED")
+
+        df_last = (
+            self.data.sort("$TREM_ROWNUM", maintain_order=True)
+            .with_columns(
+                operation.first().over(pk_columns).alias("$TREM_FIRST_OPERATION"),
+                operation.last().over(pk_columns).alias("$TREM_LAST_OPERATION"),
+                pl.col("$TREM_ROWNUM")
+                .first()
+                .over(pk_columns)
+                .alias("$TREM_FIRST_ROWNUM"),
+                (
+                    (operation != "UPDATE").any().over(pk_columns)
+                    & (operation.first().over(pk_columns) != "INSERT")
+                ).alias("$TREM_REINSERTED"),
+                (
+                    pl.int_range(pl.len()).over(pk_columns)
+                    == pl.len().over(pk_columns) - 1
+                ).alias("$TREM_IS_LAST"),
+            )
+            .filter(pl.col("$TREM_IS_LAST"))
+        )
+
+        df_final = df_last.with_columns(
+            pl.when((last_operation == "DELETE") & (first_operation == "INSERT"))
+            .then(None)
+            .when(last_operation == "DELETE")
+            .then(pl.lit("DELETE"))
+            .when((first_operation == "INSERT") | is_reinserted)
+            .then(pl.lit("INSERT"))
+            .otherwise(pl.lit("UPDATE"))
+            .alias("$TREM_OPERATION")
+        ).filter(operation.is_not_null())
+
+        df_deleted = df_last.filter(
+            is_reinserted & (last_operation != "DELETE")
+        ).with_columns(
+            pl.lit("DELETE").alias("$TREM_OPERATION"),
+            pl.col("$TREM_FIRST_ROWNUM").alias("$TREM_ROWNUM"),
+        )
+
+        self.data = (
+            pl.concat([df_deleted, df_final])
+            .sort("$TREM_ROWNUM", maintain_order=True)
+            .drop(
+                "$TREM_FIRST_OPERATION",
+                "$TREM_LAST_OPERATION",
+                "$TREM_FIRST_ROWNUM",
+                "$TREM_REINSERTED",
+                "$TREM_IS_LAST",
+            )
+        )
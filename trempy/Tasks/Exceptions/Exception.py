@@ -44,6 +44,12 @@ class DatabaseNotImplementedError(TaskError):
     def __init__(self, message: str, database_type: str):
         super().__init__(f"{message} | {database_type}")
 
+class InvalidCompressionError(TaskError):
+    """Exceção lançada quando a compressão configurada exige um pacote não instalado."""
+
+    def __init__(self, message: str, compression: str):
+        super().__init__(f"{message} | {compression}")
+
 class InvalidIntervalSecondsError(TaskError):
     """Exceção lançada quando o intervalo de execução da tarefa é inválido."""
 
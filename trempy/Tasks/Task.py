@@ -4,18 +4,30 @@ from trempy.Shared.Types import (
     EndpointType,
     DatabaseType,
     StartType,
+    CaptureEngineType,
+    DecoderPluginType,
+    ProducerModeType,
+    SchedulingModeType,
+    MessageFormatType,
+    CompressionType,
+    TransportType,
+    ApplyEngineType,
+    CommitModeType,
 )
 from trempy.Metadata.MetadataConnectionManager import MetadataConnectionManager
 from trempy.Transformations.Transformation import Transformation
 from pika.adapters.blocking_connection import BlockingChannel
 from trempy.Messages.MessageProducer import MessageProducer
 from trempy.Messages.MessageConsumer import MessageConsumer
+from trempy.Messages.MessageClaimCheck import MessageClaimCheck
+from trempy.Messages.MessageCodec import MessageCodec
 from trempy.Loggings.Logging import ReplicationLogger
 from trempy.Tasks.Exceptions.Exception import *
 from trempy.Endpoints.Endpoint import Endpoint
 from trempy.Filters.Filter import Filter
 from trempy.Tables.Table import Table
-from typing import List, Optional
+from typing import Dict, List, Optional
+from time import sleep, time
 import polars as pl
 import re
 
@@ -39,6 +51,7 @@ class Task:
 
     PATH_FULL_LOAD_STAGING_AREA = "data/full_load_data/"
     PATH_CDC_STAGING_AREA = "data/cdc_data/"
+    SOURCE_KEEPALIVE_SECONDS = 10
 
     def __init__(
         self,
@@ -73,6 +86,80 @@ class Task:
         )
 
         self.cdc_mode: CdcModeType = CdcModeType(cdc_settings.get("mode", "default"))
+        self.apply_engine: ApplyEngineType = ApplyEngineType(
+            cdc_settings.get("apply_engine", "row")
+        )
+        self.commit_mode: CommitModeType = CommitModeType(
+            cdc_settings.get("commit_mode", "row")
+        )
+        # SCD2 precisa das versões intermediárias; a compactação não se aplica
+        self.compact_changes: bool = (
+            cdc_settings.get("compact_changes", False)
+            and self.cdc_mode != CdcModeType.SCD2
+        )
+        self.capture_engine: CaptureEngineType = CaptureEngineType(
+            cdc_settings.get("capture_engine", "polling")
+        )
+        self.decoder_plugin: DecoderPluginType = DecoderPluginType(
+            cdc_settings.get("decoder_plugin", "test_decoding")
+        )
+        self.stream_max_wait_seconds: float = cdc_settings.get(
+            "stream_max_wait_seconds", 1.0
+        )
+        self.max_changes_per_capture: Optional[int] = cdc_settings.get(
+            "max_changes_per_capture"
+        )
+        self.decode_workers: int = cdc_settings.get("decode_workers", 1)
+        self.spill_threshold: Optional[int] = cdc_settings.get("spill_threshold")
+        self.batch_max_bytes: Optional[int] = cdc_settings.get("batch_max_bytes")
+        self.batch_size_by_table: Dict[str, int] = cdc_settings.get(
+            "batch_size_by_table", {}
+        )
+        self.message_format = MessageFormatType(
+            cdc_settings.get("message_format", "json")
+        )
+        self.compression = CompressionType(cdc_settings.get("compression", "none"))
+        self.compression_level: Optional[int] = cdc_settings.get("compression_level")
+        self.compression_min_bytes: int = cdc_settings.get(
+            "compression_min_bytes", 16384
+        )
+        self.publisher_confirms: bool = cdc_settings.get("publisher_confirms", False)
+        self.publish_window: int = cdc_settings.get("publish_window", 256)
+        self.transport = TransportType(cdc_settings.get("transport", "rabbitmq"))
+        self.backpressure_max_queue_messages: Optional[int] = cdc_settings.get(
+            "backpressure_max_queue_messages"
+        )
+        self.backpressure_resume_queue_messages: Optional[int] = cdc_settings.get(
+            "backpressure_resume_queue_messages"
+        )
+        self.backpressure_check_seconds: float = cdc_settings.get(
+            "backpressure_check_seconds", 5
+        )
+        self.backpressure_max_wait_seconds: float = cdc_settings.get(
+            "backpressure_max_wait_seconds", 60
+        )
+        self.claim_check_threshold_bytes: Optional[int] = cdc_settings.get(
+            "claim_check_threshold_bytes"
+        )
+        self.consumer_partitions: int = cdc_settings.get("consumer_partitions", 1)
+        self.consumer_batch_size: int = cdc_settings.get("consumer_batch_size", 1)
+        self.consumer_batch_max_bytes: Optional[int] = cdc_settings.get(
+            "consumer_batch_max_bytes", 8 * 1024 * 1024
+        )
+        self.consumer_batch_max_wait_seconds: float = cdc_settings.get(
+            "consumer_batch_max_wait_seconds", 1.0
+        )
+        self.producer_mode = ProducerModeType(
+            cdc_settings.get("producer_mode", "subprocess")
+        )
+        self.message_producer: Optional[MessageProducer] = None
+        self.scheduling_mode = SchedulingModeType(
+            cdc_settings.get("scheduling_mode", "fixed")
+        )
+        self.min_interval_seconds: float = cdc_settings.get("min_interval_seconds", 0)
+        self.max_interval_seconds: float = cdc_settings.get("max_interval_seconds", 60)
+        self.last_captured_changes: int = 0
+        self.last_replication_lag: dict = {}
 
         self.scd2_start_date_column_name: str = scd2_settings.get(
             "start_date_column_name", "scd_start_date"
@@ -109,6 +196,7 @@ class Task:
             InvalidTaskTypeError: Se o tipo da tarefa for inválido ou não estiver entre
                        os valores permitidos.
             InvalidTaskNameError: Se o nome da tarefa for inválido.
+            InvalidCompressionError: Se a compressão exigir um pacote não instalado.
         """
 
         if self.replication_type not in TaskType:
@@ -121,6 +209,16 @@ class Task:
             )
             logger.critical(e)
 
+        missing_package = MessageCodec.get_missing_compression_package(
+            self.compression
+        )
+        if missing_package:
+            e = InvalidCompressionError(
+                f"Compressão requer o pacote {missing_package}, que não está instalado",
+                self.compression.value,
+            )
+            logger.critical(e)
+
         partner = re.compile(r"^[a-z0-9_]+$")
         task_name_valid = bool(partner.match(self.task_name))
 
@@ -167,25 +265,9 @@ class Task:
                 channel.basic_nack(delivery_tag=delivery_tag, requeue=False)
                 logger.critical(e)
 
-            for table in sorted(self.tables, key=lambda x: x.priority.value):
-                data: pl.DataFrame = df_changes_structured.get(table.id)
-
-                if table.id in df_changes_structured.keys():
-                    table.add_data(data)
-                    table.execute_filters()
-                    table.execute_transformations()
-
-                    cdc_stats = self.target_endpoint.insert_cdc_into_table(
-                        mode=self.cdc_mode,
-                        table=table,
-                        create_table_if_not_exists=self.create_table_if_not_exists,
-                    )
-
-                    with MetadataConnectionManager() as metadata_manager:
-                        metadata_manager.insert_stats_cdc(
-                            cdc_stats, task_name=self.task_name
-                        )
+            self.__apply_changes_to_tables(df_changes_structured)
             channel.basic_ack(delivery_tag=delivery_tag)
+            MessageClaimCheck.release(changes_structured.get("claim_check_path"))
             # logger.info(f"TASK - Confirmado ({delivery_tag})")
 
         except Exception as e:
@@ -203,6 +285,110 @@ class Task:
                     }
                 )
 
+    def __apply_changes_to_tables(
+        self, df_changes_structured: dict, commit_mode: CommitModeType = None
+    ) -> None:
+        """
+        Aplica no destino as alterações estruturadas por tabela, respeitando a
+        prioridade das tabelas da tarefa.
+
+        Args:
+            df_changes_structured (dict): DataFrames de alterações por identificador de tabela.
+            commit_mode (CommitModeType): Modo de commit; por padrão, o da tarefa.
+        """
+
+        for table in sorted(self.tables, key=lambda x: x.priority.value):
+            data: pl.DataFrame = df_changes_structured.get(table.id)
+
+            if table.id in df_changes_structured.keys():
+                table.add_data(data)
+                table.execute_filters()
+                table.execute_transformations()
+                if self.compact_changes:
+                    table.compact_changes()
+
+                cdc_stats = self.target_endpoint.insert_cdc_into_table(
+                    mode=self.cdc_mode,
+                    table=table,
+                    create_table_if_not_exists=self.create_table_if_not_exists,
+                    apply_engine=self.apply_engine,
+                    commit_mode=commit_mode or self.commit_mode,
+                )
+
+                with MetadataConnectionManager() as metadata_manager:
+                    metadata_manager.insert_stats_cdc(
+                        cdc_stats, task_name=self.task_name
+                    )
+
+    @staticmethod
+    def __renumber_rows(data: pl.DataFrame) -> pl.DataFrame:
+        if "$TREM_ROWNUM" not in data.columns:
+            return data
+        return data.with_columns(
+            pl.int_range(pl.len(), dtype=pl.Int64).alias("$TREM_ROWNUM")
+        )
+
+    def __execute_target_cdc_batch_callback(
+        self, messages: List[dict], channel: BlockingChannel
+    ):
+        """
+        Aplica um micro-lote de mensagens no destino.
+
+        As alterações de todas as mensagens são concatenadas por tabela (na ordem
+        de entrega), de modo que cada tabela é aplicada uma única vez por lote, em
+        uma única transação (commit por lote, independente de commit_mode).
+        O lote inteiro é confirmado com um único basic_ack(multiple=True) ou, em
+        caso de erro, rejeitado com basic_nack(multiple=True).
+
+        Args:
+            messages (List[dict]): Mensagens decodificadas, na ordem de entrega.
+            channel (BlockingChannel): Canal do consumidor.
+        """
+
+        last_delivery_tag = messages[-1]["delivery_tag"]
+        try:
+            frames_by_table: Dict[str, List[pl.DataFrame]] = {}
+            for message in messages:
+                df_changes_structured: dict = (
+                    self.target_endpoint.structure_capture_changes_to_dataframe(
+                        message
+                    )
+                )
+                for table_id, data in df_changes_structured.items():
+                    frames_by_table.setdefault(table_id, []).append(data)
+
+            # $TREM_ROWNUM é numerado por mensagem; a renumeração mantém a ordem do lote
+            self.__apply_changes_to_tables(
+                {
+                    table_id: self.__renumber_rows(
+                        pl.concat(frames, how="diagonal_relaxed")
+                    )
+                    for table_id, frames in frames_by_table.items()
+                },
+                commit_mode=CommitModeType.BATCH,
+            )
+            channel.basic_ack(delivery_tag=last_delivery_tag, multiple=True)
+            for message in messages:
+                MessageClaimCheck.release(message.get("claim_check_path"))
+
+        except Exception as e:
+            e = TaskError(f"Erro ao realizar carga de alterações no callback: {str(e)}")
+            channel.basic_nack(
+                delivery_tag=last_delivery_tag, multiple=True, requeue=False
+            )
+            logger.critical(e)
+
+        finally:
+            with MetadataConnectionManager() as metadata_manager:
+                for message in messages:
+                    metadata_manager.update_stats_message(
+                        {
+                            "transaction_id": message["transaction_id"],
+                            "column": "processed",
+                            "value": message["batch_size"],
+                        }
+                    )
+
     def execute_source_full_load(self) -> bool:
         """
         Executa a extração completa de dados da fonte em Full Load.
@@ -308,7 +494,21 @@ class Task:
         ):
 
             try:
-                kargs = {"database_type": self.source_endpoint.database_type.value}
+                kargs = {
+                    "database_type": self.source_endpoint.database_type.value,
+                    "capture_engine": self.capture_engine,
+                    "decoder_plugin": self.decoder_plugin,
+                    "stream_max_wait_seconds": self.stream_max_wait_seconds,
+                    "max_changes": self.max_changes_per_capture,
+                    "decode_workers": self.decode_workers,
+                    "spill_threshold": self.spill_threshold,
+                    "staging_area": self.PATH_CDC_STAGING_AREA,
+                    "message_format": self.message_format,
+                    "publisher_confirms": self.publisher_confirms,
+                    "partitions": self.consumer_partitions,
+                    "batch_max_bytes": self.batch_max_bytes,
+                    "batch_size_by_table": self.batch_size_by_table,
+                }
 
                 match self.source_endpoint.database_type:
                     case DatabaseType.POSTGRESQL:
@@ -320,17 +520,61 @@ class Task:
                         )
                         logger.critical(e)
 
-                changes_captured = self.source_endpoint.capture_changes(**kargs)
+                # Com max_changes_per_capture, cada rodada lê no máximo N alterações
+                # (sempre em fronteira de transação) até o LSN atual do WAL, mantendo
+                # constante o pico de memória independentemente do backlog
+                if self.max_changes_per_capture:
+                    kargs["upto_lsn"] = self.source_endpoint.get_current_wal_lsn()
 
-                changes_structured = (
-                    self.source_endpoint.structure_capture_changes_to_json(
-                        changes_captured, task_tables=self.tables, **kargs
-                    )
+                self.last_captured_changes = 0
+                cycle_start = time()
+                replication_lag_start = self.source_endpoint.get_replication_lag(
+                    kargs["slot_name"]
                 )
 
-                if changes_structured:
-                    producer = MessageProducer(task_name=self.task_name)
-                    producer.publish_message(messages=changes_structured)
+                while True:
+                    # Com a fila acima do limite, as alterações ficam retidas no slot
+                    if not self.__wait_for_backpressure():
+                        break
+
+                    changes_captured = self.source_endpoint.capture_changes(
+                        task_tables=self.tables, **kargs
+                    )
+
+                    changes_structured = (
+                        self.source_endpoint.structure_capture_changes_to_json(
+                            changes_captured, task_tables=self.tables, **kargs
+                        )
+                    )
+
+                    # Somente operações DML das tabelas da tarefa (sem BEGIN/COMMIT)
+                    if changes_structured:
+                        self.last_captured_changes += changes_structured["qtd_changes"]
+                        self.__get_message_producer().publish_message(
+                            messages=changes_structured
+                        )
+
+                    # Com publisher_confirms, publish_message só retorna após o broker
+                    # confirmar todos os lotes; só então o slot é avançado
+                    self.source_endpoint.confirm_changes(**kargs)
+
+                    # O filtro de tabelas no servidor reduz a contagem de linhas,
+                    # então a rodada só termina quando nada resta até upto_lsn
+                    # (uma captura gravada em disco, LazyFrame, nunca é vazia)
+                    if not self.max_changes_per_capture or (
+                        isinstance(changes_captured, pl.DataFrame)
+                        and changes_captured.is_empty()
+                    ):
+                        break
+
+                self.last_replication_lag = self.source_endpoint.get_replication_lag(
+                    kargs["slot_name"]
+                )
+                self.__register_replication_lag(
+                    kargs["slot_name"],
+                    replication_lag_start,
+                    capture_duration=time() - cycle_start,
+                )
 
             except Exception as e:
                 e = TaskError(f"Erro ao executar captura de alterações: {e}")
@@ -340,7 +584,144 @@ class Task:
 
         return False
 
-    def execute_target_cdc(self) -> bool:
+    def __get_message_producer(self) -> MessageProducer:
+        """Retorna o producer da tarefa, criando-o na primeira utilização."""
+        if self.message_producer is None:
+            self.message_producer = MessageProducer(
+                task_name=self.task_name,
+                message_format=self.message_format,
+                compression=self.compression,
+                compression_level=self.compression_level,
+                compression_min_bytes=self.compression_min_bytes,
+                publisher_confirms=self.publisher_confirms,
+                publish_window=self.publish_window,
+                transport=self.transport,
+                claim_check_threshold_bytes=self.claim_check_threshold_bytes,
+                claim_check_path=self.PATH_CDC_STAGING_AREA,
+            )
+        return self.message_producer
+
+    def __register_backpressure(
+        self, queue_messages: int, action: str, wait_seconds: float
+    ) -> None:
+        with MetadataConnectionManager() as metadata_manager:
+            metadata_manager.insert_stats_backpressure(
+                {
+                    "task_name": self.task_name,
+                    "queue_messages": queue_messages,
+                    "threshold": self.backpressure_max_queue_messages,
+                    "action": action,
+                    "wait_seconds": wait_seconds,
+                }
+            )
+
+    def __wait_for_backpressure(self) -> bool:
+        """
+        Aplica backpressure com base na profundidade das filas dos consumers.
+
+        Quando as filas ultrapassam backpressure_max_queue_messages, a captura é
+        pausada até que voltem a backpressure_resume_queue_messages (padrão: metade
+        do limite), verificando a cada backpressure_check_seconds. Se a espera
+        passar de backpressure_max_wait_seconds, a captura do ciclo é descartada e
+        as alterações permanecem no slot. Os eventos são registrados em
+        stats_backpressure.
+
+        Returns:
+            bool: True se a captura pode prosseguir.
+        """
+
+        if not self.backpressure_max_queue_messages:
+            return True
+
+        queue_names = MessageConsumer.get_queue_names(
+            self.task_name, self.consumer_partitions
+        )
+        message_producer = self.__get_message_producer()
+
+        queue_messages = message_producer.get_queue_depth(queue_names)
+        if queue_messages < self.backpressure_max_queue_messages:
+            return True
+
+        resume_queue_messages = (
+            self.backpressure_resume_queue_messages
+            or self.backpressure_max_queue_messages // 2
+        )
+        logger.warning(
+            f"TASK - Backpressure: {queue_messages} mensagens na fila, captura pausada",
+            required_types=["cdc"],
+        )
+        self.__register_backpressure(queue_messages, "paused", 0)
+
+        wait_start = time()
+        while time() - wait_start < self.backpressure_max_wait_seconds:
+            message_producer.sleep(self.backpressure_check_seconds)
+            queue_messages = message_producer.get_queue_depth(queue_names)
+            if queue_messages <= resume_queue_messages:
+                self.__register_backpressure(
+                    queue_messages, "resumed", time() - wait_start
+                )
+                return True
+
+        self.__register_backpressure(queue_messages, "skipped", time() - wait_start)
+        return False
+
+    def __register_replication_lag(
+        self, slot_name: str, replication_lag_start: dict, capture_duration: float
+    ) -> None:
+        """
+        Registra o lag do slot ao final do ciclo de captura.
+
+        O lag em segundos é estimado pela taxa de drenagem do ciclo (bytes confirmados
+        pelo slot por segundo de captura); sem avanço do slot, ou sem o lag inicial
+        (slot criado no próprio ciclo), ele fica indefinido, exceto quando não há lag.
+
+        Args:
+            slot_name (str): Nome do slot de replicação.
+            replication_lag_start (dict): Lag do slot no início do ciclo.
+            capture_duration (float): Duração do ciclo de captura em segundos.
+        """
+
+        lag_bytes = self.last_replication_lag.get("lag_bytes", 0)
+
+        lag_seconds = None
+        if lag_bytes == 0:
+            lag_seconds = 0
+        elif replication_lag_start and capture_duration > 0:
+            drained_bytes = self.last_replication_lag.get(
+                "confirmed_flush_bytes", 0
+            ) - replication_lag_start.get("confirmed_flush_bytes", 0)
+            if drained_bytes > 0:
+                lag_seconds = lag_bytes / (drained_bytes / capture_duration)
+
+        with MetadataConnectionManager() as metadata_manager:
+            metadata_manager.update_metadata_config(
+                {
+                    "REPLICATION_LAG_BYTES": str(lag_bytes),
+                    "LAST_CAPTURED_CHANGES": str(self.last_captured_changes),
+                }
+            )
+            metadata_manager.insert_stats_replication_lag(
+                {
+                    "task_name": self.task_name,
+                    "slot_name": slot_name,
+                    "lag_bytes": lag_bytes,
+                    "lag_seconds": lag_seconds,
+                    "retained_wal_bytes": self.last_replication_lag.get(
+                        "retained_wal_bytes", 0
+                    ),
+                    "captured_changes": self.last_captured_changes,
+                    "capture_duration": capture_duration,
+                }
+            )
+
+    def execute_target_cdc(self, partition: Optional[int] = None) -> bool:
+        """
+        Consome as alterações publicadas e as aplica no destino.
+
+        Args:
+            partition (int): Partição consumida quando consumer_partitions > 1; cada
+                partição recebe as operações de um subconjunto de chaves (tabela, PK).
+        """
         if not self.tables:
             e = TaskError("Nenhuma tabela encontrada na tarefa")
             logger.critical(e)
@@ -350,9 +731,19 @@ class Task:
             "full_load_and_cdc",
         ):
             try:
+                # Com consumer_batch_size > 1, as mensagens são aplicadas em micro-lotes
                 consumer = MessageConsumer(
                     task_name=self.task_name,
-                    external_callback=self.__execute_target_cdc_callback,
+                    external_callback=(
+                        self.__execute_target_cdc_batch_callback
+                        if self.consumer_batch_size > 1
+                        else self.__execute_target_cdc_callback
+                    ),
+                    batch_max_messages=self.consumer_batch_size,
+                    batch_max_bytes=self.consumer_batch_max_bytes,
+                    batch_max_wait_seconds=self.consumer_batch_max_wait_seconds,
+                    partition=partition if self.consumer_partitions > 1 else None,
+                    transport=self.transport,
                 )
                 consumer.start_consuming()
 
@@ -364,16 +755,53 @@ class Task:
 
         return False
 
-    def clean_endpoints(self) -> None:
+    def sleep(self, seconds: float) -> None:
+        """
+        Aguarda até o próximo ciclo mantendo ativa a conexão do producer com o
+        broker (heartbeats), quando ela já existe.
+
+        A espera é dividida em intervalos de SOURCE_KEEPALIVE_SECONDS; ao fim de cada
+        um, o endpoint de origem envia o status ao servidor, evitando que o stream
+        de replicação seja encerrado por wal_sender_timeout durante a espera.
+
+        Args:
+            seconds (float): Tempo de espera em segundos.
+        """
+
+        deadline = time() + seconds
+        while (remaining := deadline - time()) > 0:
+            interval = min(remaining, self.SOURCE_KEEPALIVE_SECONDS)
+            if self.message_producer is None:
+                sleep(interval)
+            else:
+                self.message_producer.sleep(interval)
+
+            if self.source_endpoint is not None:
+                self.source_endpoint.keepalive()
+
+    def clean_endpoints(self, close_connections: bool = False) -> None:
         """
         Limpa os endpoints da tarefa.
 
         Deve ser chamado quando a tarefa terminar de ser executada, para liberar
         recursos, disponibilizar variável para exportação via pickle e evitar problemas de concorrência.
+
+        Args:
+            close_connections (bool): Se True, fecha as conexões dos endpoints (inclusive
+                a de replicação, que mantém o slot ativo) antes de descartá-los.
         """
+        if close_connections:
+            for endpoint in (self.source_endpoint, self.target_endpoint):
+                if endpoint is not None:
+                    endpoint.close()
+
         self.source_endpoint = None
         self.target_endpoint = None
 
+        if self.message_producer is not None:
+            self.message_producer.close()
+            self.message_producer = None
+
     def add_endpoint(self, endpoint: Endpoint) -> None:
         """
         Adiciona um endpoint à tarefa atual.
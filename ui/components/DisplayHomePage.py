@@ -503,6 +503,12 @@ class DisplayHomePage:
         with col2:
             self.graph_generator.generate_cdc_graph3()
 
+        col1, col2 = st.columns(2)
+        with col1:
+            self.graph_generator.generate_lag_graph1()
+        with col2:
+            self.graph_generator.generate_lag_graph2()
+
     def __display_errors_stats(self) -> None:
         """Exibe estatísticas relacionadas a erros."""
         self.graph_generator.generate_errors_graph1()
@@ -73,6 +73,8 @@ class DisplayTaskSettings:
                     "truncate_before_insert": task_settings["truncate_before_insert"],
                 },
                 "cdc_settings": {
+                    # Mantém opções avançadas de CDC definidas diretamente no settings.json
+                    **settings.get("task", {}).get("cdc_settings", {}),
                     "mode": task_settings["cdc_mode"],
                     "scd2_settings": {
                         "start_date_column_name": task_settings["start_date_column_name"],
@@ -236,3 +236,52 @@ class GraphGenerator:
         )
 
         st.plotly_chart(fig, use_container_width=True)
+
+    def generate_lag_graph1(self):
+        """Gera gráfico de lag do slot de replicação e WAL retido"""
+        try:
+            with MetadataConnectionManager() as metadata_manager:
+                df = metadata_manager.get_metadata_tables("stats_replication_lag")
+        except:
+            df = pl.DataFrame()
+
+        if df.is_empty():
+            st.info("Nenhuma medição de lag registrada")
+            return
+
+        df_pd = df.sort("created_at").to_pandas()
+        df_pd["lag_mb"] = df_pd["lag_bytes"] / 1024**2
+        df_pd["retained_wal_mb"] = df_pd["retained_wal_bytes"] / 1024**2
+
+        fig = px.line(
+            df_pd,
+            x="created_at",
+            y=["lag_mb", "retained_wal_mb"],
+            title="Lag do slot e WAL retido (MB)",
+            labels={"created_at": "", "value": "MB", "variable": ""},
+        )
+
+        st.plotly_chart(fig, use_container_width=True)
+
+    def generate_lag_graph2(self):
+        """Gera gráfico de lag estimado em segundos e duração da captura"""
+        try:
+            with MetadataConnectionManager() as metadata_manager:
+                df = metadata_manager.get_metadata_tables("stats_replication_lag")
+        except:
+            df = pl.DataFrame()
+
+        if df.is_empty():
+            return
+
+        df_pd = df.sort("created_at").to_pandas()
+
+        fig = px.line(
+            df_pd,
+            x="created_at",
+            y=["lag_seconds", "capture_duration"],
+            title="Lag estimado e duração da captura (s)",
+            labels={"created_at": "", "value": "Segundos", "variable": ""},
+        )
+
+        st.plotly_chart(fig, use_container_width=True)